@@ -60,12 +60,77 @@ class Settings(BaseSettings):
     ALPHA_VANTAGE_API_KEY: str = ""
     YAHOO_FINANCE_API_KEY: str = ""
 
+    # 외부 API HTTP 클라이언트 설정 (공유 커넥션 풀)
+    HTTP_POOL_LIMIT: int = 100  # 전체 동시 연결 수
+    HTTP_POOL_LIMIT_PER_HOST: int = 10  # 호스트별 동시 연결 수
+    HTTP_DNS_CACHE_TTL: int = 300  # DNS 캐시 유지 시간 (초, 0이면 미사용)
+    HTTP_KEEPALIVE_TIMEOUT: float = 30.0  # 유휴 연결 유지 시간 (초)
+    HTTP_TIMEOUT: float = 10.0  # 요청 전체 타임아웃 (초)
+
+    # 외부 시세 API 요청 한도 (토큰 버킷, 여러 서비스가 공유)
+    RATE_LIMIT_ALPHA_VANTAGE_PER_MINUTE: int = 5
+    RATE_LIMIT_TWELVE_DATA_PER_MINUTE: int = 8
+    RATE_LIMIT_FMP_PER_MINUTE: int = 10
+    RATE_LIMIT_KIS_PER_SECOND: int = 18  # KIS 실전계좌 초당 20건 제한보다 여유 있게
+    RATE_LIMIT_MAX_WAIT: float = 15.0  # 사용자 요청이 한도를 기다리는 최대 시간 (초)
+
+    # 다중 프로바이더 헤지 요청 (StockDataFetcher)
+    # 느린 프로바이더를 기다리는 동안 다음 프로바이더의 요청 한도도 소모하므로 기본값은 끔
+    FETCH_HEDGE_ENABLED: bool = False
+    FETCH_HEDGE_PERCENTILE: float = (
+        0.95  # 이 백분위 응답 시간이 지나면 다음 프로바이더 호출
+    )
+    FETCH_HEDGE_MIN_SAMPLES: int = 20  # 백분위를 쓰기 위한 최소 샘플 수
+    FETCH_HEDGE_DEFAULT_DELAY: float = 2.0  # 샘플이 부족할 때의 헤지 대기 시간 (초)
+    FETCH_HEDGE_MIN_DELAY: float = 0.05  # 헤지 대기 시간 하한 (초)
+
+    # 프로바이더 순위 (성공률/응답 시간/429 지수 감쇠 점수)
+    PROVIDER_SCORE_HALF_LIFE: float = 300.0  # 통계 반감기 (초)
+    PROVIDER_CIRCUIT_FAILURE_THRESHOLD: int = 5  # 연속 실패 시 프로바이더 차단
+    PROVIDER_CIRCUIT_RECOVERY_TIMEOUT: int = 60  # 차단 후 재시도까지 대기 (초)
+
+    # 종목 DB 일괄 동기화 파이프라인 (StockDatabaseService.sync_from_external_api)
+    SYNC_FETCH_CONCURRENCY: int = 8  # 동시 조회 종목 수 (호출량은 rate limiter)
+    SYNC_UPSERT_CHUNK_SIZE: int = 100  # 요청 한 번으로 upsert하는 행 수
+
+    # 시세 캐시 설정 (stale-while-revalidate)
+    QUOTE_CACHE_TTL: int = 30  # 캐시 신선도 유지 시간 (초)
+    QUOTE_STALE_TTL: int = (
+        300  # 만료 후에도 즉시 반환하고 백그라운드 갱신하는 시간 (초)
+    )
+    QUOTE_STALE_IF_ERROR_TTL: int = (
+        1800  # stale 구간이 지난 뒤에도 rate limit 초과 시 폴백으로 반환하는 시간 (초)
+    )
+    QUOTE_REFRESH_AHEAD: float = 0.8  # 인기 종목 선갱신 시점 (TTL 대비 비율)
+    QUOTE_HOT_HITS: int = 5  # 캐시 저장 이후 이 횟수 이상 조회되면 인기 종목
+    QUOTE_CACHE_MAX_ENTRIES: int = 100  # 캐시 최대 항목 수
+    QUOTE_CACHE_MAX_BYTES: int = 4 * 1024 * 1024  # 캐시 최대 추정 메모리 (바이트)
+
     # Supabase 설정
     SUPABASE_URL: str = ""
     SUPABASE_ANON_KEY: str = ""
     SUPABASE_SERVICE_KEY: str = ""
     SUPABASE_JWT_SECRET: str = ""
 
+    # 시뮬레이터 설정
+    # "python" 또는 "vectorized" (numpy 필요). 두 모드 모두 틱을 정규화기의 배치
+    # 경로로 기록하므로 품질 보고서/이상치 탐지 결과 형식은 같습니다.
+    SIMULATION_ENGINE: str = "python"
+    SIMULATION_PRICE_MODEL: str = ""  # "", "gbm", "jump_diffusion", "ou"
+    SIMULATION_SEED: Optional[int] = None  # 가격 스트림 재현용 시드
+    SIMULATION_TICK_INTERVAL: float = 2.0  # 시장 데이터 허브 틱 주기 (초)
+
+    # 데이터 품질 설정
+    ANOMALY_ALERT_RETENTION: int = 1000  # 보관할 최근 이상치 알림 최대 개수
+
+    # WebSocket 스트림 설정
+    WS_SNAPSHOT_INTERVAL: int = 30  # 델타 스트림 전체 스냅샷 주기 (틱)
+    WS_SEND_QUEUE_SIZE: int = 100  # 연결별 송신 대기열 최대 프레임 수
+    WS_OVERFLOW_POLICY: str = "drop_oldest"  # "drop_oldest", "conflate", "disconnect"
+    WS_BACKPLANE: str = "inprocess"  # "inprocess" 또는 "unix" (멀티 워커)
+    WS_BACKPLANE_PATH: str = "/tmp/ontotrade-ws.sock"  # unix 백플레인 소켓 경로
+    WS_BACKPLANE_HEARTBEAT: float = 5.0  # 워커 통계/구독 발행 주기 (초)
+
     # 로깅 설정
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -16,6 +16,7 @@ from typing import Any, Callable, Dict, List, Optional, Union
 import aiohttp
 import psutil
 
+from app.core.http_client import http_clients
 from app.core.logging_system import (
     ErrorCategory,
     ErrorSeverity,
@@ -127,6 +128,10 @@ class CircuitBreaker:
             self._on_failure()
             raise e
 
+    def is_open(self) -> bool:
+        """호출하지 않고 차단 여부만 확인 (개방 상태이고 복구 대기 중이면 True)"""
+        return self.state == "open" and not self._should_attempt_reset()
+
     def _should_attempt_reset(self) -> bool:
         """리셋 시도 여부 확인"""
         return (
@@ -346,28 +351,30 @@ class ErrorRecoverySystem:
         """주식 API 헬스체크"""
         try:
             # Alpha Vantage API 상태 확인
-            async with aiohttp.ClientSession() as session:
-                url = "https://www.alphavantage.co/query"
-                params = {
-                    "function": "GLOBAL_QUOTE",
-                    "symbol": "AAPL",
-                    "apikey": "demo",
-                }
-
-                async with session.get(url, params=params, timeout=10) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if "Error Message" not in data:
-                            return HealthCheck(
-                                service_name="stock_api",
-                                status=ServiceStatus.HEALTHY,
-                                response_time_ms=0,
-                                timestamp=datetime.now(),
-                                details={
-                                    "api_status": "operational",
-                                    "rate_limit": "normal",
-                                },
-                            )
+            session = http_clients.session()
+            url = "https://www.alphavantage.co/query"
+            params = {
+                "function": "GLOBAL_QUOTE",
+                "symbol": "AAPL",
+                "apikey": "demo",
+            }
+
+            async with session.get(
+                http_clients.url(url), params=params, timeout=10
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    if "Error Message" not in data:
+                        return HealthCheck(
+                            service_name="stock_api",
+                            status=ServiceStatus.HEALTHY,
+                            response_time_ms=0,
+                            timestamp=datetime.now(),
+                            details={
+                                "api_status": "operational",
+                                "rate_limit": "normal",
+                            },
+                        )
 
             return HealthCheck(
                 service_name="stock_api",
@@ -722,13 +729,19 @@ async def check_system_health() -> Dict[str, Any]:
     return recovery_system.get_system_status()
 
 
+def get_circuit_breaker(service_name: str, **kwargs) -> CircuitBreaker:
+    """이름으로 서킷 브레이커를 조회합니다 (없으면 kwargs 설정으로 생성)."""
+    if service_name not in recovery_system.circuit_breakers:
+        recovery_system.circuit_breakers[service_name] = CircuitBreaker(
+            service_name, **kwargs
+        )
+    return recovery_system.circuit_breakers[service_name]
+
+
 @asynccontextmanager
 async def circuit_breaker(service_name: str):
     """서킷 브레이커 컨텍스트 매니저"""
-    if service_name not in recovery_system.circuit_breakers:
-        recovery_system.circuit_breakers[service_name] = CircuitBreaker(service_name)
-
-    breaker = recovery_system.circuit_breakers[service_name]
+    breaker = get_circuit_breaker(service_name)
 
     async def protected_call(func, *args, **kwargs):
         return await breaker.call(func, *args, **kwargs)
@@ -0,0 +1,147 @@
+"""
+공유 HTTP 클라이언트 레지스트리
+
+외부 API 호출마다 ClientSession을 새로 만들면 요청마다 TCP/TLS 핸드셰이크가
+반복됩니다. 프로세스 전체가 하나의 커넥션 풀을 공유하도록 세션을 보관합니다.
+- 호스트별 커넥션 풀 (limit_per_host) 과 전체 한도 (limit)
+- DNS 캐시, keep-alive 유지 시간
+- 앱 시작/종료 시 start()/close() 로 수명 관리
+- override() 로 외부 API 주소를 로컬 스텁 서버로 바꿀 수 있음 (테스트용)
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Set
+
+import aiohttp
+from yarl import URL
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class HttpClientRegistry:
+    """프로세스 전역 aiohttp 세션/커넥션 풀 관리자"""
+
+    def __init__(
+        self,
+        limit: Optional[int] = None,
+        limit_per_host: Optional[int] = None,
+        dns_cache_ttl: Optional[int] = None,
+        keepalive_timeout: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.limit = settings.HTTP_POOL_LIMIT if limit is None else limit
+        self.limit_per_host = (
+            settings.HTTP_POOL_LIMIT_PER_HOST
+            if limit_per_host is None
+            else limit_per_host
+        )
+        self.dns_cache_ttl = (
+            settings.HTTP_DNS_CACHE_TTL if dns_cache_ttl is None else dns_cache_ttl
+        )
+        self.keepalive_timeout = (
+            settings.HTTP_KEEPALIVE_TIMEOUT
+            if keepalive_timeout is None
+            else keepalive_timeout
+        )
+        self.timeout = settings.HTTP_TIMEOUT if timeout is None else timeout
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing: Set[asyncio.Task] = set()  # 이전 루프 세션 정리 작업
+        self._overrides: Dict[str, URL] = {}
+        self.sessions_created = 0
+
+    def session(self) -> aiohttp.ClientSession:
+        """공유 세션을 반환합니다 (없거나 닫혔으면 현재 이벤트 루프에서 생성)."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            if self._session is not None and not self._session.closed:
+                # 다른 이벤트 루프의 세션은 이 루프에서 재사용할 수 없으므로 닫고 새로 만듦
+                self._retire(self._session, self._loop)
+            self._session = self._create_session()
+            self._loop = loop
+        return self._session
+
+    def _retire(
+        self, session: aiohttp.ClientSession, loop: Optional[asyncio.AbstractEventLoop]
+    ) -> None:
+        """이전 이벤트 루프의 세션을 닫습니다 (커넥터 소켓이 남지 않도록)."""
+        logger.warning("이벤트 루프가 바뀌어 이전 HTTP 세션을 닫고 새로 만듭니다")
+        if loop is not None and loop.is_running():
+            # 다른 스레드에서 실행 중인 루프의 연결은 그 루프에서 닫음
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        # 멈췄거나 닫힌 루프: 커넥터 정리는 루프와 무관하므로 현재 루프에서 닫음
+        task = asyncio.ensure_future(session.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=self.dns_cache_ttl > 0,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        self.sessions_created += 1
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+
+    async def start(self) -> None:
+        """앱 시작 시 세션을 미리 만듭니다."""
+        self.session()
+        logger.info(
+            "HTTP 클라이언트 풀 시작 "
+            f"(limit={self.limit}, per_host={self.limit_per_host}, "
+            f"dns_ttl={self.dns_cache_ttl}s, keepalive={self.keepalive_timeout}s)"
+        )
+
+    async def close(self) -> None:
+        """세션과 커넥션 풀을 닫습니다 (앱 종료 시)."""
+        session, self._session, self._loop = self._session, None, None
+        if session is not None and not session.closed:
+            await session.close()
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+    def override(self, origin: str, target: str) -> None:
+        """origin(스킴://호스트[:포트])으로 가는 요청을 target으로 보냅니다."""
+        self._overrides[str(URL(origin).origin())] = URL(target)
+
+    def clear_overrides(self) -> None:
+        self._overrides.clear()
+
+    def url(self, url: str) -> str:
+        """override가 등록된 origin이면 주소를 바꿔서 반환합니다."""
+        if not self._overrides:
+            return url
+        parsed = URL(url)
+        target = self._overrides.get(str(parsed.origin()))
+        if target is None:
+            return url
+        path = target.path.rstrip("/") + parsed.path
+        return str(target.with_path(path).with_query(parsed.query))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """커넥션 풀 상태"""
+        connector = self._session.connector if self._session else None
+        return {
+            "active": self._session is not None and not self._session.closed,
+            "sessions_created": self.sessions_created,
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "dns_cache_ttl": self.dns_cache_ttl,
+            "keepalive_timeout": self.keepalive_timeout,
+            "overrides": {k: str(v) for k, v in self._overrides.items()},
+            "closed": connector.closed if connector else True,
+        }
+
+
+# 글로벌 인스턴스
+http_clients = HttpClientRegistry()
@@ -545,10 +545,12 @@ def log_critical(
 
 def log_api_call(endpoint: str, method: str, **kwargs) -> None:
     """API 호출 로그"""
+    context = {"endpoint": endpoint, "method": method}
+    context.update(kwargs.pop("context", None) or {})
     logging_system.log(
         LogLevel.INFO,
         f"API 호출: {method} {endpoint}",
-        context={"endpoint": endpoint, "method": method},
+        context=context,
         logger_name="api",
         **kwargs,
     )
@@ -0,0 +1,292 @@
+"""
+외부 시세 API 공용 토큰 버킷 Rate Limiter
+
+프로바이더(Alpha Vantage, Twelve Data, FMP, KIS 등)별 예산과 필요한 경우
+엔드포인트별 예산을 토큰 버킷으로 관리합니다. 여러 서비스가 같은 프로바이더를
+호출해도 하나의 버킷을 공유하므로 전체 호출량이 예산을 넘지 않습니다.
+- 토큰이 없으면 예외 대신 토큰이 생길 때까지 대기 (대기 시간은 통계로 보고)
+- 같은 우선순위 안에서는 먼저 기다린 호출이 먼저 통과 (FIFO)
+- 우선순위 레인: 사용자 요청(INTERACTIVE)이 일괄 작업(BULK)보다 먼저 통과
+- 우선순위는 request_priority() 컨텍스트로 지정하면 하위 호출/태스크에 전달됨
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """대기열 우선순위 (값이 작을수록 먼저 통과)"""
+
+    INTERACTIVE = 0  # 사용자 요청 (get_quote 등)
+    BULK = 1  # 일괄 동기화, 백그라운드 갱신
+
+
+class RateLimitTimeout(Exception):
+    """최대 대기 시간 안에 토큰을 얻지 못함"""
+
+    pass
+
+
+_current_priority: ContextVar[Priority] = ContextVar(
+    "rate_limit_priority", default=Priority.INTERACTIVE
+)
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """블록 안의 호출(및 여기서 만든 태스크)의 rate limit 우선순위를 지정합니다."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority() -> Priority:
+    return _current_priority.get()
+
+
+class TokenBucket:
+    """우선순위 레인별 FIFO 대기열을 가진 비동기 토큰 버킷"""
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        per: float = 60.0,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0 or per <= 0:
+            raise ValueError("rate와 per는 0보다 커야 합니다")
+        self.name = name
+        self.rate = rate / per  # 초당 충전되는 토큰 수
+        self.capacity = float(burst if burst is not None else max(1, int(rate)))
+        self.clock = clock
+
+        self.tokens = self.capacity
+        self._updated = clock()
+        self._lanes: Dict[Priority, Deque[asyncio.Future]] = {
+            priority: deque() for priority in Priority
+        }
+        self._pump_task: Optional[asyncio.Task] = None
+
+        self.acquired = 0
+        self.waited = 0  # 대기가 필요했던 요청 수
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def available(self) -> float:
+        """지금 사용할 수 있는 토큰 수"""
+        self._refill()
+        return self.tokens
+
+    def queued(self) -> int:
+        return sum(1 for lane in self._lanes.values() for fut in lane if not fut.done())
+
+    async def acquire(
+        self, priority: Optional[Priority] = None, max_wait: Optional[float] = None
+    ) -> float:
+        """토큰 하나를 얻을 때까지 기다리고 대기한 시간(초)을 반환합니다."""
+        if priority is None:
+            priority = current_priority()
+
+        self._refill()
+        if self.tokens >= 1 and not self.queued():
+            self.tokens -= 1
+            self.acquired += 1
+            return 0.0
+
+        start = self.clock()
+        waiter = asyncio.get_running_loop().create_future()
+        self._lanes[priority].append(waiter)
+        if self._pump_task is None or self._pump_task.done():
+            self._pump_task = asyncio.ensure_future(self._pump())
+
+        try:
+            await asyncio.wait_for(waiter, max_wait)
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # 타임아웃 직전에 넘겨받은 토큰은 다음 대기자에게 돌려줌
+                self._return_token()
+            self.timeouts += 1
+            raise RateLimitTimeout(
+                f"{self.name}: {max_wait:.1f}초 안에 요청 한도를 얻지 못했습니다"
+            )
+
+        waited = self.clock() - start
+        self.acquired += 1
+        self.waited += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        return waited
+
+    def release(self) -> None:
+        """acquire로 얻은 토큰을 반납합니다."""
+        self.acquired -= 1
+        self._return_token()
+
+    def _return_token(self) -> None:
+        """토큰을 버킷에 되돌립니다 (대기자가 있으면 바로 넘겨줌)."""
+        lane = self._next_waiter()
+        if lane is not None:
+            lane.popleft().set_result(None)
+            return
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+    def _next_waiter(self) -> Optional[Deque[asyncio.Future]]:
+        """가장 높은 우선순위 레인 중 대기자가 남은 레인"""
+        for priority in Priority:
+            lane = self._lanes[priority]
+            # 취소/타임아웃된 대기자는 건너뜀
+            while lane and lane[0].done():
+                lane.popleft()
+            if lane:
+                return lane
+        return None
+
+    async def _pump(self) -> None:
+        """토큰이 충전되는 대로 대기자에게 순서대로 넘겨줍니다."""
+        while True:
+            lane = self._next_waiter()
+            if lane is None:
+                return
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                lane.popleft().set_result(None)
+            else:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def reset(self) -> None:
+        """토큰을 가득 채우고 대기열과 통계를 초기화합니다."""
+        for lane in self._lanes.values():
+            for waiter in lane:
+                waiter.cancel()
+            lane.clear()
+        if self._pump_task is not None:
+            self._pump_task.cancel()
+            self._pump_task = None
+        self.tokens = self.capacity
+        self._updated = self.clock()
+        self.acquired = self.waited = self.timeouts = 0
+        self.total_wait = self.max_wait = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "rate_per_minute": round(self.rate * 60, 2),
+            "burst": self.capacity,
+            "available": round(self.available(), 2),
+            "queued": self.queued(),
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "timeouts": self.timeouts,
+            "total_wait_seconds": round(self.total_wait, 3),
+            "max_wait_seconds": round(self.max_wait, 3),
+            "avg_wait_seconds": (
+                round(self.total_wait / self.waited, 3) if self.waited else 0.0
+            ),
+        }
+
+
+class RateLimiterRegistry:
+    """프로바이더/엔드포인트별 토큰 버킷 모음"""
+
+    def __init__(self):
+        self._buckets: Dict[Tuple[str, Optional[str]], TokenBucket] = {}
+
+    def configure(
+        self,
+        provider: str,
+        rate: float,
+        per: float = 60.0,
+        burst: Optional[int] = None,
+        endpoint: Optional[str] = None,
+    ) -> TokenBucket:
+        """프로바이더(endpoint가 있으면 해당 엔드포인트) 예산을 설정합니다."""
+        name = provider if endpoint is None else f"{provider}:{endpoint}"
+        bucket = TokenBucket(name, rate, per, burst)
+        self._buckets[(provider, endpoint)] = bucket
+        return bucket
+
+    def get(
+        self, provider: str, endpoint: Optional[str] = None
+    ) -> Optional[TokenBucket]:
+        return self._buckets.get((provider, endpoint))
+
+    async def acquire(
+        self,
+        provider: str,
+        endpoint: Optional[str] = None,
+        priority: Optional[Priority] = None,
+        max_wait: Optional[float] = None,
+    ) -> float:
+        """엔드포인트 예산과 프로바이더 예산을 차례로 얻고 총 대기 시간을 반환합니다.
+
+        설정되지 않은 프로바이더/엔드포인트는 제한하지 않습니다.
+        """
+        keys = [(provider, None)]
+        if endpoint is not None:
+            keys.insert(0, (provider, endpoint))
+
+        waited = 0.0
+        held = []
+        for key in keys:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                continue
+            remaining = None if max_wait is None else max(0.0, max_wait - waited)
+            try:
+                waited += await bucket.acquire(priority, remaining)
+            except BaseException:
+                # 프로바이더 예산을 못 얻으면 먼저 얻은 엔드포인트 토큰은 반납
+                for acquired in held:
+                    acquired.release()
+                raise
+            held.append(bucket)
+
+        if waited > 0:
+            logger.debug(f"rate limit 대기: {provider} {endpoint or ''} {waited:.2f}초")
+        return waited
+
+    def reset(self) -> None:
+        for bucket in self._buckets.values():
+            bucket.reset()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {bucket.name: bucket.get_stats() for bucket in self._buckets.values()}
+
+
+def create_default_registry() -> RateLimiterRegistry:
+    """설정값으로 프로바이더별 예산을 구성합니다."""
+    registry = RateLimiterRegistry()
+    registry.configure("alpha_vantage", settings.RATE_LIMIT_ALPHA_VANTAGE_PER_MINUTE)
+    registry.configure("twelve_data", settings.RATE_LIMIT_TWELVE_DATA_PER_MINUTE)
+    registry.configure("fmp", settings.RATE_LIMIT_FMP_PER_MINUTE)
+    registry.configure("kis", settings.RATE_LIMIT_KIS_PER_SECOND, per=1.0)
+    # KIS 접근 토큰 발급은 1분에 1회로 별도 제한
+    registry.configure("kis", 1, per=60.0, endpoint="/oauth2/tokenP")
+    return registry
+
+
+# 글로벌 인스턴스
+rate_limiters = create_default_registry()
@@ -1,15 +1,20 @@
 """간단한 WebSocket 서버 구현 (FastAPI 내장 WebSocket 사용)."""
 
 import asyncio
+import functools
 import json
 import logging
+import time
 import uuid
 from datetime import datetime
-from typing import Dict, Set
+from typing import Any, Dict, Optional, Set, Tuple
+from urllib.parse import parse_qs
 
 import socketio
 from socketio import AsyncServer
 
+from app.core import ws_codec, ws_fanout
+from app.core.config import settings
 from app.core.error_recovery import circuit_breaker, recovery_system
 from app.core.logging_system import (
     ErrorCategory,
@@ -17,13 +22,23 @@ from app.core.logging_system import (
     log_critical,
     log_error,
     log_info,
+    log_warning,
     log_websocket_event,
     logging_system,
 )
 from app.core.monitoring import add_breadcrumb, capture_message
+from app.core.ws_backplane import Backplane, create_backplane
+from app.core.ws_delta import DeltaStream
+from app.core.ws_fanout import (
+    BroadcastManager,
+    SessionBatch,
+    StreamOptions,
+    symbol_room,
+)
 from app.services.data_normalizer import data_normalizer
 from app.services.data_validator import DataSource
-from app.services.stock_simulator import StockDataSimulator
+from app.services.market_data_hub import MarketTick, market_data_hub
+from app.services.tick_clock import TickTime
 
 # 기존 logging 설정 제거하고 새로운 시스템 사용
 # logger = logging.getLogger(__name__)
@@ -32,7 +47,13 @@ from app.services.stock_simulator import StockDataSimulator
 class WebsocketManager:
     def __init__(self):
         # Socket.IO 서버 생성 (ASGI 호환 설정)
+        # 방 단위 전송 시 패킷을 한 번만 인코딩하고 연결별 송신 대기열로 보내는 매니저
+        self.fanout = BroadcastManager(
+            queue_size=settings.WS_SEND_QUEUE_SIZE,
+            overflow_policy=settings.WS_OVERFLOW_POLICY,
+        )
         self.sio = AsyncServer(
+            client_manager=self.fanout,
             cors_allowed_origins="*",
             logger=False,  # 기본 로거 비활성화
             engineio_logger=False,
@@ -42,15 +63,38 @@ class WebsocketManager:
         # 구독 관리
         self.subscriptions: Dict[str, Set[str]] = {}  # symbol -> set of session_ids
         self.session_symbols: Dict[str, Set[str]] = {}  # session_id -> set of symbols
-
-        # 주식 시뮬레이터
-        self.stock_simulator = StockDataSimulator()
+        # 세션별 스트림 옵션과 배치 모드 세션의 대기 중인 프레임
+        self.session_options: Dict[str, StreamOptions] = {}
+        self.session_batches: Dict[str, SessionBatch] = {}
+        # 종목별 델타 스트림 (델타 모드 구독자가 공유)
+        self.delta_streams: Dict[str, DeltaStream] = {}
+
+        # 공유 시장 데이터 허브 (시뮬레이터는 프로세스당 하나)
+        self.hub = market_data_hub
+        self.stock_simulator = market_data_hub.simulator
+
+        # 워커 간 백플레인: 리더 워커만 틱을 계산해 모든 워커에 발행
+        self.backplane: Backplane = create_backplane(
+            settings.WS_BACKPLANE, settings.WS_BACKPLANE_PATH
+        )
+        self.backplane.subscribe("tick", self._on_backplane_tick)
+        self.backplane.subscribe("interest", self._on_worker_interest)
+        self.backplane.subscribe("stats", self._on_worker_stats)
+        self.backplane.on_role_change(self._on_role_change)
+
+        # 다른 워커의 구독 종목과 통계 (worker_id -> ...)
+        self.remote_interest: Dict[str, Set[str]] = {}
+        self.worker_stats: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # 마지막 틱의 정규화된 시세 (구독 시 초기 데이터로 사용)
+        self.latest_quotes: Dict[str, Dict] = {}
+        self.tick_sequence = 0
+        self.heartbeat_task: Optional[asyncio.Task] = None
 
         # 이벤트 핸들러 등록
         self._register_events()
 
-        # 자동 업데이트 태스크
-        self.update_task = None
+        # 허브 틱 수신 여부
+        self.updates_attached = False
 
         log_info("WebSocket 관리자 초기화 완료")
 
@@ -78,9 +122,18 @@ class WebsocketManager:
                     data=client_info,
                 )
 
+                # 연결 시 ?encoding=msgpack 으로 인코딩 협상 가능
+                query = parse_qs(environ.get("QUERY_STRING", ""))
+                encoding = ws_codec.negotiate_encoding(
+                    query.get("encoding", [ws_codec.JSON])[0]
+                )
+
                 self.session_symbols[sid] = set()
+                self.session_options[sid] = StreamOptions(encoding=encoding)
                 await self.sio.emit(
-                    "connected", {"status": "success", "session_id": sid}, room=sid
+                    "connected",
+                    {"status": "success", "session_id": sid, "encoding": encoding},
+                    room=sid,
                 )
 
             except Exception as e:
@@ -98,6 +151,8 @@ class WebsocketManager:
                     for symbol in symbols_to_remove:
                         await self._unsubscribe_symbol(sid, symbol)
                     del self.session_symbols[sid]
+                self.session_batches.pop(sid, None)
+                self.session_options.pop(sid, None)
 
                 log_websocket_event("client_disconnected")
 
@@ -184,6 +239,52 @@ class WebsocketManager:
                     severity=ErrorSeverity.LOW,
                 )
 
+        @self.sio.event
+        async def set_stream_options(sid, data):
+            """스트림 옵션 설정
+
+            - batch: 구독 종목을 주기마다 하나의 stock_batch 프레임으로 수신
+            - delta: 스냅샷 이후 변경된 필드만 stock_delta로 수신
+            - encoding: "json"(기본) 또는 "msgpack" (바이너리, 숫자 타임스탬프)
+            """
+            try:
+                options = await self._update_stream_options(sid, data or {})
+                await self.sio.emit("stream_options", options.to_dict(), room=sid)
+
+                log_websocket_event("stream_options_updated")
+
+            except Exception as e:
+                log_error(
+                    f"스트림 옵션 설정 중 오류: {e}",
+                    category=ErrorCategory.WEBSOCKET_ERROR,
+                    severity=ErrorSeverity.LOW,
+                )
+
+        @self.sio.event
+        async def request_snapshot(sid, data):
+            """델타 스트림 재동기화 (시퀀스 누락 감지 시 클라이언트가 요청)"""
+            try:
+                symbol = data.get("symbol", "").upper().strip()
+                if symbol not in self.session_symbols.get(sid, set()):
+                    await self.sio.emit(
+                        "error",
+                        {
+                            "message": "구독 중인 종목이 아닙니다",
+                            "code": "NOT_SUBSCRIBED",
+                        },
+                        room=sid,
+                    )
+                    return
+
+                await self._send_snapshot(sid, symbol)
+
+            except Exception as e:
+                log_error(
+                    f"스냅샷 요청 처리 중 오류: {e}",
+                    category=ErrorCategory.WEBSOCKET_ERROR,
+                    severity=ErrorSeverity.LOW,
+                )
+
         @self.sio.event
         async def get_data_quality(sid, data):
             """데이터 품질 정보 조회"""
@@ -203,34 +304,39 @@ class WebsocketManager:
     async def _subscribe_symbol(self, sid: str, symbol: str):
         """종목 구독 처리"""
         # 구독 정보 업데이트
-        if symbol not in self.subscriptions:
+        new_symbol = symbol not in self.subscriptions
+        if new_symbol:
             self.subscriptions[symbol] = set()
         self.subscriptions[symbol].add(sid)
         self.session_symbols[sid].add(symbol)
+        options = self.session_options.setdefault(sid, StreamOptions())
+        if not options.batch:
+            self.sio.enter_room(sid, symbol_room(symbol, options.variant))
 
         # 초기 데이터 전송
         try:
             async with logging_system.performance_monitor("stock_data_fetch"):
-                stock_data = self.stock_simulator.get_real_time_data(symbol)
-
-                # 데이터 정규화 및 검증
-                validation_result = data_normalizer.normalize_and_validate(
-                    symbol, stock_data, DataSource.MOCK
-                )
-                normalized_data = (
-                    validation_result.normalized_data
-                    if validation_result.is_valid
-                    else stock_data
-                )
+                normalized_data = self._current_quote(symbol)
+                if normalized_data is None:
+                    # 팔로워에서 리더의 시세가 아직 없으면 다음 틱에 전송
+                    return
 
-                await self.sio.emit(
-                    "stock_data",
-                    {
+                if options.delta:
+                    # 델타 모드: 공유 스트림의 현재 상태를 스냅샷으로 전송
+                    stream = self._delta_stream(symbol)
+                    stream.ensure_state(normalized_data)
+                    message = stream.snapshot()
+                else:
+                    message = {
                         "symbol": symbol,
                         "data": normalized_data,
                         "timestamp": datetime.now().isoformat(),
                         "quality_score": normalized_data.get("quality_score", 0),
-                    },
+                    }
+
+                await self.sio.emit(
+                    "stock_delta" if options.delta else "stock_data",
+                    ws_codec.encode_message(message, options.encoding),
                     room=sid,
                 )
 
@@ -246,6 +352,10 @@ class WebsocketManager:
             "subscribed", {"symbol": symbol, "status": "success"}, room=sid
         )
 
+        if new_symbol:
+            # 리더 워커가 다음 틱부터 이 종목을 포함하도록 알림
+            await self._publish_interest()
+
     async def _unsubscribe_symbol(self, sid: str, symbol: str):
         """종목 구독 해제 처리"""
         # 구독 정보 제거
@@ -253,97 +363,381 @@ class WebsocketManager:
             self.subscriptions[symbol].remove(sid)
             if not self.subscriptions[symbol]:
                 del self.subscriptions[symbol]
+                self.delta_streams.pop(symbol, None)
+                await self._publish_interest()
 
         if sid in self.session_symbols and symbol in self.session_symbols[sid]:
             self.session_symbols[sid].remove(symbol)
+        options = self.session_options.get(sid, StreamOptions())
+        self.sio.leave_room(sid, symbol_room(symbol, options.variant))
+        if sid in self.session_batches:
+            self.session_batches[sid].pending.pop(symbol, None)
 
         await self.sio.emit(
             "unsubscribed", {"symbol": symbol, "status": "success"}, room=sid
         )
 
+    async def _update_stream_options(self, sid: str, data: dict) -> StreamOptions:
+        """세션의 스트림 옵션을 바꾸고 종목 방/배치를 다시 구성합니다."""
+        options = self.session_options.setdefault(sid, StreamOptions())
+        symbols = self.session_symbols.get(sid, set())
+        was_delta = options.delta
+        was_encoding = options.encoding
+
+        # 이전 형식의 종목 방에서 나간 뒤 새 옵션으로 다시 배치
+        for symbol in symbols:
+            self.sio.leave_room(sid, symbol_room(symbol, options.variant))
+
+        if "batch" in data:
+            options.batch = bool(data["batch"])
+        if "delta" in data:
+            options.delta = bool(data["delta"])
+        if "encoding" in data:
+            options.encoding = ws_codec.negotiate_encoding(data["encoding"])
+
+        if options.batch:
+            batch = self.session_batches.get(sid)
+            if batch is None:
+                eio_sid = self.sio.manager.eio_sid_from_sid(sid, "/")
+                self.session_batches[sid] = SessionBatch(
+                    sid, eio_sid, encoding=options.encoding
+                )
+            elif was_delta != options.delta or was_encoding != options.encoding:
+                batch.pending.clear()
+                batch.encoding = options.encoding
+        else:
+            self.session_batches.pop(sid, None)
+            for symbol in symbols:
+                self.sio.enter_room(sid, symbol_room(symbol, options.variant))
+
+        # 델타 모드로 전환하면(또는 인코딩이 바뀌면) 기준이 될 스냅샷부터 전송
+        if options.delta and (not was_delta or was_encoding != options.encoding):
+            for symbol in symbols:
+                await self._send_snapshot(sid, symbol)
+
+        return options
+
+    def _delta_stream(self, symbol: str) -> DeltaStream:
+        """종목의 공유 델타 스트림 (없으면 생성)"""
+        stream = self.delta_streams.get(symbol)
+        if stream is None:
+            stream = DeltaStream(symbol, settings.WS_SNAPSHOT_INTERVAL)
+            self.delta_streams[symbol] = stream
+        return stream
+
+    @staticmethod
+    def _encode_snapshot(stream: DeltaStream, encoding: str) -> Any:
+        """델타 스트림의 현재 상태를 스냅샷 메시지로 인코딩합니다."""
+        return ws_codec.encode_message(stream.snapshot(), encoding)
+
+    async def _send_snapshot(self, sid: str, symbol: str):
+        """세션에 종목의 델타 스트림 스냅샷을 전송합니다."""
+        stream = self._delta_stream(symbol)
+        if stream.state is None:
+            quote = self._current_quote(symbol)
+            if quote is None:
+                # 팔로워에서 리더의 시세가 아직 없으면 첫 틱이 스냅샷이 됨
+                return
+            stream.ensure_state(quote)
+
+        encoding = self.session_options.get(sid, StreamOptions()).encoding
+        await self.sio.emit(
+            "stock_delta",
+            ws_codec.encode_message(stream.snapshot(), encoding),
+            room=sid,
+        )
+
     async def start_auto_updates(self):
-        """자동 업데이트 시작"""
-        if self.update_task is None or self.update_task.done():
-            self.update_task = asyncio.create_task(self._auto_update_loop())
+        """자동 업데이트 시작 (공유 시장 데이터 허브의 틱을 수신)"""
+        if not self.updates_attached:
+            self.hub.attach("socketio", self._on_market_tick)
+            self.updates_attached = True
             log_info("WebSocket 자동 업데이트 시작")
 
-    async def _auto_update_loop(self):
-        """자동 업데이트 루프"""
-        while True:
-            try:
-                # 구독된 모든 종목에 대해 업데이트
-                for symbol in list(self.subscriptions.keys()):
-                    if symbol in self.subscriptions and self.subscriptions[symbol]:
-                        try:
-                            async with logging_system.performance_monitor(
-                                f"auto_update_{symbol}"
-                            ):
-                                await self._send_stock_update(symbol)
-                        except Exception as e:
-                            log_error(
-                                f"종목 업데이트 실패: {symbol}",
-                                category=ErrorCategory.WEBSOCKET_ERROR,
-                                severity=ErrorSeverity.MEDIUM,
-                            )
-
-                await asyncio.sleep(3)  # 3초마다 업데이트
+        await self.backplane.start()
+        # 팔로워 워커의 허브는 틱을 계산하지 않음 (다른 API가 start()를 호출해도 무시)
+        self.hub.set_leader(self.backplane.is_leader)
+        await self.hub.start()
 
-            except Exception as e:
-                log_error(
-                    f"자동 업데이트 루프 오류: {e}",
-                    category=ErrorCategory.WEBSOCKET_ERROR,
-                    severity=ErrorSeverity.HIGH,
-                )
-                await asyncio.sleep(5)  # 오류 시 5초 대기
+        if self.heartbeat_task is None or self.heartbeat_task.done():
+            self.heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
+    async def _on_role_change(self, is_leader: bool):
+        """리더가 된 워커만 틱 루프를 실행합니다."""
+        log_info(f"WebSocket 백플레인 역할: {'리더' if is_leader else '팔로워'}")
+        self.hub.set_leader(is_leader)
+        if is_leader and self.updates_attached:
+            await self.hub.start()
+        elif not is_leader:
+            await self.hub.stop()
+
+    async def _on_market_tick(self, tick: MarketTick):
+        """허브 틱 수신 시 (리더 워커) 모든 워커의 구독 종목 시세를 발행"""
+        if not self.backplane.is_leader:
+            return
 
-    async def _send_stock_update(self, symbol: str):
-        """종목 업데이트 전송"""
         try:
-            # 주식 데이터 가져오기 (안전하게 처리)
-            stock_data = self.stock_simulator.get_real_time_data(symbol)
+            # 이 워커와 다른 워커에서 구독 중인 종목의 시세를 한 번씩만 정규화
+            symbols = {
+                symbol for symbol, sessions in self.subscriptions.items() if sessions
+            }
+            for remote_symbols in self.remote_interest.values():
+                symbols |= remote_symbols
+
+            # 틱 기준 시각 하나를 모든 종목의 정규화에 공유
+            tick_time = TickTime.from_datetime(tick.timestamp)
+            quotes = {}
+            for symbol in symbols:
+                try:
+                    quotes[symbol] = self._normalize_quote(symbol, tick_time)
+                except Exception as e:
+                    log_error(
+                        f"종목 업데이트 생성 실패: {symbol}",
+                        category=ErrorCategory.WEBSOCKET_ERROR,
+                        severity=ErrorSeverity.MEDIUM,
+                    )
 
-            # 데이터 정규화 및 검증
-            validation_result = data_normalizer.normalize_and_validate(
-                symbol, stock_data, DataSource.MOCK
+            await self.backplane.publish(
+                "tick",
+                {
+                    "sequence": tick.sequence,
+                    "timestamp": tick_time.iso,
+                    "quotes": quotes,
+                },
             )
-            normalized_data = (
-                validation_result.normalized_data
-                if validation_result.is_valid
-                else stock_data
+
+        except Exception as e:
+            log_error(
+                f"자동 업데이트 처리 오류: {e}",
+                category=ErrorCategory.WEBSOCKET_ERROR,
+                severity=ErrorSeverity.HIGH,
             )
 
-            # 이상치 탐지 결과 확인
-            anomalies = normalized_data.get("anomalies", [])
-            if anomalies:
-                log_warning(
-                    f"이상치 탐지: {symbol}",
-                    category=ErrorCategory.DATA_VALIDATION_ERROR,
-                    severity=ErrorSeverity.MEDIUM,
+    async def _on_backplane_tick(self, message: Dict[str, Any]):
+        """백플레인 틱 수신 시 이 워커의 구독자에게 업데이트 전송"""
+        try:
+            quotes = message["quotes"]
+            self.latest_quotes.update(quotes)
+            self.tick_sequence = message["sequence"]
+            if not self.backplane.is_leader:
+                # 팔로워: 리더의 시세를 허브 가격으로 사용 (REST/거래 API도 같은 가격)
+                self.hub.apply_remote_tick(
+                    message["sequence"],
+                    datetime.fromisoformat(message["timestamp"]),
+                    quotes,
+                )
+
+            # 구독된 모든 종목의 업데이트를 동시에 전송 (느린 종목이 다른 종목을 막지 않음)
+            symbols = [
+                symbol
+                for symbol, sessions in list(self.subscriptions.items())
+                if sessions and symbol in quotes
+            ]
+            await asyncio.gather(
+                *(
+                    self._send_monitored_update(symbol, quotes[symbol])
+                    for symbol in symbols
                 )
+            )
+
+            # 배치 모드 세션: 이번 틱의 종목 업데이트를 하나의 프레임으로 전송
+            header = {
+                "sequence": message["sequence"],
+                "timestamp": message["timestamp"],
+            }
+            for batch in list(self.session_batches.values()):
+                self.fanout.schedule_batch(batch, "stock_batch", header)
+
+        except Exception as e:
+            log_error(
+                f"자동 업데이트 처리 오류: {e}",
+                category=ErrorCategory.WEBSOCKET_ERROR,
+                severity=ErrorSeverity.HIGH,
+            )
+
+    async def _publish_interest(self):
+        """이 워커의 구독 종목 목록을 발행합니다."""
+        await self.backplane.publish(
+            "interest",
+            {"worker": self.backplane.worker_id, "symbols": list(self.subscriptions)},
+        )
+
+    async def _on_worker_interest(self, message: Dict[str, Any]):
+        """다른 워커의 구독 종목 목록 갱신"""
+        worker = message["worker"]
+        if worker == self.backplane.worker_id:
+            return
+
+        if message["symbols"]:
+            self.remote_interest[worker] = set(message["symbols"])
+        else:
+            self.remote_interest.pop(worker, None)
+
+    async def _on_worker_stats(self, message: Dict[str, Any]):
+        """다른 워커의 통계 갱신 (하트비트)"""
+        worker = message["worker"]
+        if worker == self.backplane.worker_id:
+            return
+
+        self.worker_stats[worker] = (time.monotonic(), message["stats"])
+        await self._on_worker_interest(
+            {"worker": worker, "symbols": message["stats"].get("symbols", [])}
+        )
+
+    async def _heartbeat_loop(self):
+        """주기적으로 통계와 구독 종목을 발행하고 응답 없는 워커를 정리합니다."""
+        interval = settings.WS_BACKPLANE_HEARTBEAT
+        while True:
+            try:
+                await self.backplane.publish(
+                    "stats",
+                    {"worker": self.backplane.worker_id, "stats": self._local_stats()},
+                )
+
+                expired = time.monotonic() - interval * 3
+                for worker, (seen_at, _) in list(self.worker_stats.items()):
+                    if seen_at < expired:
+                        del self.worker_stats[worker]
+                        self.remote_interest.pop(worker, None)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log_warning(f"WebSocket 백플레인 하트비트 실패: {e}")
+
+            await asyncio.sleep(interval)
+
+    def _normalize_quote(
+        self, symbol: str, tick: Optional[TickTime] = None
+    ) -> Optional[Dict]:
+        """허브의 현재 가격을 정규화·검증합니다 (팔로워에서 시세가 없으면 None)."""
+        # 허브의 현재 가격 조회 (틱은 리더 허브에서 주기마다 한 번만 계산됨)
+        stock_data = self.hub.ensure_symbol(symbol)
+        if stock_data is None:
+            return None
+
+        # 데이터 정규화 및 검증
+        validation_result = data_normalizer.normalize_and_validate(
+            symbol, stock_data, DataSource.MOCK, tick
+        )
+        normalized_data = (
+            validation_result.normalized_data
+            if validation_result.is_valid
+            else stock_data
+        )
+
+        # 이상치 탐지 결과 확인
+        anomalies = normalized_data.get("anomalies", [])
+        if anomalies:
+            log_warning(
+                f"이상치 탐지: {symbol}",
+                category=ErrorCategory.DATA_VALIDATION_ERROR,
+                severity=ErrorSeverity.MEDIUM,
+            )
+
+        return normalized_data
 
-            # 구독자들에게 데이터 전송
-            if symbol in self.subscriptions:
-                session_ids = list(self.subscriptions[symbol])
-                for sid in session_ids:
-                    try:
-                        await self.sio.emit(
+    def _current_quote(self, symbol: str) -> Optional[Dict]:
+        """마지막 틱의 시세 (아직 없으면 로컬 허브에서 정규화)"""
+        quote = self.latest_quotes.get(symbol)
+        if quote is None:
+            quote = self._normalize_quote(symbol)
+        return quote
+
+    async def _send_monitored_update(
+        self, symbol: str, normalized_data: Optional[Dict] = None
+    ):
+        """성능 모니터링과 함께 종목 업데이트 전송"""
+        try:
+            async with logging_system.performance_monitor(f"auto_update_{symbol}"):
+                await self._send_stock_update(symbol, normalized_data)
+        except Exception as e:
+            log_error(
+                f"종목 업데이트 실패: {symbol}",
+                category=ErrorCategory.WEBSOCKET_ERROR,
+                severity=ErrorSeverity.MEDIUM,
+            )
+
+    async def _send_stock_update(
+        self, symbol: str, normalized_data: Optional[Dict] = None
+    ):
+        """종목 업데이트 전송 (시세가 없으면 허브에서 조회해 정규화)"""
+        try:
+            if normalized_data is None:
+                normalized_data = self._normalize_quote(symbol)
+                if normalized_data is None:
+                    return
+
+            payload = {
+                "symbol": symbol,
+                "data": normalized_data,
+                "timestamp": datetime.now().isoformat(),
+                "quality_score": normalized_data.get("quality_score", 0),
+            }
+
+            sessions = self.subscriptions.get(symbol, set())
+            options_list = [
+                self.session_options[sid]
+                for sid in sessions
+                if sid in self.session_options
+            ]
+
+            delta_message = None
+            if any(options.delta for options in options_list):
+                # 델타는 종목당 한 번만 계산하고 델타 모드 구독자가 공유
+                stream = self._delta_stream(symbol)
+                delta_message = stream.advance(normalized_data)
+
+            # 형식(델타/인코딩)별 종목 방에 한 번만 인코딩해서 모든 구독자에게 동시에 전송
+            room_groups = {
+                (options.delta, options.encoding)
+                for options in options_list
+                if not options.batch
+            }
+            emits = []
+            for delta, encoding in room_groups:
+                room = symbol_room(
+                    symbol, StreamOptions(delta=delta, encoding=encoding).variant
+                )
+                if delta:
+                    # 송신 대기열에서 델타를 버리거나 덮어쓰지 않도록 스냅샷 생성 함수 전달
+                    self.fanout.emit_delta(
+                        "stock_delta",
+                        ws_codec.encode_message(delta_message, encoding),
+                        room,
+                        functools.partial(self._encode_snapshot, stream, encoding),
+                    )
+                else:
+                    emits.append(
+                        self.sio.emit(
                             "stock_data",
-                            {
-                                "symbol": symbol,
-                                "data": normalized_data,
-                                "timestamp": datetime.now().isoformat(),
-                                "quality_score": normalized_data.get(
-                                    "quality_score", 0
-                                ),
-                            },
-                            room=sid,
-                        )
-                    except Exception as e:
-                        log_error(
-                            f"클라이언트 업데이트 전송 실패: {sid}",
-                            category=ErrorCategory.WEBSOCKET_ERROR,
-                            severity=ErrorSeverity.LOW,
+                            ws_codec.encode_message(payload, encoding),
+                            room=room,
                         )
+                    )
+            await asyncio.gather(*emits)
+
+            # 배치 모드 구독자에게는 같은 조각을 대기열에 추가 (종목당 최신 값만 유지)
+            fragments: Dict[tuple, ws_fanout.Fragment] = {}
+            for sid in sessions:
+                batch = self.session_batches.get(sid)
+                if batch is None:
+                    continue
+
+                if not self.session_options[sid].delta:
+                    kind, message = "full", payload
+                elif symbol in batch.pending:
+                    # 전송되지 않은 델타를 대체하면 변경분이 유실되므로 스냅샷으로 대체
+                    kind, message = "snapshot", stream.snapshot()
+                else:
+                    kind, message = "delta", delta_message
+
+                key = (kind, batch.encoding)
+                if key not in fragments:
+                    fragments[key] = self.fanout.encode_fragment(
+                        message, batch.encoding
+                    )
+                batch.offer(symbol, fragments[key])
 
         except Exception as e:
             log_error(
@@ -354,32 +748,88 @@ class WebsocketManager:
             # 개별 종목 실패가 전체 시스템을 멈추지 않도록 예외를 다시 던지지 않음
 
     async def stop_auto_updates(self):
-        """자동 업데이트 중지"""
-        if self.update_task and not self.update_task.done():
-            self.update_task.cancel()
-            try:
-                await self.update_task
-            except asyncio.CancelledError:
-                pass
+        """자동 업데이트 중지 (허브 틱 수신 해제)"""
+        if self.updates_attached:
+            self.hub.detach("socketio")
+            self.updates_attached = False
             log_info("WebSocket 자동 업데이트 중지")
 
-    def get_stats(self) -> dict:
-        """WebSocket 통계 정보"""
+        if self.heartbeat_task is not None:
+            self.heartbeat_task.cancel()
+            self.heartbeat_task = None
+        await self.backplane.stop()
+        await self.fanout.close()
+
+    def _local_stats(self) -> dict:
+        """이 워커의 WebSocket 통계"""
         total_subscriptions = sum(
             len(sessions) for sessions in self.subscriptions.values()
         )
         active_sessions = len(self.session_symbols)
         active_symbols = len(self.subscriptions)
 
-        stats = {
+        return {
             "active_sessions": active_sessions,
             "active_symbols": active_symbols,
             "total_subscriptions": total_subscriptions,
             "symbols": list(self.subscriptions.keys()),
-            "update_task_running": self.update_task is not None
-            and not self.update_task.done(),
+            "update_task_running": self.updates_attached
+            and (self.hub.is_running or not self.backplane.is_leader),
+            "tick_sequence": self.tick_sequence,
+            "fanout": dict(self.fanout.stats),
+            "send_queues": self.fanout.get_queue_stats(),
+            "batched_sessions": len(self.session_batches),
+            "conflated_updates": sum(
+                batch.conflated for batch in self.session_batches.values()
+            ),
         }
 
+    def get_stats(self) -> dict:
+        """WebSocket 통계 정보 (백플레인으로 연결된 모든 워커 합계)"""
+        stats = self._local_stats()
+        workers = {self.backplane.worker_id: stats}
+        workers.update(
+            {worker: remote for worker, (_, remote) in self.worker_stats.items()}
+        )
+
+        symbols = set()
+        for worker_stats in workers.values():
+            symbols.update(worker_stats.get("symbols", []))
+
+        stats.update(
+            {
+                "active_sessions": sum(
+                    w.get("active_sessions", 0) for w in workers.values()
+                ),
+                "total_subscriptions": sum(
+                    w.get("total_subscriptions", 0) for w in workers.values()
+                ),
+                "active_symbols": len(symbols),
+                "symbols": sorted(symbols),
+                "batched_sessions": sum(
+                    w.get("batched_sessions", 0) for w in workers.values()
+                ),
+                "conflated_updates": sum(
+                    w.get("conflated_updates", 0) for w in workers.values()
+                ),
+                "backplane": {
+                    "worker_id": self.backplane.worker_id,
+                    "is_leader": self.backplane.is_leader,
+                    "workers": len(workers),
+                },
+                "workers": {
+                    worker: {
+                        "active_sessions": w.get("active_sessions", 0),
+                        "total_subscriptions": w.get("total_subscriptions", 0),
+                        "send_queue_depth": w.get("send_queues", {}).get(
+                            "total_depth", 0
+                        ),
+                    }
+                    for worker, w in workers.items()
+                },
+            }
+        )
+
         log_info("WebSocket 통계 조회")
 
         return stats
@@ -405,6 +855,11 @@ async def start_websocket_updates():
     log_info("WebSocket 자동 업데이트 시작됨")
 
 
+async def stop_websocket_updates():
+    """WebSocket 자동 업데이트 중지 (송신 대기열 writer 태스크 정리)"""
+    await websocket_manager.stop_auto_updates()
+
+
 # Socket.IO 앱을 얻는 함수
 def get_socket_app():
     """Socket.IO ASGI 앱을 반환"""
@@ -0,0 +1,297 @@
+"""
+WebSocket 백플레인 (워커 간 pub/sub)
+
+여러 uvicorn 워커가 Socket.IO 연결을 나눠 가질 때, 한 워커(리더)가 계산한 틱과
+각 워커의 구독/통계 정보를 다른 워커에 전달합니다.
+
+- InProcessBackplane: 단일 워커용 (직렬화 없이 같은 프로세스 핸들러 호출)
+- UnixSocketBackplane: 같은 호스트의 워커들이 Unix 소켓 브로커로 메시지를 교환
+  잠금 파일을 먼저 잡은 워커가 브로커(리더)가 되며, 리더가 종료되면 남은 워커 중
+  하나가 잠금을 잡아 브로커와 리더 역할을 이어받습니다.
+
+메시지는 채널 이름과 JSON 직렬화 가능한 딕셔너리로 구성됩니다.
+"""
+
+import asyncio
+import fcntl
+import json
+import logging
+import os
+import socket
+import struct
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MessageHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+RoleListener = Callable[[bool], Awaitable[None]]
+
+# 프레임 헤더: 본문 길이 (big-endian uint32)
+_HEADER = struct.Struct("!I")
+
+
+def default_worker_id() -> str:
+    """호스트와 프로세스 ID로 워커 식별자를 만듭니다."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class Backplane(ABC):
+    """워커 간 pub/sub 인터페이스"""
+
+    def __init__(self, worker_id: Optional[str] = None):
+        self.worker_id = worker_id or default_worker_id()
+        self._handlers: Dict[str, List[MessageHandler]] = {}
+        self._role_listeners: List[RoleListener] = []
+
+    @property
+    @abstractmethod
+    def is_leader(self) -> bool:
+        """이 워커가 틱을 생산하는 리더인지 여부"""
+
+    @abstractmethod
+    async def start(self) -> None:
+        """백플레인 연결을 시작합니다."""
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """백플레인 연결을 종료합니다."""
+
+    @abstractmethod
+    async def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        """모든 워커(자신 포함)에 메시지를 발행합니다."""
+
+    def subscribe(self, channel: str, handler: MessageHandler) -> None:
+        """채널 메시지 핸들러를 등록합니다."""
+        self._handlers.setdefault(channel, []).append(handler)
+
+    def on_role_change(self, listener: RoleListener) -> None:
+        """리더 여부가 바뀔 때 호출될 콜백을 등록합니다."""
+        self._role_listeners.append(listener)
+
+    async def _dispatch(self, channel: str, message: Dict[str, Any]) -> None:
+        """로컬 핸들러에 메시지를 전달합니다 (핸들러 오류는 기록만 함)."""
+        for handler in self._handlers.get(channel, ()):
+            try:
+                await handler(message)
+            except Exception as e:
+                logger.error(f"백플레인 핸들러 오류 ({channel}): {str(e)}")
+
+    async def _notify_role(self, is_leader: bool) -> None:
+        for listener in self._role_listeners:
+            try:
+                await listener(is_leader)
+            except Exception as e:
+                logger.error(f"백플레인 역할 변경 처리 오류: {str(e)}")
+
+
+class InProcessBackplane(Backplane):
+    """단일 프로세스 백플레인 (항상 리더, 직렬화 없음)"""
+
+    def __init__(self, worker_id: Optional[str] = None):
+        super().__init__(worker_id)
+        self._running = False
+
+    @property
+    def is_leader(self) -> bool:
+        return True
+
+    async def start(self) -> None:
+        if not self._running:
+            self._running = True
+            await self._notify_role(True)
+
+    async def stop(self) -> None:
+        self._running = False
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        await self._dispatch(channel, message)
+
+
+def _encode_frame(channel: str, message: Dict[str, Any], origin: str) -> bytes:
+    body = json.dumps(
+        {"channel": channel, "origin": origin, "message": message},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return _HEADER.pack(len(body)) + body
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> bytes:
+    header = await reader.readexactly(_HEADER.size)
+    (length,) = _HEADER.unpack(header)
+    return await reader.readexactly(length)
+
+
+class UnixSocketBackplane(Backplane):
+    """Unix 소켓 브로커를 통한 같은 호스트 워커 간 백플레인"""
+
+    def __init__(
+        self,
+        path: str,
+        worker_id: Optional[str] = None,
+        reconnect_interval: float = 1.0,
+    ):
+        super().__init__(worker_id)
+        self.path = path
+        self.lock_path = f"{path}.lock"
+        self.reconnect_interval = reconnect_interval
+
+        self._lock_fd: Optional[int] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._peers: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._task: Optional[asyncio.Task] = None
+        self._connected = asyncio.Event()
+
+    @property
+    def is_leader(self) -> bool:
+        return self._server is not None
+
+    async def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            # 첫 연결(또는 브로커 생성)까지 잠시 대기
+            try:
+                await asyncio.wait_for(
+                    self._connected.wait(), timeout=self.reconnect_interval * 5
+                )
+            except asyncio.TimeoutError:
+                logger.warning("백플레인 브로커에 아직 연결되지 않았습니다.")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self._close_connection()
+        await self._release_broker()
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        # 자신에게는 직렬화 없이 바로 전달
+        await self._dispatch(channel, message)
+
+        writer = self._writer
+        if writer is None or writer.is_closing():
+            logger.warning(f"백플레인 미연결 상태로 발행: {channel}")
+            return
+        writer.write(_encode_frame(channel, message, self.worker_id))
+        await writer.drain()
+
+    async def _run(self) -> None:
+        """브로커 연결을 유지합니다 (끊기면 리더 선출 후 재연결)."""
+        while True:
+            try:
+                was_leader = self.is_leader
+                await self._try_become_broker()
+                if self.is_leader != was_leader:
+                    await self._notify_role(self.is_leader)
+
+                reader, self._writer = await asyncio.open_unix_connection(
+                    self.path, limit=2**24
+                )
+                self._connected.set()
+                logger.info(
+                    f"백플레인 연결: {self.path} "
+                    f"({'리더' if self.is_leader else '팔로워'}, {self.worker_id})"
+                )
+
+                while True:
+                    frame = json.loads(await _read_frame(reader))
+                    if frame["origin"] != self.worker_id:
+                        await self._dispatch(frame["channel"], frame["message"])
+
+            except asyncio.CancelledError:
+                raise
+            except (OSError, asyncio.IncompleteReadError) as e:
+                logger.warning(f"백플레인 연결 끊김: {str(e)}")
+            except Exception as e:
+                logger.error(f"백플레인 처리 오류: {str(e)}")
+
+            self._connected.clear()
+            await self._close_connection()
+            await asyncio.sleep(self.reconnect_interval)
+
+    async def _try_become_broker(self) -> None:
+        """잠금 파일을 잡으면 브로커를 엽니다 (이미 리더면 무시)."""
+        if self.is_leader:
+            return
+
+        fd = os.open(self.lock_path, os.O_CREAT | os.O_RDWR, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return
+
+        # 잠금을 잡았으므로 남아 있는 소켓 파일은 이전 리더의 것
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._lock_fd = fd
+        self._server = await asyncio.start_unix_server(
+            self._serve_peer, path=self.path, limit=2**24
+        )
+        logger.info(f"백플레인 브로커 시작: {self.path}")
+
+    async def _serve_peer(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """브로커: 한 워커의 프레임을 다른 모든 워커에 중계합니다."""
+        self._peers[writer] = asyncio.current_task()
+        try:
+            while True:
+                body = await _read_frame(reader)
+                frame = _HEADER.pack(len(body)) + body
+                for peer in list(self._peers):
+                    if peer is not writer and not peer.is_closing():
+                        peer.write(frame)
+                await asyncio.gather(
+                    *(peer.drain() for peer in list(self._peers) if peer is not writer),
+                    return_exceptions=True,
+                )
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._peers.pop(writer, None)
+            writer.close()
+
+    async def _close_connection(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    async def _release_broker(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            tasks = list(self._peers.values())
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._peers.clear()
+            await self._server.wait_closed()
+            self._server = None
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+        if self._lock_fd is not None:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+
+BACKPLANES = ("inprocess", "unix")
+
+
+def create_backplane(kind: str, path: str = "") -> Backplane:
+    """설정 이름으로 백플레인을 생성합니다."""
+    if kind == "inprocess":
+        return InProcessBackplane()
+    if kind == "unix":
+        if not path:
+            raise ValueError("unix 백플레인에는 소켓 경로가 필요합니다")
+        return UnixSocketBackplane(path)
+    raise ValueError(f"지원하지 않는 백플레인: {kind} (지원: {', '.join(BACKPLANES)})")
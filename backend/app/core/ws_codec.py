@@ -0,0 +1,89 @@
+"""
+WebSocket 전송 인코딩
+
+클라이언트가 요청하면 JSON 대신 MessagePack 바이너리 프레임으로 전송합니다.
+- 기본값은 JSON (기존 클라이언트 호환)
+- MessagePack에서는 ISO 타임스탬프 문자열을 epoch 밀리초 정수로 변환
+- msgpack 패키지가 없으면 JSON으로 대체
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, Union
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - 선택 의존성
+    msgpack = None
+
+JSON = "json"
+MSGPACK = "msgpack"
+ENCODINGS = (JSON, MSGPACK)
+
+# 숫자로 변환할 타임스탬프 필드
+TIMESTAMP_FIELDS = frozenset(
+    {"timestamp", "validated_at", "normalized_at", "updated_at", "last_updated"}
+)
+
+
+def msgpack_available() -> bool:
+    """MessagePack 인코딩 사용 가능 여부"""
+    return msgpack is not None
+
+
+def negotiate_encoding(requested: Any) -> str:
+    """요청된 인코딩 중 사용 가능한 것을 반환합니다 (기본 JSON)."""
+    if isinstance(requested, str) and requested.lower() == MSGPACK:
+        return MSGPACK if msgpack_available() else JSON
+    return JSON
+
+
+def epoch_millis(value: str) -> Union[int, str]:
+    """ISO 8601 문자열을 epoch 밀리초로 변환합니다 (실패 시 원래 값)."""
+    try:
+        return int(datetime.fromisoformat(value).timestamp() * 1000)
+    except ValueError:
+        return value
+
+
+def numeric_timestamps(value: Any) -> Any:
+    """메시지 안의 ISO 타임스탬프 필드를 epoch 밀리초로 바꾼 사본을 만듭니다."""
+    if isinstance(value, dict):
+        return {
+            key: (
+                epoch_millis(item)
+                if key in TIMESTAMP_FIELDS and isinstance(item, str)
+                else numeric_timestamps(item)
+            )
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [numeric_timestamps(item) for item in value]
+    return value
+
+
+def pack(message: Any) -> bytes:
+    """메시지를 MessagePack 바이너리로 인코딩합니다 (타임스탬프는 숫자)."""
+    return msgpack.packb(numeric_timestamps(message), use_bin_type=True)
+
+
+def encode_message(message: Any, encoding: str = JSON) -> Any:
+    """Socket.IO로 보낼 메시지를 인코딩합니다 (JSON은 Socket.IO가 직렬화)."""
+    if encoding == MSGPACK:
+        return pack(message)
+    return message
+
+
+def pack_batch(header: Dict[str, Any], fragments: Iterable[bytes]) -> bytes:
+    """이미 인코딩된 MessagePack 조각으로 {..header, "updates": [...]} 맵을 만듭니다."""
+    fragments = list(fragments)
+    packer = msgpack.Packer(use_bin_type=True)
+    header = numeric_timestamps(header)
+
+    parts = [packer.pack_map_header(len(header) + 1)]
+    for key, value in header.items():
+        parts.append(packer.pack(key))
+        parts.append(packer.pack(value))
+    parts.append(packer.pack("updates"))
+    parts.append(packer.pack_array_header(len(fragments)))
+    parts.extend(fragments)
+    return b"".join(parts)
@@ -0,0 +1,82 @@
+"""
+델타 인코딩 스트림
+
+종목별로 마지막으로 보낸 상태를 기억하고, 틱마다 변경된 필드만 전송합니다.
+- 구독 시와 snapshot_interval 틱마다 전체 스냅샷 전송
+- 모든 메시지에 종목별 시퀀스 번호를 붙여 클라이언트가 누락을 감지
+  (seq가 마지막으로 받은 값 + 1이 아니면 request_snapshot으로 재동기화)
+
+델타는 종목당 한 번만 계산되어 같은 모드의 모든 구독자가 공유합니다.
+
+메시지 형식:
+    {"type": "snapshot", "symbol": "AAPL", "seq": 12, "data": {...}}
+    {"type": "delta", "symbol": "AAPL", "seq": 13, "changes": {...}, "removed": [...]}
+"""
+
+from typing import Any, Dict, List, Optional
+
+_MISSING = object()
+
+
+def diff_fields(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """새 상태에서 값이 바뀌었거나 추가된 필드를 반환합니다."""
+    return {key: value for key, value in new.items() if old.get(key, _MISSING) != value}
+
+
+class DeltaStream:
+    """종목별 델타 스트림 (같은 종목의 모든 델타 구독자가 공유)"""
+
+    def __init__(self, symbol: str, snapshot_interval: int = 30):
+        self.symbol = symbol
+        self.snapshot_interval = max(1, snapshot_interval)
+
+        self.sequence = 0
+        self.state: Optional[Dict[str, Any]] = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태의 전체 스냅샷 메시지"""
+        return {
+            "type": "snapshot",
+            "symbol": self.symbol,
+            "seq": self.sequence,
+            "data": self.state,
+        }
+
+    def ensure_state(self, data: Dict[str, Any]) -> None:
+        """아직 보낸 상태가 없으면 현재 데이터를 기준 상태로 사용합니다."""
+        if self.state is None:
+            self.state = dict(data)
+
+    def advance(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """다음 틱의 메시지를 만듭니다 (주기가 되면 스냅샷, 아니면 델타)."""
+        previous = self.state
+        self.state = dict(data)
+        self.sequence += 1
+
+        if previous is None or self.sequence % self.snapshot_interval == 0:
+            return self.snapshot()
+
+        message = {
+            "type": "delta",
+            "symbol": self.symbol,
+            "seq": self.sequence,
+            "changes": diff_fields(previous, data),
+        }
+        removed: List[str] = [key for key in previous if key not in data]
+        if removed:
+            message["removed"] = removed
+        return message
+
+
+def apply_message(
+    state: Optional[Dict[str, Any]], message: Dict[str, Any]
+) -> Dict[str, Any]:
+    """클라이언트 측에서 스냅샷/델타 메시지를 상태에 적용합니다 (테스트/참고용)."""
+    if message["type"] == "snapshot":
+        return dict(message["data"])
+
+    result = dict(state or {})
+    result.update(message["changes"])
+    for key in message.get("removed", []):
+        result.pop(key, None)
+    return result
@@ -0,0 +1,515 @@
+"""
+Socket.IO 팬아웃 유틸리티
+
+종목별 방(room)에 구독자를 모으고, 방 단위 전송 시 Socket.IO 패킷을
+한 번만 인코딩한 뒤 모든 참여자에게 동시에 전달합니다.
+(기본 AsyncManager는 참여자마다 패킷을 다시 인코딩합니다.)
+
+배치 모드 세션은 구독한 모든 종목을 주기마다 하나의 프레임으로 받습니다.
+종목별 페이로드는 한 번만 JSON(또는 MessagePack) 조각으로 인코딩되고,
+세션별 프레임은 조각을 이어 붙여서 만듭니다. 배치 프레임도 같은 송신 대기열을
+거치며, 대기열에는 세션당 배치 항목 하나만 두고 전송 직전에 프레임을 만듭니다.
+
+모든 전송은 연결별 제한된 송신 대기열을 거쳐 연결마다 하나의 writer 태스크가
+순서대로 보냅니다. 느린 클라이언트는 자기 대기열만 채우며, 대기열이 넘치면
+설정된 정책(drop_oldest / conflate / disconnect)을 적용합니다.
+델타 스트림 프레임은 변경분만 담고 있어 버리거나 교체하면 상태가 어긋나므로,
+버리지 않고 같은 스트림의 프레임이 다시 들어오면 전송 시점의 스냅샷으로 합칩니다.
+"""
+
+import asyncio
+import functools
+import json
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union
+
+from socketio import AsyncManager, packet
+
+from app.core import ws_codec
+
+EncodedPacket = Union[str, bytes, List[Union[str, bytes]]]
+Fragment = Union[str, bytes]
+# 송신 대기열 항목: 인코딩된 패킷 또는 전송 직전에 패킷을 만드는 함수 (배치 프레임)
+QueueItem = Union[EncodedPacket, Callable[[], Optional[EncodedPacket]]]
+
+# 송신 대기열이 가득 찼을 때의 정책
+DROP_OLDEST = "drop_oldest"  # 가장 오래된 프레임을 버림
+CONFLATE = "conflate"  # 같은 스트림(이벤트+방)의 대기 프레임을 최신 값으로 교체
+DISCONNECT = "disconnect"  # 연결을 끊음 (클라이언트가 재연결 후 스냅샷부터 수신)
+OVERFLOW_POLICIES = (DROP_OLDEST, CONFLATE, DISCONNECT)
+
+
+def symbol_room(symbol: str, variant: str = "") -> str:
+    """종목별 Socket.IO 방 이름 (전송 형식이 다르면 방도 분리)"""
+    room = f"stock:{symbol}"
+    return f"{room}:{variant}" if variant else room
+
+
+@dataclass
+class StreamOptions:
+    """세션별 스트림 옵션"""
+
+    batch: bool = False  # 구독 종목을 하나의 stock_batch 프레임으로 수신
+    delta: bool = False  # 스냅샷 + 변경 필드만 수신 (stock_delta)
+    encoding: str = ws_codec.JSON  # "json" 또는 "msgpack"
+
+    @property
+    def variant(self) -> str:
+        """같은 프레임을 공유할 수 있는 세션 그룹 이름"""
+        parts = []
+        if self.delta:
+            parts.append("delta")
+        if self.encoding != ws_codec.JSON:
+            parts.append(self.encoding)
+        return ":".join(parts)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class SessionBatch:
+    """배치 모드 세션의 대기 중인 종목 업데이트
+
+    종목당 최신 값만 유지하므로(conflation), 이전 프레임 전송이 끝나지 않은
+    느린 클라이언트도 대기열이 쌓이지 않고 다음 프레임에서 최신 값만 받습니다.
+    """
+
+    def __init__(
+        self,
+        sid: str,
+        eio_sid: str,
+        namespace: str = "/",
+        encoding: str = ws_codec.JSON,
+    ):
+        self.sid = sid
+        self.eio_sid = eio_sid
+        self.namespace = namespace
+        self.encoding = encoding
+
+        self.pending: Dict[str, Fragment] = {}  # symbol -> 인코딩된 조각
+        self.header: Dict[str, Any] = {}
+
+        self.frames_sent = 0  # 만들어 송신 대기열에서 꺼낸 프레임 수
+        self.conflated = 0  # 전송 전에 새 값으로 대체된 업데이트 수
+
+    def offer(self, symbol: str, fragment: Fragment) -> None:
+        """종목 업데이트를 추가합니다 (대기 중인 이전 값은 대체)."""
+        if symbol in self.pending:
+            self.conflated += 1
+        self.pending[symbol] = fragment
+
+    def take(self) -> List[Fragment]:
+        """대기 중인 업데이트를 모두 꺼냅니다."""
+        fragments = list(self.pending.values())
+        self.pending.clear()
+        return fragments
+
+
+class ConnectionQueue:
+    """연결별 제한된 송신 대기열
+
+    conflate 정책에서는 같은 키(이벤트+방)의 프레임이 이미 대기 중이면 자리를
+    유지한 채 최신 프레임으로 교체하고, 같은 키가 없을 때만 가장 오래된 프레임을
+    버립니다.
+
+    resync가 있는 프레임(델타 스트림)은 정책과 관계없이 버리지 않습니다. 같은 키의
+    프레임이 대기 중이면 두 델타를 resync(전송 시점 스냅샷)로 합치므로, 스트림당
+    대기 항목은 하나를 넘지 않습니다.
+    """
+
+    def __init__(self, eio_sid: str, maxsize: int, policy: str):
+        self.eio_sid = eio_sid
+        self.maxsize = max(1, maxsize)
+        self.policy = policy
+
+        self._items: deque = deque()  # [key, packet, resync] 항목
+        self._keyed: Dict[Any, list] = {}
+        self._ready = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+        self.sent = 0
+        self.dropped = 0
+        self.conflated = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def has(self, key: Any) -> bool:
+        """같은 키의 항목이 전송을 기다리고 있는지 여부"""
+        return key in self._keyed
+
+    def put(
+        self,
+        encoded: QueueItem,
+        key: Any = None,
+        resync: Optional[Callable[[], Optional[EncodedPacket]]] = None,
+    ) -> bool:
+        """프레임을 대기열에 넣습니다 (disconnect 정책에서 넘치면 False).
+
+        resync는 델타 프레임을 합치거나 대신할 스냅샷 패킷을 만드는 함수입니다.
+        """
+        pending = self._keyed.get(key) if key is not None else None
+        if pending is not None and pending[2] is not None:
+            # 대기 중인 델타를 새 델타로 바꾸면 변경분이 유실되므로 스냅샷으로 합침
+            pending[1] = pending[2]
+            self.conflated += 1
+            return True
+        if pending is not None and self.policy == CONFLATE:
+            pending[1] = encoded
+            self.conflated += 1
+            return True
+
+        if len(self._items) >= self.maxsize:
+            if self.policy == DISCONNECT:
+                return False
+            self._drop_oldest()
+
+        entry = [key, encoded, resync]
+        self._items.append(entry)
+        if key is not None:
+            self._keyed[key] = entry
+        self._ready.set()
+        return True
+
+    def _drop_oldest(self) -> None:
+        """가장 오래된 프레임을 버립니다 (델타 스트림 프레임은 건너뜀)."""
+        for index, entry in enumerate(self._items):
+            if entry[2] is None:
+                del self._items[index]
+                self._forget(entry)
+                self.dropped += 1
+                return
+
+    def _pop(self) -> QueueItem:
+        entry = self._items.popleft()
+        self._forget(entry)
+        return entry[1]
+
+    def _forget(self, entry: list) -> None:
+        if entry[0] is not None and self._keyed.get(entry[0]) is entry:
+            del self._keyed[entry[0]]
+
+    async def get(self) -> QueueItem:
+        """다음 프레임을 기다려 꺼냅니다."""
+        while not self._items:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._pop()
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._keyed.clear()
+
+
+class BroadcastManager(AsyncManager):
+    """패킷을 한 번만 인코딩해서 방 전체에 보내는 Socket.IO 클라이언트 매니저"""
+
+    def __init__(self, queue_size: int = 100, overflow_policy: str = DROP_OLDEST):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"지원하지 않는 대기열 정책: {overflow_policy} "
+                f"(지원: {', '.join(OVERFLOW_POLICIES)})"
+            )
+
+        super().__init__()
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
+        self.queues: Dict[str, ConnectionQueue] = {}  # eio_sid -> 송신 대기열
+        self._tasks: Set[asyncio.Task] = set()  # 대기열 초과 연결 해제 태스크
+
+        self.stats = {
+            "frames_encoded": 0,  # 인코딩된 패킷 수
+            "deliveries": 0,  # 클라이언트별 전송 수
+            "send_errors": 0,
+            "batch_frames": 0,  # 배치 모드 프레임 수
+            "dropped": 0,  # 대기열 초과로 버린 프레임 수
+            "conflated": 0,  # 최신 프레임으로 교체된 대기 프레임 수
+            "overflow_disconnects": 0,  # 대기열 초과로 끊은 연결 수
+        }
+
+    async def emit(
+        self,
+        event,
+        data,
+        namespace,
+        room=None,
+        skip_sid=None,
+        callback=None,
+        **kwargs,
+    ):
+        """방(또는 단일 세션)에 이벤트를 전송합니다."""
+        # ACK 콜백은 세션마다 ID가 달라 패킷을 공유할 수 없으므로 기본 동작 사용
+        if callback is not None or namespace not in self.rooms:
+            return await super().emit(
+                event,
+                data,
+                namespace,
+                room=room,
+                skip_sid=skip_sid,
+                callback=callback,
+                **kwargs,
+            )
+
+        if not isinstance(skip_sid, list):
+            skip_sid = [skip_sid]
+
+        eio_sids = [
+            eio_sid
+            for sid, eio_sid in self.get_participants(namespace, room)
+            if sid not in skip_sid
+        ]
+        if not eio_sids:
+            return
+
+        # 세션 개인 방이 아닌 공유 방(종목 스트림)의 프레임만 최신 값으로 교체 가능
+        key = None
+        if room is not None and room not in self.rooms[namespace].get(None, {}):
+            key = (event, room)
+
+        encoded = self.encode_event(event, data, namespace)
+        self.enqueue(eio_sids, encoded, key)
+
+    def emit_delta(
+        self,
+        event: str,
+        data: Any,
+        room: str,
+        snapshot: Callable[[], Any],
+        namespace: str = "/",
+    ) -> None:
+        """델타 스트림 프레임을 방에 전송합니다.
+
+        대기열에서 같은 방의 델타가 아직 전송되지 않았으면 두 델타를 버리거나
+        교체하지 않고, 전송 시점에 snapshot()으로 만든 스냅샷 하나로 합칩니다.
+        스트림을 진행한 직후 순서대로 대기열에 넣도록 동기 함수로 둡니다.
+        """
+        if namespace not in self.rooms:
+            return
+        eio_sids = [eio_sid for _, eio_sid in self.get_participants(namespace, room)]
+        if not eio_sids:
+            return
+
+        resync = functools.partial(self._encode_snapshot, event, snapshot, namespace)
+        self.enqueue(
+            eio_sids, self.encode_event(event, data, namespace), (event, room), resync
+        )
+
+    def _encode_snapshot(
+        self, event: str, snapshot: Callable[[], Any], namespace: str
+    ) -> EncodedPacket:
+        return self.encode_event(event, snapshot(), namespace)
+
+    def encode_event(
+        self, event: str, data: Any, namespace: str = "/"
+    ) -> EncodedPacket:
+        """이벤트를 Socket.IO 패킷으로 한 번 인코딩합니다."""
+        # 튜플은 여러 인자로 펼치고, 그 외에는 단일 인자로 전송 (python-socketio 규칙)
+        if isinstance(data, tuple):
+            data = list(data)
+        elif data is not None:
+            data = [data]
+        else:
+            data = []
+
+        pkt = self.server.packet_class(
+            packet.EVENT, namespace=namespace, data=[event] + data
+        )
+        self.stats["frames_encoded"] += 1
+        return pkt.encode()
+
+    def enqueue(
+        self,
+        eio_sids: Iterable[str],
+        encoded: QueueItem,
+        key: Any = None,
+        resync: Optional[Callable[[], Optional[EncodedPacket]]] = None,
+    ) -> None:
+        """인코딩된 패킷을 각 연결의 송신 대기열에 넣습니다 (전송을 기다리지 않음)."""
+        for eio_sid in eio_sids:
+            queue = self.queues.get(eio_sid)
+            if queue is None:
+                queue = ConnectionQueue(eio_sid, self.queue_size, self.overflow_policy)
+                queue.task = asyncio.create_task(self._writer(queue))
+                self.queues[eio_sid] = queue
+
+            dropped, conflated = queue.dropped, queue.conflated
+            if not queue.put(encoded, key, resync):
+                self._disconnect_laggard(queue)
+                continue
+            self.stats["dropped"] += queue.dropped - dropped
+            self.stats["conflated"] += queue.conflated - conflated
+
+    async def send_encoded(
+        self, eio_sids: Iterable[str], encoded: EncodedPacket
+    ) -> None:
+        """인코딩된 패킷을 여러 Engine.IO 세션의 송신 대기열에 넣습니다."""
+        self.enqueue(eio_sids, encoded)
+
+    async def _writer(self, queue: ConnectionQueue) -> None:
+        """연결 하나의 송신 대기열을 순서대로 전송합니다."""
+        while True:
+            encoded = await queue.get()
+            try:
+                if callable(encoded):
+                    # 배치 항목: 지금까지 쌓인 최신 값으로 프레임 생성
+                    encoded = encoded()
+                    if encoded is None:
+                        continue
+                await self._send_packet(queue.eio_sid, encoded)
+                await self._wait_flushed(queue.eio_sid)
+                queue.sent += 1
+                self.stats["deliveries"] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.stats["send_errors"] += 1
+
+    async def _wait_flushed(self, eio_sid: str) -> None:
+        """Engine.IO 소켓이 보낸 프레임을 가져갈 때까지 기다립니다 (백프레셔)."""
+        socket = self.server.eio.sockets.get(eio_sid)
+        if socket is not None:
+            await socket.queue.join()
+
+    def _disconnect_laggard(self, queue: ConnectionQueue) -> None:
+        """대기열이 넘친 연결을 끊습니다 (disconnect 정책)."""
+        self.stats["overflow_disconnects"] += 1
+        writer = self._close_queue(queue.eio_sid)
+        task = asyncio.create_task(self._disconnect_eio(queue.eio_sid, writer))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _disconnect_eio(
+        self, eio_sid: str, writer: Optional[asyncio.Task]
+    ) -> None:
+        await self._wait_stopped([writer])
+        await self.server.eio.disconnect(eio_sid)
+
+    def _close_queue(self, eio_sid: str) -> Optional[asyncio.Task]:
+        """송신 대기열을 비우고 writer 태스크를 취소합니다 (취소된 태스크 반환)."""
+        queue = self.queues.pop(eio_sid, None)
+        if queue is None:
+            return None
+        queue.clear()
+        if queue.task is not None:
+            queue.task.cancel()
+        return queue.task
+
+    @staticmethod
+    async def _wait_stopped(tasks: Iterable[Optional[asyncio.Task]]) -> None:
+        """취소한 태스크가 실제로 끝날 때까지 기다립니다."""
+        current = asyncio.current_task()
+        pending = [task for task in tasks if task is not None and task is not current]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def disconnect(self, sid, namespace, **kwargs):
+        """연결 해제 시 송신 대기열과 writer 태스크를 정리합니다."""
+        eio_sid = self.eio_sid_from_sid(sid, namespace)
+        await super().disconnect(sid, namespace, **kwargs)
+        if eio_sid is not None and self.sid_from_eio_sid(eio_sid, namespace) is None:
+            await self._wait_stopped([self._close_queue(eio_sid)])
+
+    async def close(self) -> None:
+        """모든 송신 대기열과 writer 태스크를 정리합니다 (서버 종료 시)."""
+        tasks = [self._close_queue(eio_sid) for eio_sid in list(self.queues)]
+        for task in self._tasks:
+            task.cancel()
+        tasks.extend(self._tasks)
+        await self._wait_stopped(tasks)
+
+    def get_queue_stats(self) -> Dict[str, Any]:
+        """연결별 송신 대기열 통계 (깊이, 버린/교체된 프레임 수)"""
+        depths = {eio_sid: len(queue) for eio_sid, queue in self.queues.items()}
+        return {
+            "policy": self.overflow_policy,
+            "max_size": self.queue_size,
+            "connections": len(self.queues),
+            "total_depth": sum(depths.values()),
+            "max_depth": max(depths.values(), default=0),
+            "backlogged": {
+                eio_sid: depth for eio_sid, depth in depths.items() if depth
+            },
+            "dropped": self.stats["dropped"],
+            "conflated": self.stats["conflated"],
+            "overflow_disconnects": self.stats["overflow_disconnects"],
+        }
+
+    async def _send_packet(self, eio_sid: str, encoded: EncodedPacket) -> None:
+        """인코딩된 패킷(바이너리 첨부 포함)을 한 세션에 전송합니다."""
+        parts = encoded if isinstance(encoded, list) else [encoded]
+        for part in parts:
+            await self.server.eio.send(eio_sid, part)
+
+    def encode_fragment(self, data: Any, encoding: str = ws_codec.JSON) -> Fragment:
+        """배치 프레임에 넣을 조각을 인코딩합니다 (JSON은 Socket.IO와 같은 형식)."""
+        if encoding == ws_codec.MSGPACK:
+            return ws_codec.pack(data)
+        return json.dumps(data, separators=(",", ":"))
+
+    def build_batch_frame(
+        self,
+        event: str,
+        fragments: List[Fragment],
+        header: Optional[Dict[str, Any]] = None,
+        namespace: str = "/",
+        encoding: str = ws_codec.JSON,
+    ) -> EncodedPacket:
+        """조각을 이어 붙여 {..header, "updates": [...]} 이벤트 패킷을 만듭니다."""
+        if encoding == ws_codec.MSGPACK:
+            # 바이너리 첨부 하나를 가진 BINARY_EVENT 패킷
+            return self.encode_event(
+                event, ws_codec.pack_batch(header or {}, fragments), namespace
+            )
+
+        head = self.encode_fragment(header or {})[1:-1]
+        body = (
+            "{"
+            + (head + "," if head else "")
+            + '"updates":['
+            + ",".join(fragments)
+            + "]}"
+        )
+        prefix = str(packet.EVENT) + ("" if namespace == "/" else namespace + ",")
+        return f"{prefix}[{self.encode_fragment(event)},{body}]"
+
+    def schedule_batch(
+        self,
+        batch: SessionBatch,
+        event: str,
+        header: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """세션 배치 전송을 연결의 송신 대기열에 예약합니다.
+
+        대기열에는 세션당 배치 항목 하나만 둡니다. 이전 항목이 아직 대기 중이면
+        새 항목을 넣지 않고, 그 항목이 전송될 때 그 사이에 갱신된 최신 값까지
+        하나의 프레임으로 보냅니다. 대기열 크기 제한과 초과 정책은 다른 프레임과
+        똑같이 적용됩니다.
+        """
+        if header is not None:
+            batch.header = header
+        if not batch.pending:
+            return
+
+        key = (event, "batch", batch.sid)
+        queue = self.queues.get(batch.eio_sid)
+        if queue is not None and queue.has(key):
+            return
+        self.enqueue(
+            [batch.eio_sid],
+            functools.partial(self._take_batch_frame, batch, event),
+            key,
+        )
+
+    def _take_batch_frame(
+        self, batch: SessionBatch, event: str
+    ) -> Optional[EncodedPacket]:
+        """대기 중인 업데이트를 모두 꺼내 배치 프레임을 만듭니다 (없으면 None)."""
+        if not batch.pending:
+            return None
+        frame = self.build_batch_frame(
+            event, batch.take(), batch.header, batch.namespace, batch.encoding
+        )
+        batch.frames_sent += 1
+        self.stats["batch_frames"] += 1
+        return frame
@@ -10,9 +10,11 @@ from app.api.endpoints import auth
 from app.api.endpoints import kis as kis_router
 from app.api.endpoints import portfolio_holdings, portfolios, stock_search, watchlist
 from app.core.config import settings
+from app.core.http_client import http_clients
 from app.core.monitoring import init_sentry
 from app.core.websocket_simple import (
     start_websocket_updates,
+    stop_websocket_updates,
     websocket_manager,
     ws_router,
 )
@@ -52,9 +54,17 @@ app = create_app()
 @app.on_event("startup")
 async def startup_event():
     """애플리케이션 시작 시 실행되는 이벤트"""
+    await http_clients.start()
     await start_websocket_updates()
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """애플리케이션 종료 시 WebSocket 송신 태스크와 공유 HTTP 커넥션 풀을 정리합니다."""
+    await stop_websocket_updates()
+    await http_clients.close()
+
+
 @app.get("/")
 async def root():
     """루트 엔드포인트를 제공합니다."""
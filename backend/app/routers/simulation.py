@@ -5,23 +5,23 @@ Supabase 통합 버전
 """
 
 import asyncio
+import json
 from typing import Dict, List, Optional
 from uuid import UUID
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, Query, Body
 from fastapi.responses import JSONResponse
 
+from app.core import ws_codec
 from app.core.auth import get_current_user_id
 from app.core.logging_system import log_error, log_info
-from app.services.stock_simulator import StockDataSimulator
+from app.services.market_data_hub import market_data_hub
 from app.services.supabase_service import supabase_service
 from app.services.stock_database_service import stock_db_service
 from app.services.database_migration import db_migration
 
 router = APIRouter(tags=["simulation"])
 
-# 전역 시뮬레이터 인스턴스 (실시간 주가 데이터용)
-simulator = StockDataSimulator()
 
 # ❌ 메모리 기반 세션 제거 - 이제 Supabase 사용
 # simulation_sessions: Dict[str, Dict] = {}
@@ -70,16 +70,15 @@ async def get_stock_data():
         # 폴백: 기존 시뮬레이터 방식
         try:
             log_info("데이터베이스 조회 실패, 시뮬레이터로 폴백...")
-            if not simulator.is_running:
-                await simulator.start_simulation()
+            await market_data_hub.start()
 
-            stock_data = simulator.get_all_stocks()
+            stock_data = market_data_hub.get_all()
             return JSONResponse(
                 status_code=200,
                 content={
                     "success": True,
                     "data": stock_data,
-                    "timestamp": simulator.stock_data.get("AAPL", {}).get("timestamp", ""),
+                    "timestamp": stock_data.get("AAPL", {}).get("timestamp", ""),
                     "source": "simulator"
                 },
             )
@@ -286,9 +285,8 @@ async def start_simulation(user_id: str = Depends(get_current_user_id)):
             session = await supabase_service.create_simulation_session(user_id)
             log_info(f"새 시뮬레이션 세션 생성: {user_id}")
 
-        # 시뮬레이터 시작 (실시간 주가 데이터용)
-        if not simulator.is_running:
-            await simulator.start_simulation()
+        # 시장 데이터 허브 시작 (실시간 주가 데이터용)
+        await market_data_hub.start()
 
         return JSONResponse(
             status_code=200,
@@ -316,11 +314,12 @@ async def execute_trade(
                 status_code=404, detail="시뮬레이션 세션을 찾을 수 없습니다."
             )
 
-        # 현재 주식 가격 조회
-        if symbol not in simulator.stock_data:
+        # 현재 주식 가격 조회 (팔로워 워커는 리더가 발행한 시세)
+        quote = market_data_hub.get_quote(symbol)
+        if quote is None:
             raise HTTPException(status_code=404, detail="종목을 찾을 수 없습니다.")
 
-        current_price = simulator.stock_data[symbol]["price"]
+        current_price = quote["price"]
         total_amount = current_price * quantity
 
         if action.upper() == "BUY":
@@ -396,8 +395,9 @@ async def execute_trade(
         holdings_value = 0
 
         for holding in holdings:
-            if holding["symbol"] in simulator.stock_data:
-                market_price = simulator.stock_data[holding["symbol"]]["price"]
+            holding_quote = market_data_hub.get_quote(holding["symbol"])
+            if holding_quote is not None:
+                market_price = holding_quote["price"]
                 holdings_value += market_price * holding["quantity"]
 
         new_total_value = new_cash + holdings_value
@@ -460,8 +460,9 @@ async def get_simulation_portfolio(user_id: str = Depends(get_current_user_id)):
 
         for holding in holdings:
             symbol = holding["symbol"]
-            if symbol in simulator.stock_data:
-                current_price = simulator.stock_data[symbol]["price"]
+            quote = market_data_hub.get_quote(symbol)
+            if quote is not None:
+                current_price = quote["price"]
                 market_value = current_price * holding["quantity"]
                 cost_basis = holding["avg_price"] * holding["quantity"]
                 unrealized_pnl = market_value - cost_basis
@@ -536,39 +537,97 @@ async def get_simulation_leaderboard():
         raise HTTPException(status_code=500, detail="리더보드 조회 실패")
 
 
+def _build_stream_frame(symbols: Optional[tuple], encoding: str):
+    """현재 틱의 stock_update 프레임을 인코딩합니다 (틱·필터·인코딩별로 한 번)."""
+    if symbols:
+        stock_data = {}
+        for symbol in symbols:
+            quote = market_data_hub.get_quote(symbol)
+            if quote is not None:
+                stock_data[symbol] = dict(quote)
+    else:
+        stock_data = market_data_hub.get_all()
+
+    tick = market_data_hub.last_tick
+    message = {
+        "type": "stock_update",
+        "data": stock_data,
+        "timestamp": (tick.timestamp if tick else datetime.now()).isoformat(),
+        "sequence": market_data_hub.sequence,
+    }
+    if encoding == ws_codec.MSGPACK:
+        return ws_codec.pack(message)
+    return json.dumps(message)
+
+
+async def _wait_for_disconnect(websocket: WebSocket):
+    """클라이언트가 연결을 끊을 때까지 수신 메시지를 버립니다."""
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+
+
 @router.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket):
-    """실시간 주식 데이터 WebSocket"""
+async def websocket_endpoint(
+    websocket: WebSocket,
+    encoding: str = ws_codec.JSON,
+    symbols: Optional[str] = None,
+):
+    """실시간 주식 데이터 WebSocket (허브 틱마다 푸시)
+
+    - ?symbols=AAPL,MSFT 로 종목 필터 (기본: 전체 종목)
+    - ?encoding=msgpack 이면 MessagePack 바이너리 프레임(숫자 타임스탬프)으로 전송
+
+    프레임은 틱마다 (필터, 인코딩) 조합별로 한 번만 만들어져 모든 연결이 공유하므로
+    연결 수가 늘어도 틱당 비용은 일정합니다. 느린 연결은 밀린 틱을 건너뜁니다.
+    """
+    encoding = ws_codec.negotiate_encoding(encoding)
+    symbol_filter = (
+        tuple(sorted({s.strip().upper() for s in symbols.split(",") if s.strip()}))
+        if symbols
+        else None
+    )
+    frame_key = ("simulation_ws", symbol_filter, encoding)
     await websocket.accept()
 
+    # 틱을 기다리는 동안에도 연결 종료를 감지
+    disconnected = asyncio.create_task(_wait_for_disconnect(websocket))
     try:
-        # 시뮬레이터 시작
-        if not simulator.is_running:
-            await simulator.start_simulation()
+        # 시장 데이터 허브 시작
+        await market_data_hub.start()
 
+        sequence = market_data_hub.sequence
         while True:
-            # 현재 주식 데이터 전송
-            stock_data = simulator.get_all_stocks()
-            await websocket.send_json(
-                {
-                    "type": "stock_update",
-                    "data": stock_data,
-                    "timestamp": stock_data.get("AAPL", {}).get("timestamp", ""),
-                }
+            frame = market_data_hub.cached_frame(
+                frame_key, lambda: _build_stream_frame(symbol_filter, encoding)
             )
+            if encoding == ws_codec.MSGPACK:
+                await websocket.send_bytes(frame)
+            else:
+                await websocket.send_text(frame)
 
-            # 2초마다 업데이트
-            await asyncio.sleep(2)
+            # 다음 틱까지 대기 (연결별 타이머 없음)
+            next_tick = asyncio.create_task(market_data_hub.wait_for_tick(sequence))
+            await asyncio.wait(
+                {next_tick, disconnected}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if disconnected.done():
+                next_tick.cancel()
+                log_info("WebSocket 연결 종료")
+                break
+            sequence = next_tick.result().sequence
 
     except WebSocketDisconnect:
         log_info("WebSocket 연결 종료")
     except Exception as e:
         log_error(f"WebSocket 오류: {str(e)}")
         await websocket.close()
+    finally:
+        disconnected.cancel()
 
 
 @router.on_event("shutdown")
 async def shutdown_event():
-    """서버 종료 시 시뮬레이터 정리"""
-    if simulator.is_running:
-        await simulator.stop_simulation()
+    """서버 종료 시 시장 데이터 허브 정리"""
+    await market_data_hub.stop()
@@ -0,0 +1,73 @@
+"""
+이상치 알림 저장소
+
+탐지 시각 순으로 쌓이는 알림을 최대 개수가 정해진 deque에 보관하고,
+종목별 보조 인덱스(종목별 deque)를 함께 유지합니다.
+- 추가/만료: 알림 한 건당 O(1) (복사나 재정렬 없음)
+- "종목 X의 최근 N시간 알림" 조회: 최신 알림부터 기준 시각까지만 순회
+"""
+
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, Iterable, Iterator, List, Optional
+
+
+class AlertStore:
+    """최대 개수가 정해진 시간순 알림 저장소 (종목별 인덱스 포함)"""
+
+    def __init__(self, max_alerts: int = 1000):
+        if max_alerts < 1:
+            raise ValueError("max_alerts는 1 이상이어야 합니다")
+        self.max_alerts = max_alerts
+        self._alerts: Deque = deque()
+        self._by_symbol: Dict[str, Deque] = {}
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    def __iter__(self) -> Iterator:
+        """오래된 알림부터 순회합니다."""
+        return iter(self._alerts)
+
+    def add(self, alert) -> None:
+        """알림을 추가합니다 (가득 찬 경우 가장 오래된 알림 제거)."""
+        if len(self._alerts) >= self.max_alerts:
+            self._evict_oldest()
+        self._alerts.append(alert)
+        self._by_symbol.setdefault(alert.symbol, deque()).append(alert)
+
+    def extend(self, alerts: Iterable) -> None:
+        for alert in alerts:
+            self.add(alert)
+
+    def recent(
+        self, symbol: Optional[str] = None, since: Optional[datetime] = None
+    ) -> List:
+        """since 이후 알림을 최신순으로 반환합니다 (symbol이 있으면 해당 종목만)."""
+        alerts = self._alerts if symbol is None else self._by_symbol.get(symbol, ())
+        result = []
+        for alert in reversed(alerts):
+            if since is not None and alert.detected_at < since:
+                break
+            result.append(alert)
+        return result
+
+    def evict_before(self, cutoff: datetime) -> int:
+        """cutoff 이전에 탐지된 알림을 제거하고 제거한 개수를 반환합니다."""
+        removed = 0
+        while self._alerts and self._alerts[0].detected_at < cutoff:
+            self._evict_oldest()
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        self._alerts.clear()
+        self._by_symbol.clear()
+
+    def _evict_oldest(self) -> None:
+        alert = self._alerts.popleft()
+        # 같은 종목 안에서도 시간순이므로 종목 인덱스의 맨 앞이 같은 알림
+        symbol_alerts = self._by_symbol[alert.symbol]
+        symbol_alerts.popleft()
+        if not symbol_alerts:
+            del self._by_symbol[alert.symbol]
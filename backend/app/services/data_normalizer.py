@@ -5,12 +5,17 @@
 """
 
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 
+from app.core.config import settings
+from app.services.alert_store import AlertStore
 from app.services.data_validator import DataSource, ValidationResult, validator
+from app.services.rolling_window import RollingWindow
+from app.services.tick_clock import TickTime
 
 logger = logging.getLogger(__name__)
 
@@ -38,41 +43,92 @@ class AnomalyAlert:
     expected_range: Optional[Tuple[float, float]] = None
 
 
+def _timestamp_epoch(value: Any) -> Optional[float]:
+    """타임스탬프 값을 epoch 초로 변환합니다 (변환할 수 없으면 None)."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    try:
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+            if value.tzinfo is not None:
+                # 검증기와 같이 시간대 표기는 무시
+                value = value.replace(tzinfo=None)
+        if isinstance(value, datetime):
+            return value.timestamp()
+    except ValueError:
+        pass
+    return None
+
+
 class DataNormalizer:
     """데이터 정규화 및 이상치 탐지 클래스"""
 
-    def __init__(self):
-        self.price_history: Dict[str, List[float]] = {}
-        self.volume_history: Dict[str, List[int]] = {}
-        self.anomaly_alerts: List[AnomalyAlert] = []
+    def __init__(self, max_alerts: Optional[int] = None):
+        self.price_history: Dict[str, RollingWindow] = {}
+        self.volume_history: Dict[str, RollingWindow] = {}
+        self.anomaly_alerts = AlertStore(max_alerts or settings.ANOMALY_ALERT_RETENTION)
         self.quality_metrics: Dict[str, DataQualityMetrics] = {}
 
+        # 전체 종목 품질 메트릭 합계 (종목별 메트릭이 바뀔 때 증분 갱신)
+        self._quality_totals = {
+            "validation_rate": 0.0,
+            "anomaly_rate": 0.0,
+            "processing_time": 0.0,
+        }
+        # 품질 보고서 캐시 (틱 주기 동안 재사용)
+        self.report_ttl = settings.SIMULATION_TICK_INTERVAL
+        self._quality_report: Optional[Dict[str, Any]] = None
+        self._quality_report_expires = 0.0
+
         # 이상치 탐지 설정
         self.price_spike_threshold = 0.15  # 15% 이상 변동 시 이상치로 판단
         self.volume_spike_threshold = 5.0  # 평균 거래량의 5배 이상 시 이상치
         self.history_window = 20  # 이력 데이터 윈도우 크기
 
     def normalize_and_validate(
-        self, symbol: str, data: Dict[str, Any], source: DataSource = DataSource.UNKNOWN
+        self,
+        symbol: str,
+        data: Dict[str, Any],
+        source: DataSource = DataSource.UNKNOWN,
+        tick: Optional[TickTime] = None,
     ) -> ValidationResult:
-        """데이터 정규화 및 검증을 수행합니다."""
-        start_time = datetime.now()
+        """데이터 정규화 및 검증을 수행합니다.
+
+        tick이 주어지면 모든 시각 비교와 메타데이터에 틱 기준 시각 하나를
+        사용합니다 (종목마다 datetime.now()/isoformat을 호출하지 않음).
+        """
+        start_ns = time.perf_counter_ns()
+        timestamp_epoch = None
 
         try:
+            # 0. 틱 모드: 입력 타임스탬프를 epoch 숫자로 한 번만 변환
+            if tick is not None and source in validator.TRUSTED_SOURCES:
+                timestamp = data.get("timestamp")
+                # 틱 기준 시각 문자열은 ISO 왕복 시 마이크로초 미만이 잘리므로
+                # 원래 epoch를 그대로 사용
+                if timestamp == tick.iso:
+                    timestamp_epoch = tick.epoch
+                else:
+                    timestamp_epoch = _timestamp_epoch(timestamp)
+                if timestamp_epoch is not None:
+                    data = {**data, "timestamp": timestamp_epoch}
+
             # 1. 기본 검증
-            validation_result = validator.validate_stock_quote(data, source)
+            validation_result = validator.validate_stock_quote(data, source, tick)
 
             if not validation_result.is_valid:
-                self._update_quality_metrics(symbol, False, start_time)
+                self._update_quality_metrics(symbol, False, start_ns, tick=tick)
                 return validation_result
 
             normalized_data = validation_result.normalized_data
 
             # 2. 이상치 탐지
-            anomalies = self._detect_anomalies(symbol, normalized_data)
+            anomalies = self._detect_anomalies(
+                symbol, normalized_data, tick, timestamp_epoch
+            )
 
             # 3. 데이터 정규화 강화
-            enhanced_data = self._enhance_normalization(normalized_data)
+            enhanced_data = self._enhance_normalization(normalized_data, tick)
 
             # 4. 이력 데이터 업데이트
             self._update_history(symbol, enhanced_data)
@@ -83,18 +139,18 @@ class DataNormalizer:
                     [alert.message for alert in anomalies]
                 )
                 self.anomaly_alerts.extend(anomalies)
-                # 최근 50개 알림만 유지
-                self.anomaly_alerts = self.anomaly_alerts[-50:]
 
             # 6. 품질 메트릭 업데이트
-            self._update_quality_metrics(symbol, True, start_time, len(anomalies) > 0)
+            self._update_quality_metrics(
+                symbol, True, start_ns, len(anomalies) > 0, tick=tick
+            )
 
             validation_result.normalized_data = enhanced_data
             return validation_result
 
         except Exception as e:
             logger.error(f"데이터 정규화 중 오류 발생 ({symbol}): {e}")
-            self._update_quality_metrics(symbol, False, start_time)
+            self._update_quality_metrics(symbol, False, start_ns, tick=tick)
             return ValidationResult(
                 is_valid=False,
                 errors=[f"정규화 처리 오류: {str(e)}"],
@@ -102,20 +158,84 @@ class DataNormalizer:
                 normalized_data=None,
             )
 
+    def normalize_batch(
+        self,
+        batch,
+        source: DataSource = DataSource.UNKNOWN,
+        tick: Optional[TickTime] = None,
+    ) -> List[Any]:
+        """한 틱의 여러 종목을 열 단위로 한 번에 정규화 및 검증합니다.
+
+        batch는 QuoteBatch 또는 시세 딕셔너리 목록이며, 입력 순서대로
+        ValidationResult와 같은 속성을 가진 행별 결과를 반환합니다.
+        """
+        from app.services.quote_batch import (
+            BatchRowResult,
+            QuoteBatch,
+            validate_quote_batch,
+        )
+
+        start_ns = time.perf_counter_ns()
+        tick = tick or TickTime()
+        if not isinstance(batch, QuoteBatch):
+            batch = QuoteBatch.from_records(batch)
+
+        # 1. 범위/논리 검증과 품질 점수를 배열 단위로 계산
+        checked = validate_quote_batch(batch, now=tick.epoch)
+        quality_scores = checked.quality_scores()
+        validated_at = tick.iso
+
+        results: List[BatchRowResult] = []
+        outcomes: List[Tuple[str, bool, bool]] = []
+        for row, symbol in enumerate(checked.symbols):
+            if checked.errors[row]:
+                results.append(BatchRowResult(False, None, checked.row_errors(row)))
+                outcomes.append((symbol, False, False))
+                continue
+
+            # 2. 행별 이상치 탐지 및 이력 업데이트 (종목별 링 버퍼)
+            data = checked.record(row, source.value, validated_at)
+            anomalies = self._detect_anomalies(
+                symbol, data, tick, float(batch.timestamp[row])
+            )
+            data["normalized_at"] = validated_at
+            data["data_quality"] = float(quality_scores[row])
+            self._update_history(symbol, data)
+
+            warnings = checked.row_warnings(row)
+            if anomalies:
+                warnings += tuple(alert.message for alert in anomalies)
+                self.anomaly_alerts.extend(anomalies)
+            results.append(BatchRowResult(True, data, (), warnings))
+            outcomes.append((symbol, True, bool(anomalies)))
+
+        # 3. 처리 시간은 배치 전체를 행 수로 나눠 기록
+        elapsed = (time.perf_counter_ns() - start_ns) / 1_000_000
+        per_row = elapsed / len(outcomes) if outcomes else 0.0
+        for symbol, success, has_anomaly in outcomes:
+            self._record_quality_metrics(
+                symbol, success, per_row, has_anomaly, tick.datetime
+            )
+
+        return results
+
     def _detect_anomalies(
-        self, symbol: str, data: Dict[str, Any]
+        self,
+        symbol: str,
+        data: Dict[str, Any],
+        tick: Optional[TickTime] = None,
+        timestamp_epoch: Optional[float] = None,
     ) -> List[AnomalyAlert]:
         """이상치 탐지를 수행합니다."""
         anomalies = []
-        current_time = datetime.now()
+        current_time = tick.datetime if tick is not None else datetime.now()
 
         # 가격 이상치 탐지
         current_price = data.get("price")
         if current_price and symbol in self.price_history:
             price_history = self.price_history[symbol]
             if len(price_history) >= 3:
-                recent_prices = price_history[-3:]
-                avg_price = sum(recent_prices) / len(recent_prices)
+                avg_price = price_history.tail_mean(3)
 
                 price_change_rate = abs(current_price - avg_price) / avg_price
 
@@ -138,7 +258,7 @@ class DataNormalizer:
         if current_volume and symbol in self.volume_history:
             volume_history = self.volume_history[symbol]
             if len(volume_history) >= 5:
-                avg_volume = sum(volume_history[-5:]) / 5
+                avg_volume = volume_history.tail_mean(5)
 
                 if (
                     avg_volume > 0
@@ -157,17 +277,24 @@ class DataNormalizer:
                     )
 
         # 데이터 무결성 검사
-        integrity_anomaly = self._check_data_integrity(symbol, data)
+        integrity_anomaly = self._check_data_integrity(
+            symbol, data, current_time, tick, timestamp_epoch
+        )
         if integrity_anomaly:
             anomalies.append(integrity_anomaly)
 
         return anomalies
 
     def _check_data_integrity(
-        self, symbol: str, data: Dict[str, Any]
+        self,
+        symbol: str,
+        data: Dict[str, Any],
+        current_time: Optional[datetime] = None,
+        tick: Optional[TickTime] = None,
+        timestamp_epoch: Optional[float] = None,
     ) -> Optional[AnomalyAlert]:
         """데이터 무결성을 검사합니다."""
-        current_time = datetime.now()
+        current_time = current_time or datetime.now()
 
         # 가격 논리 검사
         price = data.get("price")
@@ -187,7 +314,19 @@ class DataNormalizer:
 
         # 타임스탬프 검사
         timestamp = data.get("timestamp")
-        if timestamp:
+        if timestamp and tick is not None and timestamp_epoch is not None:
+            # 틱 모드: 이미 변환된 epoch 값으로 비교 (문자열 재파싱 없음)
+            time_diff = abs(tick.epoch - timestamp_epoch)
+            if time_diff > 300:
+                return AnomalyAlert(
+                    symbol=symbol,
+                    type="data_corruption",
+                    severity="medium",
+                    message=f"타임스탬프 이상: {time_diff:.0f}초 차이",
+                    detected_at=current_time,
+                    current_value=timestamp,
+                )
+        elif timestamp:
             try:
                 if isinstance(timestamp, str):
                     data_time = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
@@ -217,7 +356,9 @@ class DataNormalizer:
 
         return None
 
-    def _enhance_normalization(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _enhance_normalization(
+        self, data: Dict[str, Any], tick: Optional[TickTime] = None
+    ) -> Dict[str, Any]:
         """데이터 정규화를 강화합니다."""
         enhanced_data = data.copy()
 
@@ -240,14 +381,16 @@ class DataNormalizer:
             enhanced_data["volume"] = int(enhanced_data["volume"])
 
         # 추가 메타데이터
-        enhanced_data["normalized_at"] = datetime.now().isoformat()
-        enhanced_data["data_quality"] = self._calculate_data_quality_score(
+        enhanced_data["normalized_at"] = (
+            tick.iso if tick is not None else datetime.now().isoformat()
+        )
+        enhanced_data["data_quality"] = self.calculate_data_quality_score(
             enhanced_data
         )
 
         return enhanced_data
 
-    def _calculate_data_quality_score(self, data: Dict[str, Any]) -> float:
+    def calculate_data_quality_score(self, data: Dict[str, Any]) -> float:
         """데이터 품질 점수를 계산합니다 (0-100)."""
         score = 100.0
 
@@ -273,79 +416,108 @@ class DataNormalizer:
         return max(0.0, min(100.0, score))
 
     def _update_history(self, symbol: str, data: Dict[str, Any]):
-        """이력 데이터를 업데이트합니다."""
-        # 가격 이력 업데이트
-        if "price" in data and data["price"] is not None:
-            if symbol not in self.price_history:
-                self.price_history[symbol] = []
-
-            self.price_history[symbol].append(float(data["price"]))
-            # 윈도우 크기 유지
-            if len(self.price_history[symbol]) > self.history_window:
-                self.price_history[symbol] = self.price_history[symbol][
-                    -self.history_window :
-                ]
-
-        # 거래량 이력 업데이트
-        if "volume" in data and data["volume"] is not None:
-            if symbol not in self.volume_history:
-                self.volume_history[symbol] = []
-
-            self.volume_history[symbol].append(int(data["volume"]))
-            # 윈도우 크기 유지
-            if len(self.volume_history[symbol]) > self.history_window:
-                self.volume_history[symbol] = self.volume_history[symbol][
-                    -self.history_window :
-                ]
+        """이력 데이터를 업데이트합니다 (고정 크기 링 버퍼)."""
+        price = data.get("price")
+        if price is not None:
+            history = self.price_history.get(symbol)
+            if history is None:
+                history = self.price_history[symbol] = RollingWindow(
+                    self.history_window
+                )
+            history.append(float(price))
+
+        volume = data.get("volume")
+        if volume is not None:
+            history = self.volume_history.get(symbol)
+            if history is None:
+                history = self.volume_history[symbol] = RollingWindow(
+                    self.history_window
+                )
+            history.append(int(volume))
+
+    def get_history_stats(self, symbol: str) -> Dict[str, Any]:
+        """종목의 가격/거래량 이동 통계를 조회합니다."""
+        stats = {}
+        for name, histories in (
+            ("price", self.price_history),
+            ("volume", self.volume_history),
+        ):
+            history = histories.get(symbol)
+            if history is not None:
+                stats[name] = {
+                    "count": len(history),
+                    "mean": history.mean,
+                    "std": history.std,
+                    "last": history[-1],
+                }
+        return stats
 
     def _update_quality_metrics(
         self,
         symbol: str,
         success: bool,
-        start_time: datetime,
+        start_ns: int,
         has_anomaly: bool = False,
+        tick: Optional[TickTime] = None,
     ):
-        """품질 메트릭을 업데이트합니다."""
-        processing_time = (datetime.now() - start_time).total_seconds() * 1000
+        """품질 메트릭을 업데이트합니다 (start_ns: perf_counter_ns 시작값)."""
+        processing_time = (time.perf_counter_ns() - start_ns) / 1_000_000
+        self._record_quality_metrics(
+            symbol,
+            success,
+            processing_time,
+            has_anomaly,
+            tick.datetime if tick is not None else None,
+        )
 
-        if symbol not in self.quality_metrics:
+    def _record_quality_metrics(
+        self,
+        symbol: str,
+        success: bool,
+        processing_time: float,
+        has_anomaly: bool = False,
+        updated_at: Optional[datetime] = None,
+    ):
+        """처리 결과 한 건을 종목별 품질 메트릭에 반영합니다."""
+        updated_at = updated_at or datetime.now()
+        success_value = 1.0 if success else 0.0
+        anomaly_value = 1.0 if has_anomaly else 0.0
+        metrics = self.quality_metrics.get(symbol)
+        totals = self._quality_totals
+
+        if metrics is None:
             self.quality_metrics[symbol] = DataQualityMetrics(
-                validation_rate=1.0 if success else 0.0,
-                anomaly_rate=1.0 if has_anomaly else 0.0,
+                validation_rate=success_value,
+                anomaly_rate=anomaly_value,
                 processing_time=processing_time,
-                last_updated=datetime.now(),
+                last_updated=updated_at,
             )
+            totals["validation_rate"] += success_value
+            totals["anomaly_rate"] += anomaly_value
+            totals["processing_time"] += processing_time
         else:
-            metrics = self.quality_metrics[symbol]
-            # 이동 평균 업데이트 (최근 100개 기준)
+            # 이동 평균 업데이트 (최근 100개 기준), 합계에는 변화량만 반영
             alpha = 0.01  # 가중치
-            metrics.validation_rate = (1 - alpha) * metrics.validation_rate + alpha * (
-                1.0 if success else 0.0
-            )
-            metrics.anomaly_rate = (1 - alpha) * metrics.anomaly_rate + alpha * (
-                1.0 if has_anomaly else 0.0
-            )
-            metrics.processing_time = (
-                1 - alpha
-            ) * metrics.processing_time + alpha * processing_time
-            metrics.last_updated = datetime.now()
+            delta = alpha * (success_value - metrics.validation_rate)
+            metrics.validation_rate += delta
+            totals["validation_rate"] += delta
+
+            delta = alpha * (anomaly_value - metrics.anomaly_rate)
+            metrics.anomaly_rate += delta
+            totals["anomaly_rate"] += delta
+
+            delta = alpha * (processing_time - metrics.processing_time)
+            metrics.processing_time += delta
+            totals["processing_time"] += delta
+
+            metrics.last_updated = updated_at
 
     def get_recent_anomalies(
         self, symbol: Optional[str] = None, hours: int = 24
     ) -> List[AnomalyAlert]:
-        """최근 이상치 알림을 조회합니다."""
+        """최근 이상치 알림을 조회합니다 (최신순)."""
         cutoff_time = datetime.now() - timedelta(hours=hours)
-
-        filtered_alerts = [
-            alert for alert in self.anomaly_alerts if alert.detected_at >= cutoff_time
-        ]
-
-        if symbol:
-            filtered_alerts = [
-                alert for alert in filtered_alerts if alert.symbol == symbol
-            ]
-
-        return sorted(filtered_alerts, key=lambda x: x.detected_at, reverse=True)
+        return self.anomaly_alerts.recent(symbol, since=cutoff_time)
 
     def get_quality_metrics(
         self, symbol: Optional[str] = None
@@ -359,14 +531,69 @@ class DataNormalizer:
             )
         return self.quality_metrics.copy()
 
+    def get_quality_summary(self) -> Dict[str, Any]:
+        """전체 종목 평균 품질 메트릭 (증분 합계 기준, O(1))"""
+        total_symbols = len(self.quality_metrics)
+        totals = self._quality_totals
+
+        def average(name: str) -> float:
+            return totals[name] / total_symbols if total_symbols else 0
+
+        return {
+            "total_symbols": total_symbols,
+            "avg_validation_rate": round(average("validation_rate"), 4),
+            "avg_anomaly_rate": round(average("anomaly_rate"), 4),
+            "avg_processing_time_ms": round(average("processing_time"), 2),
+        }
+
+    def get_quality_report(self) -> Dict[str, Any]:
+        """데이터 품질 보고서를 반환합니다.
+
+        만든 보고서는 report_ttl(틱 주기) 동안 그대로 재사용되므로,
+        여러 대시보드 클라이언트가 동시에 요청해도 한 번만 생성됩니다.
+        반환된 딕셔너리는 공유되므로 수정하지 않아야 합니다.
+        """
+        now = time.monotonic()
+        if self._quality_report is not None and now < self._quality_report_expires:
+            return self._quality_report
+
+        recent_anomalies = self.get_recent_anomalies(hours=1)
+        summary = self.get_quality_summary()
+        summary["recent_anomalies_count"] = len(recent_anomalies)
+
+        self._quality_report = {
+            "summary": summary,
+            "per_symbol_metrics": {
+                symbol: {
+                    "validation_rate": round(metrics.validation_rate, 4),
+                    "anomaly_rate": round(metrics.anomaly_rate, 4),
+                    "processing_time_ms": round(metrics.processing_time, 2),
+                    "last_updated": metrics.last_updated.isoformat(),
+                }
+                for symbol, metrics in self.quality_metrics.items()
+            },
+            "recent_anomalies": [
+                {
+                    "symbol": alert.symbol,
+                    "type": alert.type,
+                    "severity": alert.severity,
+                    "message": alert.message,
+                    "detected_at": alert.detected_at.isoformat(),
+                    "current_value": alert.current_value,
+                }
+                for alert in recent_anomalies[:10]  # 최근 10개만
+            ],
+            "timestamp": datetime.now().isoformat(),
+        }
+        self._quality_report_expires = now + self.report_ttl
+        return self._quality_report
+
     def clear_old_data(self, hours: int = 168):  # 기본 7일
         """오래된 데이터를 정리합니다."""
         cutoff_time = datetime.now() - timedelta(hours=hours)
 
         # 오래된 이상치 알림 제거
-        self.anomaly_alerts = [
-            alert for alert in self.anomaly_alerts if alert.detected_at >= cutoff_time
-        ]
+        self.anomaly_alerts.evict_before(cutoff_time)
 
         logger.info(f"오래된 데이터 정리 완료: {cutoff_time} 이전 데이터 제거")
 
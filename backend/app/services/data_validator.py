@@ -59,8 +59,17 @@ class StockDataValidator:
     MIN_CHANGE_PERCENT = -100.0
     MAX_CHANGE_PERCENT = 1000.0
 
+    # 숫자 타입이 보장되는 내부 소스 (빠른 검증 경로 사용)
+    TRUSTED_SOURCES = frozenset({DataSource.MOCK})
+
+    _PRICE_FIELDS = ("price", "open", "high", "low", "previous_close")
+    _FLOAT_MIN_PRICE = float(MIN_PRICE)
+    _FLOAT_MAX_PRICE = float(MAX_PRICE)
+
     def __init__(self):
         self.anomaly_threshold = 3.0  # 이상치 탐지 임계값 (표준편차 배수)
+        # 패턴 검사를 통과한 심볼 (빠른 경로에서 정규식 재실행 생략)
+        self._valid_symbols: set = set()
 
     def validate_symbol(self, symbol: str) -> ValidationResult:
         """주식 심볼 검증"""
@@ -303,9 +312,25 @@ class StockDataValidator:
             return deviation > (price_range * 0.5)  # 50% 이상 벗어나면 이상치
 
     def validate_stock_quote(
-        self, data: Dict[str, Any], source: DataSource = DataSource.UNKNOWN
+        self,
+        data: Dict[str, Any],
+        source: DataSource = DataSource.UNKNOWN,
+        tick: Optional[Any] = None,
     ) -> ValidationResult:
-        """전체 주식 시세 데이터 검증"""
+        """전체 주식 시세 데이터 검증
+
+        tick(TickTime)이 주어지면 내부 소스 검증에서 틱 기준 시각을 공유하고
+        epoch 숫자 타임스탬프도 받습니다.
+        """
+        if source in self.TRUSTED_SOURCES:
+            result = self._validate_trusted_quote(data, source, tick)
+            if result is not None:
+                return result
+            timestamp = data.get("timestamp")
+            if tick is not None and isinstance(timestamp, (int, float)):
+                # 엄격한 경로는 문자열/datetime 타임스탬프만 처리
+                data = {**data, "timestamp": tick.format(timestamp)}
+
         all_errors = []
         all_warnings = []
         normalized_data = {}
@@ -392,6 +417,141 @@ class StockDataValidator:
 
         return ValidationResult(is_valid, all_errors, all_warnings, normalized_data)
 
+    def _validate_trusted_quote(
+        self, data: Dict[str, Any], source: DataSource, tick: Optional[Any] = None
+    ) -> Optional[ValidationResult]:
+        """내부 소스용 빠른 검증 (validate_stock_quote와 같은 규칙과 결과)
+
+        값이 이미 숫자인 경우 Decimal/정규식 변환 없이 float로 검사/반올림하고
+        (배치 경로와 같은 규칙, 내부 소스 가격은 이미 소수점 둘째 자리),
+        타임스탬프는 fromisoformat 한 번으로 파싱합니다. 숫자가 아닌 값이
+        있으면 None을 반환하여 엄격한 경로로 처리하게 합니다.
+        """
+        if "symbol" not in data or "price" not in data:
+            return None
+
+        errors: List[str] = []
+        warnings: List[str] = []
+        normalized: Dict[str, Any] = {}
+
+        symbol = data["symbol"]
+        if not symbol or not isinstance(symbol, str):
+            return None
+        symbol = symbol.strip().upper()
+        if symbol not in self._valid_symbols:
+            if self.SYMBOL_PATTERN.match(symbol):
+                self._valid_symbols.add(symbol)
+            else:
+                errors.append(f"유효하지 않은 심볼 형식: {symbol}")
+        normalized["symbol"] = symbol
+
+        for field in self._PRICE_FIELDS:
+            value = data.get(field)
+            if value is None:
+                if field == "price":
+                    return None
+                continue
+            if type(value) not in (float, int):
+                return None
+            if value < self._FLOAT_MIN_PRICE:
+                errors.append(
+                    f"{field}이 최소값({self.MIN_PRICE})보다 작습니다: {value}"
+                )
+            elif value > self._FLOAT_MAX_PRICE:
+                errors.append(f"{field}이 최대값({self.MAX_PRICE})보다 큽니다: {value}")
+            rounded = round(float(value), 2)
+            normalized[field] = rounded if rounded else None
+
+        volume = data.get("volume")
+        if volume is not None:
+            if type(volume) not in (int, float):
+                return None
+            volume = int(volume)
+            if volume < self.MIN_VOLUME:
+                errors.append(f"거래량이 음수입니다: {volume}")
+            elif volume > self.MAX_VOLUME:
+                warnings.append(f"거래량이 매우 큽니다: {volume:,}")
+            normalized["volume"] = volume
+
+        change_percent = data.get("change_percent")
+        if change_percent is not None:
+            if type(change_percent) not in (float, int):
+                return None
+            change_percent = float(change_percent)
+            if change_percent < self.MIN_CHANGE_PERCENT:
+                errors.append(f"change_percent이 허용 범위를 벗어남: {change_percent}%")
+            elif change_percent > self.MAX_CHANGE_PERCENT:
+                warnings.append(f"change_percent이 매우 큽니다: {change_percent}%")
+            normalized["change_percent"] = round(change_percent, 4)
+
+        now = tick.datetime if tick is not None else None
+        for field in ("timestamp", "latest_trading_day"):
+            value = data.get(field)
+            if value is None:
+                continue
+            if tick is not None and type(value) in (float, int):
+                # 틱 모드: epoch 숫자로 비교하고 ISO 문자열은 한 번만 생성
+                if value > tick.epoch + 86400:
+                    warnings.append(f"미래 날짜입니다: {datetime.fromtimestamp(value)}")
+                elif value < tick.epoch - 3650 * 86400:
+                    warnings.append(
+                        f"너무 오래된 날짜입니다: {datetime.fromtimestamp(value)}"
+                    )
+                normalized[field] = tick.format(value)
+                continue
+            if isinstance(value, str):
+                try:
+                    parsed = datetime.fromisoformat(value)
+                except ValueError:
+                    return None
+                if parsed.tzinfo is not None:
+                    # 엄격한 경로와 같이 시간대 표기는 무시
+                    parsed = parsed.replace(tzinfo=None)
+            elif isinstance(value, datetime):
+                parsed = value
+            else:
+                return None
+
+            now = now or datetime.now()
+            if parsed > now + timedelta(days=1):
+                warnings.append(f"미래 날짜입니다: {parsed}")
+            elif parsed < now - timedelta(days=3650):
+                warnings.append(f"너무 오래된 날짜입니다: {parsed}")
+            normalized[field] = parsed.isoformat()
+
+        if data.get("name"):
+            normalized["name"] = str(data["name"])
+
+        # 논리적 일관성 (_validate_logical_consistency와 동일)
+        price = normalized.get("price")
+        high = normalized.get("high")
+        low = normalized.get("low")
+        open_price = normalized.get("open")
+        if high is not None and low is not None and high < low:
+            errors.append(f"고가({high})가 저가({low})보다 낮습니다")
+        if price is not None:
+            if high is not None and price > high:
+                warnings.append(f"현재가({price})가 고가({high})보다 높습니다")
+            if low is not None and price < low:
+                warnings.append(f"현재가({price})가 저가({low})보다 낮습니다")
+        if open_price is not None:
+            if high is not None and open_price > high:
+                warnings.append(f"시가({open_price})가 고가({high})보다 높습니다")
+            if low is not None and open_price < low:
+                warnings.append(f"시가({open_price})가 저가({low})보다 낮습니다")
+
+        normalized["source"] = source.value
+        normalized["validated_at"] = (
+            tick.iso if tick is not None else (now or datetime.now()).isoformat()
+        )
+
+        if warnings:
+            logger.warning(
+                f"데이터 검증 경고 ({data.get('symbol', 'Unknown')}): {', '.join(warnings)}"
+            )
+
+        return ValidationResult(not errors, errors, warnings, normalized)
+
     def _validate_logical_consistency(self, data: Dict[str, Any]) -> ValidationResult:
         """논리적 일관성 검증"""
         errors = []
@@ -9,6 +9,8 @@ from typing import Any, Dict, List, Optional, Union
 import aiohttp
 
 from app.core.config import settings
+from app.core.http_client import http_clients
+from app.core.rate_limiter import rate_limiters
 
 logger = logging.getLogger(__name__)
 
@@ -28,12 +30,12 @@ class KISClient:
         self.session: Optional[aiohttp.ClientSession] = None
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        # 공유 커넥션 풀의 세션을 사용 (닫지 않고 재사용)
+        self.session = http_clients.session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        self.session = None
 
     async def get_access_token(self, force_refresh: bool = False) -> str:
         """OAuth2 액세스 토큰 발급"""
@@ -70,23 +72,25 @@ class KISClient:
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        url, headers=headers, json=body
-                    ) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            self.access_token = data.get("access_token")
-                            self.token_expires = datetime.now() + timedelta(
-                                seconds=3600
-                            )  # 1시간 후 만료
-                            logger.info("KIS API 액세스 토큰 발급 성공")
-                            return self.access_token
-                        else:
-                            error_text = await response.text()
-                            logger.error(
-                                f"KIS API 토큰 발급 실패 (시도 {attempt + 1}/{max_retries}): {error_text}"
-                            )
+                # 토큰 발급 엔드포인트는 별도 한도 (1분 1회)
+                await rate_limiters.acquire("kis", "/oauth2/tokenP")
+                session = http_clients.session()
+                async with session.post(
+                    http_clients.url(url), headers=headers, json=body
+                ) as response:
+                    if response.status == 200:
+                        data = await response.json()
+                        self.access_token = data.get("access_token")
+                        self.token_expires = datetime.now() + timedelta(
+                            seconds=3600
+                        )  # 1시간 후 만료
+                        logger.info("KIS API 액세스 토큰 발급 성공")
+                        return self.access_token
+                    else:
+                        error_text = await response.text()
+                        logger.error(
+                            f"KIS API 토큰 발급 실패 (시도 {attempt + 1}/{max_retries}): {error_text}"
+                        )
 
             except Exception as e:
                 logger.error(
@@ -109,8 +113,7 @@ class KISClient:
         retry: bool = True,
     ) -> Dict[str, Any]:
         """KIS API에 요청을 보내는 내부 메서드"""
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        session = self.session or http_clients.session()
 
         # 기본 헤더 설정
         request_headers = {
@@ -127,9 +130,16 @@ class KISClient:
 
         url = f"{self.BASE_URL}{endpoint}"
 
+        # KIS 초당 호출 한도 (한도가 찰 때까지 대기)
+        await rate_limiters.acquire("kis")
+
         try:
-            async with self.session.request(
-                method, url, headers=request_headers, params=params, json=data
+            async with session.request(
+                method,
+                http_clients.url(url),
+                headers=request_headers,
+                params=params,
+                json=data,
             ) as response:
                 if response.status == 200:
                     return await response.json()
@@ -0,0 +1,66 @@
+"""
+지연 시간 히스토그램
+
+로그 간격(1ms ~ 60s, 버킷마다 25%씩 증가)의 고정 버킷에 응답 시간을 세어
+백분위를 O(버킷 수)로 계산합니다. 샘플 목록을 보관하지 않으므로 메모리가 일정하고,
+전체 개수가 max_count를 넘으면 모든 버킷을 절반으로 줄여 오래된 샘플의
+비중을 낮춥니다 (계단식 지수 감쇠).
+"""
+
+import bisect
+import math
+from typing import Dict, List
+
+_MIN_SECONDS = 0.001
+_MAX_SECONDS = 60.0
+_GROWTH = 1.25
+
+
+def _build_bounds() -> List[float]:
+    count = math.ceil(math.log(_MAX_SECONDS / _MIN_SECONDS, _GROWTH)) + 1
+    return [_MIN_SECONDS * _GROWTH**i for i in range(count)]
+
+
+# 버킷 상한 (초). 마지막 버킷은 _MAX_SECONDS 이상 전부
+BUCKET_BOUNDS = _build_bounds()
+
+
+class LatencyHistogram:
+    """로그 버킷 기반 지연 시간 히스토그램"""
+
+    __slots__ = ("_counts", "count", "max_count")
+
+    def __init__(self, max_count: int = 1000):
+        self._counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.max_count = max_count
+
+    def record(self, seconds: float) -> None:
+        self._counts[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        if self.count > self.max_count:
+            self._decay()
+
+    def _decay(self) -> None:
+        self._counts = [c // 2 for c in self._counts]
+        self.count = sum(self._counts)
+
+    def percentile(self, p: float) -> float:
+        """p(0~1) 백분위 지연 시간 (해당 버킷의 상한, 샘플이 없으면 0)"""
+        if self.count == 0:
+            return 0.0
+        target = max(1, math.ceil(self.count * p))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= target:
+                return BUCKET_BOUNDS[min(index, len(BUCKET_BOUNDS) - 1)]
+        return BUCKET_BOUNDS[-1]
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "p50": round(self.percentile(0.5), 4),
+            "p95": round(self.percentile(0.95), 4),
+            "p99": round(self.percentile(0.99), 4),
+        }
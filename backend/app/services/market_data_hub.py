@@ -0,0 +1,215 @@
+"""
+시장 데이터 허브
+
+프로세스 전체에서 하나의 시뮬레이터와 하나의 틱 루프만 사용하도록
+시뮬레이션 가격을 소유하고, 틱이 계산될 때마다 연결된 소비자
+(Socket.IO, 시뮬레이션 API 등)에게 알립니다.
+소비자 수와 관계없이 틱은 주기마다 한 번만 계산됩니다.
+
+푸시 방식 소비자는 wait_for_tick으로 다음 틱을 기다리고, cached_frame으로
+틱마다 한 번만 인코딩된 프레임을 공유합니다.
+
+여러 워커가 백플레인으로 연결되면 리더 워커의 허브만 틱을 계산합니다.
+팔로워 허브는 틱 루프를 시작하지 않고, 리더가 발행한 시세(apply_remote_tick)를
+현재 가격으로 제공하므로 모든 워커의 REST/거래/스트림 가격이 같습니다.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+from app.core.config import settings
+from app.services.stock_simulator import StockDataSimulator, stock_simulator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MarketTick:
+    """틱 알림"""
+
+    sequence: int
+    timestamp: datetime
+    symbols: List[str] = field(default_factory=list)
+
+
+TickListener = Callable[[MarketTick], Awaitable[None]]
+
+
+class MarketDataHub:
+    """시뮬레이션 가격을 소유하는 단일 시장 데이터 허브"""
+
+    def __init__(self, simulator: StockDataSimulator, tick_interval: float = 2.0):
+        self.simulator = simulator
+        self.tick_interval = tick_interval
+
+        self._listeners: Dict[str, TickListener] = {}
+        self._task: Optional[asyncio.Task] = None
+
+        # 리더만 틱을 계산 (팔로워는 리더가 발행한 시세를 사용)
+        self.is_leader = True
+        self.remote_quotes: Dict[str, Dict] = {}
+
+        self.sequence = 0
+        self.last_tick: Optional[MarketTick] = None
+
+        # 다음 틱 대기용 이벤트 (틱마다 새 이벤트로 교체)
+        self._tick_event = asyncio.Event()
+        # 현재 틱에서 인코딩된 프레임 캐시
+        self._frames: Dict[Hashable, Any] = {}
+        self._frames_sequence = 0
+
+    @property
+    def is_running(self) -> bool:
+        """틱 루프 실행 여부"""
+        return self._task is not None and not self._task.done()
+
+    def attach(self, name: str, listener: TickListener) -> None:
+        """틱 소비자를 연결합니다 (같은 이름이면 교체)."""
+        self._listeners[name] = listener
+        logger.info(f"시장 데이터 허브 소비자 연결: {name}")
+
+    def detach(self, name: str) -> None:
+        """틱 소비자 연결을 해제합니다."""
+        if self._listeners.pop(name, None) is not None:
+            logger.info(f"시장 데이터 허브 소비자 해제: {name}")
+
+    def set_leader(self, is_leader: bool) -> None:
+        """백플레인 역할을 반영합니다 (팔로워는 start()를 호출해도 틱을 계산하지 않음)."""
+        self.is_leader = is_leader
+
+    async def start(self) -> None:
+        """틱 루프를 시작합니다 (이미 실행 중이거나 팔로워면 무시)."""
+        if self.is_running or not self.is_leader:
+            return
+
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"시장 데이터 허브 시작 (주기: {self.tick_interval}초)")
+
+    async def stop(self) -> None:
+        """틱 루프를 중지합니다."""
+        if not self.is_running:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        logger.info("시장 데이터 허브 중지")
+
+    def get_quote(self, symbol: str) -> Optional[Dict]:
+        """현재 가격을 조회합니다 (틱을 전진시키지 않음, 팔로워는 리더의 시세)."""
+        if not self.is_leader:
+            return self.remote_quotes.get(symbol)
+        return self.simulator.get_stock_data(symbol)
+
+    def ensure_symbol(self, symbol: str) -> Optional[Dict]:
+        """종목이 없으면 시뮬레이터에 추가하고 현재 데이터를 반환합니다.
+
+        팔로워는 종목을 추가하지 않고 리더의 시세를 반환합니다. 리더의 시세가
+        아직 없으면 시뮬레이터의 초기 데이터(없으면 None)를 반환합니다.
+        """
+        if not self.is_leader:
+            quote = self.remote_quotes.get(symbol)
+            return quote if quote is not None else self.simulator.get_stock_data(symbol)
+
+        data = self.simulator.get_stock_data(symbol)
+        if data is None:
+            data = self.simulator.get_real_time_data(symbol)
+        return data
+
+    def get_all(self) -> Dict[str, Dict]:
+        """모든 종목의 현재 데이터를 반환합니다 (팔로워는 리더의 시세)."""
+        if not self.is_leader:
+            return dict(self.remote_quotes)
+        return self.simulator.get_all_stocks()
+
+    def tick(self) -> MarketTick:
+        """전체 종목을 한 틱 전진시키고 틱 정보를 반환합니다."""
+        self.simulator.advance()
+        return self._publish_tick(
+            self.sequence + 1, datetime.now(), list(self.simulator.stock_data)
+        )
+
+    def apply_remote_tick(
+        self, sequence: int, timestamp: datetime, quotes: Dict[str, Dict]
+    ) -> MarketTick:
+        """리더가 발행한 틱의 시세를 현재 가격으로 반영합니다 (팔로워)."""
+        self.remote_quotes.update(quotes)
+        # 리더가 바뀌어 sequence가 줄어도 대기 중인 소비자는 깨어나도록 단조 증가 유지
+        return self._publish_tick(
+            max(sequence, self.sequence + 1), timestamp, list(quotes)
+        )
+
+    def _publish_tick(
+        self, sequence: int, timestamp: datetime, symbols: List[str]
+    ) -> MarketTick:
+        self.sequence = sequence
+        self.last_tick = MarketTick(
+            sequence=sequence, timestamp=timestamp, symbols=symbols
+        )
+
+        # 다음 틱을 기다리던 소비자를 깨움
+        event, self._tick_event = self._tick_event, asyncio.Event()
+        event.set()
+        return self.last_tick
+
+    async def wait_for_tick(self, after: int) -> MarketTick:
+        """sequence가 after보다 큰 틱이 계산될 때까지 기다립니다.
+
+        이미 지난 틱이 있으면 바로 최신 틱을 반환하므로, 느린 소비자는 밀린 틱을
+        건너뛰고 항상 최신 상태만 받습니다.
+        """
+        while self.sequence <= after:
+            await self._tick_event.wait()
+        return self.last_tick
+
+    def cached_frame(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """현재 틱의 프레임을 key별로 한 번만 만들어 모든 연결이 공유합니다."""
+        if self._frames_sequence != self.sequence:
+            self._frames.clear()
+            self._frames_sequence = self.sequence
+
+        frame = self._frames.get(key)
+        if frame is None:
+            frame = self._frames[key] = build()
+        return frame
+
+    async def _run(self) -> None:
+        """틱 루프"""
+        try:
+            while True:
+                try:
+                    tick = self.tick()
+                    await self._notify(tick)
+                except Exception as e:
+                    logger.error(f"시장 데이터 틱 처리 중 오류: {str(e)}")
+
+                await asyncio.sleep(self.tick_interval)
+        except asyncio.CancelledError:
+            logger.info("시장 데이터 허브 틱 루프가 취소되었습니다.")
+            raise
+
+    async def _notify(self, tick: MarketTick) -> None:
+        """연결된 모든 소비자에게 틱을 동시에 전달합니다."""
+        if not self._listeners:
+            return
+
+        names = list(self._listeners)
+        results = await asyncio.gather(
+            *(self._listeners[name](tick) for name in names),
+            return_exceptions=True,
+        )
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.error(f"틱 소비자 오류 ({name}): {str(result)}")
+
+
+# 전역 시장 데이터 허브 (프로세스당 하나의 시뮬레이터)
+market_data_hub = MarketDataHub(
+    stock_simulator, tick_interval=settings.SIMULATION_TICK_INTERVAL
+)
@@ -0,0 +1,272 @@
+"""
+확률적 가격 모델
+
+시뮬레이터에서 사용할 가격 경로 생성 모델을 제공합니다.
+- GBM (기하 브라운 운동)
+- Merton 점프-확산
+- Ornstein-Uhlenbeck (평균 회귀, 로그 가격 기준)
+
+모든 모델은 틱을 한 개씩이 아니라 블록 단위로 일괄 생성하며,
+종목별로 시드가 고정된 난수 생성기를 사용하므로 같은 시드와 블록 크기로
+실행하면 항상 같은 가격 스트림이 재현됩니다.
+"""
+
+import zlib
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Type
+
+import numpy as np
+
+# 기본 틱 간격 (연 단위): 1틱 = 1분 (252거래일 × 390분)
+DEFAULT_DT = 1.0 / (252 * 390)
+
+# 가격 하한 (검증기의 MIN_PRICE와 동일)
+MIN_PRICE = 0.01
+
+
+class PriceModel(ABC):
+    """가격 모델 인터페이스"""
+
+    name: str = "base"
+
+    def __init__(self, dt: float = DEFAULT_DT):
+        self.dt = dt
+
+    @abstractmethod
+    def simulate(
+        self,
+        start_price: float,
+        n_steps: int,
+        rng: np.random.Generator,
+        reference_price: Optional[float] = None,
+    ) -> np.ndarray:
+        """start_price 다음부터 n_steps개의 가격 경로를 생성합니다."""
+
+
+class GeometricBrownianMotion(PriceModel):
+    """기하 브라운 운동 (로그 정규 수익률)"""
+
+    name = "gbm"
+
+    def __init__(self, mu: float = 0.05, sigma: float = 0.3, dt: float = DEFAULT_DT):
+        super().__init__(dt)
+        self.mu = mu
+        self.sigma = sigma
+
+    def _log_returns(self, n_steps: int, rng: np.random.Generator) -> np.ndarray:
+        drift = (self.mu - 0.5 * self.sigma**2) * self.dt
+        diffusion = self.sigma * np.sqrt(self.dt)
+        return drift + diffusion * rng.standard_normal(n_steps)
+
+    def simulate(
+        self,
+        start_price: float,
+        n_steps: int,
+        rng: np.random.Generator,
+        reference_price: Optional[float] = None,
+    ) -> np.ndarray:
+        log_returns = self._log_returns(n_steps, rng)
+        return start_price * np.exp(np.cumsum(log_returns))
+
+
+class MertonJumpDiffusion(GeometricBrownianMotion):
+    """Merton 점프-확산 모델 (GBM + 로그 정규 점프)"""
+
+    name = "jump_diffusion"
+
+    def __init__(
+        self,
+        mu: float = 0.05,
+        sigma: float = 0.3,
+        jump_intensity: float = 50.0,  # 연간 평균 점프 횟수
+        jump_mean: float = 0.0,  # 점프 크기(로그)의 평균
+        jump_std: float = 0.02,  # 점프 크기(로그)의 표준편차
+        dt: float = DEFAULT_DT,
+    ):
+        super().__init__(mu, sigma, dt)
+        self.jump_intensity = jump_intensity
+        self.jump_mean = jump_mean
+        self.jump_std = jump_std
+
+    def _log_returns(self, n_steps: int, rng: np.random.Generator) -> np.ndarray:
+        # 점프로 인한 기대 수익률을 보정하여 전체 드리프트를 mu로 유지
+        kappa = np.exp(self.jump_mean + 0.5 * self.jump_std**2) - 1.0
+        drift = (self.mu - 0.5 * self.sigma**2 - self.jump_intensity * kappa) * self.dt
+        diffusion = self.sigma * np.sqrt(self.dt) * rng.standard_normal(n_steps)
+
+        jump_counts = rng.poisson(self.jump_intensity * self.dt, n_steps)
+        jumps = jump_counts * self.jump_mean + np.sqrt(
+            jump_counts
+        ) * self.jump_std * rng.standard_normal(n_steps)
+
+        return drift + diffusion + jumps
+
+
+class OrnsteinUhlenbeck(PriceModel):
+    """로그 가격에 대한 Ornstein-Uhlenbeck 평균 회귀 모델
+
+    장기 평균(long_run_mean)이 없으면 종목의 기준 가격으로 회귀합니다.
+    """
+
+    name = "ou"
+
+    def __init__(
+        self,
+        theta: float = 50.0,  # 연간 회귀 속도
+        sigma: float = 0.3,
+        long_run_mean: Optional[float] = None,
+        dt: float = DEFAULT_DT,
+    ):
+        super().__init__(dt)
+        self.theta = theta
+        self.sigma = sigma
+        self.long_run_mean = long_run_mean
+
+    def simulate(
+        self,
+        start_price: float,
+        n_steps: int,
+        rng: np.random.Generator,
+        reference_price: Optional[float] = None,
+    ) -> np.ndarray:
+        mean = self.long_run_mean or reference_price or start_price
+        log_mean = np.log(mean)
+
+        # 정확한 이산화: y[t+1] = a * y[t] + b * Z[t]  (y = log(price) - log(mean))
+        a = np.exp(-self.theta * self.dt)
+        b = self.sigma * np.sqrt((1.0 - a**2) / (2.0 * self.theta))
+
+        shocks = b * rng.standard_normal(n_steps)
+        y0 = np.log(start_price) - log_mean
+
+        if self.theta * self.dt * n_steps < 50:
+            # 선형 점화식을 누적합으로 풀어 블록 전체를 한 번에 계산
+            decay = a ** np.arange(1, n_steps + 1)
+            y = decay * (y0 + np.cumsum(shocks / decay))
+        else:
+            # 회귀 속도가 매우 빠르면 a^-t가 넘칠 수 있으므로 순차 계산
+            y = np.empty(n_steps)
+            prev = y0
+            for t in range(n_steps):
+                prev = a * prev + shocks[t]
+                y[t] = prev
+
+        return np.exp(log_mean + y)
+
+
+# 이름으로 모델을 찾기 위한 레지스트리
+PRICE_MODELS: Dict[str, Type[PriceModel]] = {
+    GeometricBrownianMotion.name: GeometricBrownianMotion,
+    MertonJumpDiffusion.name: MertonJumpDiffusion,
+    OrnsteinUhlenbeck.name: OrnsteinUhlenbeck,
+}
+
+
+def create_price_model(name: str, **params) -> PriceModel:
+    """이름으로 가격 모델을 생성합니다."""
+    if name not in PRICE_MODELS:
+        raise ValueError(
+            f"지원하지 않는 가격 모델: {name} (지원: {', '.join(PRICE_MODELS)})"
+        )
+    return PRICE_MODELS[name](**params)
+
+
+def symbol_rng(seed: Optional[int], symbol: str) -> np.random.Generator:
+    """시드와 종목 코드로부터 재현 가능한 종목별 난수 생성기를 만듭니다."""
+    spawn_key = (zlib.crc32(symbol.encode("utf-8")),)
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=spawn_key))
+
+
+class PriceStreams:
+    """종목별 가격 스트림 묶음
+
+    종목마다 block_size개의 틱을 미리 생성해 두고, 틱마다 커서만 전진시킵니다.
+    블록을 모두 소비한 종목만 다음 블록을 생성합니다.
+    """
+
+    def __init__(
+        self, model: PriceModel, seed: Optional[int] = None, block_size: int = 256
+    ):
+        self.model = model
+        self.seed = seed
+        self.block_size = block_size
+
+        self.symbols: List[str] = []
+        self.index: Dict[str, int] = {}
+        self._rngs: List[np.random.Generator] = []
+        self._reference: List[float] = []
+
+        self._blocks = np.empty((0, block_size), dtype=np.float64)
+        self._cursors = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self.index
+
+    def register(
+        self,
+        symbol: str,
+        start_price: float,
+        reference_price: Optional[float] = None,
+    ) -> int:
+        """종목 스트림을 등록하고 행 인덱스를 반환합니다."""
+        if symbol in self.index:
+            return self.index[symbol]
+
+        row = len(self.symbols)
+        self.symbols.append(symbol)
+        self.index[symbol] = row
+        self._rngs.append(symbol_rng(self.seed, symbol))
+        self._reference.append(reference_price or start_price)
+
+        if row >= len(self._blocks):
+            self._grow(max(8, row * 2))
+        self._fill(row, start_price)
+
+        return row
+
+    def _grow(self, capacity: int) -> None:
+        """블록 버퍼 용량을 늘립니다 (종목 추가 시에만 발생)."""
+        blocks = np.empty((capacity, self.block_size), dtype=np.float64)
+        blocks[: len(self._blocks)] = self._blocks
+        cursors = np.zeros(capacity, dtype=np.int64)
+        cursors[: len(self._cursors)] = self._cursors
+        self._blocks = blocks
+        self._cursors = cursors
+
+    def _fill(self, row: int, start_price: float) -> None:
+        """한 종목의 다음 블록을 생성합니다."""
+        path = self.model.simulate(
+            start_price, self.block_size, self._rngs[row], self._reference[row]
+        )
+        np.maximum(path, MIN_PRICE, out=path)
+        self._blocks[row] = path
+        self._cursors[row] = 0
+
+    def next_price(self, symbol: str, current_price: Optional[float] = None) -> float:
+        """한 종목의 다음 틱 가격을 반환합니다 (미등록 종목은 현재가로 등록)."""
+        if symbol not in self.index:
+            self.register(symbol, current_price)
+
+        row = self.index[symbol]
+        if self._cursors[row] >= self.block_size:
+            self._fill(row, self._blocks[row, -1])
+
+        price = float(self._blocks[row, self._cursors[row]])
+        self._cursors[row] += 1
+        return price
+
+    def next_all(self) -> np.ndarray:
+        """등록된 모든 종목의 다음 틱 가격을 등록 순서대로 반환합니다."""
+        size = len(self.symbols)
+        cursors = self._cursors[:size]
+
+        exhausted = np.flatnonzero(cursors >= self.block_size)
+        for row in exhausted:
+            self._fill(row, self._blocks[row, -1])
+
+        prices = self._blocks[np.arange(size), cursors]
+        cursors += 1
+        return prices
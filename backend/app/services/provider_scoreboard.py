@@ -0,0 +1,107 @@
+"""
+프로바이더 점수판
+
+외부 시세 프로바이더별 성공/실패/요청 한도 초과(429) 횟수와 응답 시간을
+지수 감쇠(반감기)로 누적하고, 점수가 높은 순서로 프로바이더를 정렬합니다.
+- 성공률: 사전값을 둔 비율 (기록이 없는 프로바이더는 0.5에서 시작)
+- 429: 최근 발생 횟수만큼 점수를 절반씩 낮춤 (시간이 지나면 회복)
+- 응답 시간: 지수 이동 평균, 1초 늘어날 때마다 점수가 1/(1+초)로 감소
+"""
+
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from app.core.config import settings
+
+
+class ProviderScore:
+    """한 프로바이더의 감쇠 누적 통계"""
+
+    __slots__ = ("successes", "failures", "rate_limited", "latency", "updated_at")
+
+    def __init__(self, now: float):
+        self.successes = 0.0
+        self.failures = 0.0
+        self.rate_limited = 0.0
+        self.latency: Optional[float] = None  # 성공 응답 시간 EMA (초)
+        self.updated_at = now
+
+    def decay(self, now: float, half_life: float) -> None:
+        factor = 0.5 ** ((now - self.updated_at) / half_life)
+        self.successes *= factor
+        self.failures *= factor
+        self.rate_limited *= factor
+        self.updated_at = now
+
+
+class ProviderScoreboard:
+    """지수 감쇠 기반 프로바이더 순위"""
+
+    LATENCY_ALPHA = 0.2  # 응답 시간 EMA 가중치
+    PRIOR = 1.0  # 성공률 사전값 (성공/실패 각각 가상 1회)
+
+    def __init__(
+        self,
+        half_life: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.half_life = (
+            settings.PROVIDER_SCORE_HALF_LIFE if half_life is None else half_life
+        )
+        self.clock = clock
+        self._scores: Dict[str, ProviderScore] = {}
+
+    def _entry(self, name: str) -> ProviderScore:
+        now = self.clock()
+        entry = self._scores.get(name)
+        if entry is None:
+            entry = self._scores[name] = ProviderScore(now)
+        else:
+            entry.decay(now, self.half_life)
+        return entry
+
+    def record_success(self, name: str, latency: float) -> None:
+        entry = self._entry(name)
+        entry.successes += 1
+        if entry.latency is None:
+            entry.latency = latency
+        else:
+            entry.latency += self.LATENCY_ALPHA * (latency - entry.latency)
+
+    def record_failure(self, name: str, rate_limited: bool = False) -> None:
+        entry = self._entry(name)
+        entry.failures += 1
+        if rate_limited:
+            entry.rate_limited += 1
+
+    def score(self, name: str) -> float:
+        """0~1 점수 (높을수록 먼저 시도)"""
+        entry = self._scores.get(name)
+        if entry is None:
+            return 0.5
+        entry.decay(self.clock(), self.half_life)
+        success_rate = (entry.successes + self.PRIOR) / (
+            entry.successes + entry.failures + 2 * self.PRIOR
+        )
+        throttle = 0.5**entry.rate_limited
+        latency = entry.latency or 0.0
+        return success_rate * throttle / (1 + latency)
+
+    def rank(self, names: Iterable[str]) -> List[str]:
+        """점수 내림차순 정렬 (점수가 같으면 기존 순서 유지)"""
+        return sorted(names, key=self.score, reverse=True)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        stats = {}
+        for name, entry in self._scores.items():
+            score = self.score(name)
+            stats[name] = {
+                "score": round(score, 4),
+                "successes": round(entry.successes, 2),
+                "failures": round(entry.failures, 2),
+                "rate_limited": round(entry.rate_limited, 2),
+                "latency_ema": (
+                    round(entry.latency, 4) if entry.latency is not None else None
+                ),
+            }
+        return stats
@@ -0,0 +1,359 @@
+"""
+열 단위 시세 배치 검증
+
+한 틱의 전체 종목을 종목별 딕셔너리 대신 필드별 배열(열)로 모아
+범위 검사와 논리적 일관성 검사를 한 번의 벡터 연산으로 수행합니다.
+- 행별 결과는 오류/경고 비트 플래그로만 기록 (메시지는 필요할 때 생성)
+- 값이 없는 선택 필드는 NaN으로 표시
+- 검증 규칙과 메시지는 StockDataValidator.validate_stock_quote와 동일
+"""
+
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from app.services.data_validator import StockDataValidator
+
+PRICE_FIELDS = ("price", "open", "high", "low", "previous_close")
+NUMERIC_FIELDS = PRICE_FIELDS + ("volume", "change_percent")
+
+MIN_PRICE = float(StockDataValidator.MIN_PRICE)
+MAX_PRICE = float(StockDataValidator.MAX_PRICE)
+
+# 오류 플래그 (하나라도 있으면 행이 무효)
+ERR_SYMBOL = 1 << 0
+ERR_PRICE_MISSING = 1 << 1
+ERR_PARSE = 1 << 2
+ERR_HIGH_LOW = 1 << 3
+ERR_VOLUME_NEGATIVE = 1 << 4
+ERR_CHANGE_PERCENT = 1 << 5
+# 가격 필드별 범위 오류: ERR_RANGE << 필드 인덱스
+ERR_RANGE = 1 << 8
+
+# 경고 플래그
+WARN_VOLUME_LARGE = 1 << 0
+WARN_CHANGE_PERCENT_LARGE = 1 << 1
+WARN_PRICE_ABOVE_HIGH = 1 << 2
+WARN_PRICE_BELOW_LOW = 1 << 3
+WARN_OPEN_ABOVE_HIGH = 1 << 4
+WARN_OPEN_BELOW_LOW = 1 << 5
+WARN_FUTURE_TIMESTAMP = 1 << 6
+WARN_OLD_TIMESTAMP = 1 << 7
+
+_FUTURE_LIMIT = 86400.0  # 1일
+_PAST_LIMIT = 3650 * 86400.0  # 10년
+
+_NON_NUMERIC = re.compile(r"[^\d.-]")
+
+
+def _to_float(value: Any) -> float:
+    """숫자 또는 숫자 문자열을 float로 변환합니다 (None은 NaN)."""
+    if value is None:
+        return np.nan
+    if isinstance(value, str):
+        return float(_NON_NUMERIC.sub("", value))
+    return float(value)
+
+
+def _to_epoch(value: Any) -> Tuple[float, float]:
+    """ISO 문자열/datetime/epoch 숫자를 (epoch 초, UTC 오프셋 초)로 변환합니다.
+
+    None은 (NaN, NaN), 시간대가 없는 값은 로컬 시각으로 보고 오프셋을 NaN으로 둡니다.
+    """
+    if value is None or value == "":
+        return np.nan, np.nan
+    if isinstance(value, (int, float)):
+        return float(value), np.nan
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    offset = value.utcoffset()
+    return value.timestamp(), np.nan if offset is None else offset.total_seconds()
+
+
+def _format_epoch(value: float, offset: float) -> str:
+    """epoch 초를 원래 시간대의 ISO 문자열로 되돌립니다 (오프셋이 NaN이면 로컬 시각)."""
+    if np.isnan(offset):
+        return datetime.fromtimestamp(value).isoformat()
+    # 호스트 시간대를 거치지 않도록 명시한 시간대로 변환
+    return datetime.fromtimestamp(
+        value, timezone(timedelta(seconds=offset))
+    ).isoformat()
+
+
+@dataclass
+class QuoteBatch:
+    """한 틱의 시세를 필드별 배열로 보관하는 배치"""
+
+    symbols: List[str]
+    price: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    previous_close: np.ndarray
+    volume: np.ndarray
+    change_percent: np.ndarray
+    timestamp: np.ndarray  # epoch 초 (NaN: 없음)
+    names: List[Optional[str]] = field(default_factory=list)
+    timestamp_field: str = "timestamp"
+    # 원본 타임스탬프의 UTC 오프셋 초 (NaN: 시간대 없음, 로컬 시각)
+    utc_offset: Optional[np.ndarray] = None
+    # 문자열 변환에 실패한 행 (from_records에서 설정)
+    parse_errors: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[Dict[str, Any]], timestamp_field: str = "timestamp"
+    ) -> "QuoteBatch":
+        """시세 딕셔너리 목록을 열 단위 배치로 변환합니다."""
+        records = list(records)
+        size = len(records)
+        columns = {name: np.full(size, np.nan) for name in NUMERIC_FIELDS}
+        timestamps = np.full(size, np.nan)
+        utc_offsets = np.full(size, np.nan)
+        parse_errors = np.zeros(size, dtype=bool)
+        symbols: List[str] = []
+        names: List[Optional[str]] = []
+
+        for row, record in enumerate(records):
+            symbols.append(record.get("symbol") or "")
+            name = record.get("name")
+            names.append(str(name) if name else None)
+            try:
+                for column in NUMERIC_FIELDS:
+                    columns[column][row] = _to_float(record.get(column))
+                timestamps[row], utc_offsets[row] = _to_epoch(
+                    record.get(timestamp_field)
+                )
+            except (ValueError, TypeError, AttributeError):
+                parse_errors[row] = True
+
+        return cls(
+            symbols=symbols,
+            timestamp=timestamps,
+            names=names,
+            timestamp_field=timestamp_field,
+            utc_offset=utc_offsets,
+            parse_errors=parse_errors,
+            **columns,
+        )
+
+
+class BatchRowResult(NamedTuple):
+    """배치의 한 행 검증 결과 (ValidationResult와 같은 속성 이름)"""
+
+    is_valid: bool
+    normalized_data: Optional[Dict[str, Any]]
+    errors: Tuple[str, ...] = ()
+    warnings: Tuple[str, ...] = ()
+
+
+class BatchValidation:
+    """배치 검증 결과 (행별 오류/경고 비트 플래그)"""
+
+    def __init__(
+        self,
+        batch: QuoteBatch,
+        symbols: List[str],
+        errors: np.ndarray,
+        warnings: np.ndarray,
+    ):
+        self.batch = batch
+        self.symbols = symbols
+        self.errors = errors
+        self.warnings = warnings
+
+    @property
+    def valid(self) -> np.ndarray:
+        return self.errors == 0
+
+    def row_errors(self, row: int) -> Tuple[str, ...]:
+        """행의 오류 메시지 (플래그가 있을 때만 생성)"""
+        flags = int(self.errors[row])
+        if not flags:
+            return ()
+        batch = self.batch
+        messages = []
+        if flags & ERR_SYMBOL:
+            messages.append(f"유효하지 않은 심볼 형식: {self.symbols[row]}")
+        if flags & ERR_PRICE_MISSING:
+            messages.append("필수 필드 누락: price")
+        if flags & ERR_PARSE:
+            messages.append("숫자/타임스탬프 변환 오류")
+        for index, name in enumerate(PRICE_FIELDS):
+            if flags & (ERR_RANGE << index):
+                value = getattr(batch, name)[row]
+                if value < MIN_PRICE:
+                    messages.append(
+                        f"{name}이 최소값({MIN_PRICE})보다 작습니다: {value}"
+                    )
+                else:
+                    messages.append(f"{name}이 최대값({MAX_PRICE})보다 큽니다: {value}")
+        if flags & ERR_VOLUME_NEGATIVE:
+            messages.append(f"거래량이 음수입니다: {int(batch.volume[row])}")
+        if flags & ERR_CHANGE_PERCENT:
+            messages.append(
+                f"change_percent이 허용 범위를 벗어남: {batch.change_percent[row]}%"
+            )
+        if flags & ERR_HIGH_LOW:
+            messages.append(
+                f"고가({batch.high[row]})가 저가({batch.low[row]})보다 낮습니다"
+            )
+        return tuple(messages)
+
+    def row_warnings(self, row: int) -> Tuple[str, ...]:
+        """행의 경고 메시지 (플래그가 있을 때만 생성)"""
+        flags = int(self.warnings[row])
+        if not flags:
+            return ()
+        batch = self.batch
+        price, high, low = batch.price[row], batch.high[row], batch.low[row]
+        messages = []
+        if flags & WARN_VOLUME_LARGE:
+            messages.append(f"거래량이 매우 큽니다: {int(batch.volume[row]):,}")
+        if flags & WARN_CHANGE_PERCENT_LARGE:
+            messages.append(
+                f"change_percent이 매우 큽니다: {batch.change_percent[row]}%"
+            )
+        if flags & WARN_PRICE_ABOVE_HIGH:
+            messages.append(f"현재가({price})가 고가({high})보다 높습니다")
+        if flags & WARN_PRICE_BELOW_LOW:
+            messages.append(f"현재가({price})가 저가({low})보다 낮습니다")
+        if flags & WARN_OPEN_ABOVE_HIGH:
+            messages.append(f"시가({batch.open[row]})가 고가({high})보다 높습니다")
+        if flags & WARN_OPEN_BELOW_LOW:
+            messages.append(f"시가({batch.open[row]})가 저가({low})보다 낮습니다")
+        if flags & WARN_FUTURE_TIMESTAMP:
+            messages.append(f"미래 날짜입니다: {self._timestamp(row)}")
+        if flags & WARN_OLD_TIMESTAMP:
+            messages.append(f"너무 오래된 날짜입니다: {self._timestamp(row)}")
+        return tuple(messages)
+
+    def _timestamp(self, row: int) -> Optional[str]:
+        value = self.batch.timestamp[row]
+        return None if np.isnan(value) else _format_epoch(value, self._utc_offset(row))
+
+    def _utc_offset(self, row: int) -> float:
+        offsets = self.batch.utc_offset
+        return np.nan if offsets is None else offsets[row]
+
+    def quality_scores(self) -> np.ndarray:
+        """DataNormalizer.calculate_data_quality_score와 같은 규칙의 품질 점수"""
+        batch = self.batch
+
+        def missing(column: np.ndarray) -> np.ndarray:
+            return np.isnan(column) | (column == 0)
+
+        score = np.full(len(batch), 100.0)
+        score -= 20 * missing(batch.price)
+        score -= 20 * np.isnan(batch.timestamp)
+        score -= 20 * np.array([not symbol for symbol in self.symbols], dtype=bool)
+        for column in (
+            batch.open,
+            batch.high,
+            batch.low,
+            batch.volume,
+            batch.change_percent,
+        ):
+            score -= 4 * missing(column)
+
+        with np.errstate(invalid="ignore"):
+            outside = (batch.price < batch.low) | (batch.price > batch.high)
+        present = ~(missing(batch.price) | missing(batch.high) | missing(batch.low))
+        score -= 20 * (outside & present)
+        return np.clip(score, 0.0, 100.0)
+
+    def record(self, row: int, source: str, validated_at: str) -> Dict[str, Any]:
+        """검증된 행을 validate_stock_quote와 같은 형식의 딕셔너리로 만듭니다."""
+        batch = self.batch
+        data: Dict[str, Any] = {"symbol": self.symbols[row]}
+        for name in PRICE_FIELDS:
+            value = getattr(batch, name)[row]
+            if not np.isnan(value):
+                data[name] = round(float(value), 2)
+        volume = batch.volume[row]
+        if not np.isnan(volume):
+            data["volume"] = int(volume)
+        change_percent = batch.change_percent[row]
+        if not np.isnan(change_percent):
+            data["change_percent"] = round(float(change_percent), 4)
+        timestamp = batch.timestamp[row]
+        if not np.isnan(timestamp):
+            data[batch.timestamp_field] = _format_epoch(
+                timestamp, self._utc_offset(row)
+            )
+        name = batch.names[row] if row < len(batch.names) else None
+        if name:
+            data["name"] = name
+        data["source"] = source
+        data["validated_at"] = validated_at
+        return data
+
+
+def validate_quote_batch(
+    batch: QuoteBatch, now: Optional[float] = None
+) -> BatchValidation:
+    """배치 전체의 범위/논리 검사를 벡터 연산으로 수행합니다."""
+    size = len(batch)
+    errors = np.zeros(size, dtype=np.uint32)
+    warnings = np.zeros(size, dtype=np.uint32)
+
+    symbols = [symbol.strip().upper() for symbol in batch.symbols]
+    pattern = StockDataValidator.SYMBOL_PATTERN
+    errors |= np.array(
+        [not pattern.match(symbol) for symbol in symbols], dtype=bool
+    ) * np.uint32(ERR_SYMBOL)
+
+    if batch.parse_errors is not None:
+        errors |= batch.parse_errors * np.uint32(ERR_PARSE)
+
+    errors |= np.isnan(batch.price) * np.uint32(ERR_PRICE_MISSING)
+
+    with np.errstate(invalid="ignore"):
+        # NaN 비교는 False이므로 없는 선택 필드는 자동으로 건너뜀
+        for index, name in enumerate(PRICE_FIELDS):
+            column = getattr(batch, name)
+            out_of_range = (column < MIN_PRICE) | (column > MAX_PRICE)
+            errors |= out_of_range * np.uint32(ERR_RANGE << index)
+
+        volume = batch.volume
+        errors |= (volume < StockDataValidator.MIN_VOLUME) * np.uint32(
+            ERR_VOLUME_NEGATIVE
+        )
+        warnings |= (volume > StockDataValidator.MAX_VOLUME) * np.uint32(
+            WARN_VOLUME_LARGE
+        )
+
+        change = batch.change_percent
+        errors |= (change < StockDataValidator.MIN_CHANGE_PERCENT) * np.uint32(
+            ERR_CHANGE_PERCENT
+        )
+        warnings |= (change > StockDataValidator.MAX_CHANGE_PERCENT) * np.uint32(
+            WARN_CHANGE_PERCENT_LARGE
+        )
+
+        # 논리적 일관성 (반올림된 가격 기준)
+        price = np.round(batch.price, 2)
+        high = np.round(batch.high, 2)
+        low = np.round(batch.low, 2)
+        open_price = np.round(batch.open, 2)
+        errors |= (high < low) * np.uint32(ERR_HIGH_LOW)
+        warnings |= (price > high) * np.uint32(WARN_PRICE_ABOVE_HIGH)
+        warnings |= (price < low) * np.uint32(WARN_PRICE_BELOW_LOW)
+        warnings |= (open_price > high) * np.uint32(WARN_OPEN_ABOVE_HIGH)
+        warnings |= (open_price < low) * np.uint32(WARN_OPEN_BELOW_LOW)
+
+        now = datetime.now().timestamp() if now is None else now
+        warnings |= (batch.timestamp > now + _FUTURE_LIMIT) * np.uint32(
+            WARN_FUTURE_TIMESTAMP
+        )
+        warnings |= (batch.timestamp < now - _PAST_LIMIT) * np.uint32(
+            WARN_OLD_TIMESTAMP
+        )
+
+    return BatchValidation(batch, symbols, errors, warnings)
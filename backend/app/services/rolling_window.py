@@ -0,0 +1,99 @@
+"""
+고정 크기 링 버퍼 기반 이동 통계
+
+종목별 가격/거래량 이력을 고정 크기 버퍼에 저장하고, 합계/평균/분산을
+값이 들어오고 나갈 때마다 증분 갱신합니다.
+- 버퍼는 생성 시 한 번만 할당 (틱마다 리스트 재할당 없음)
+- 분산은 슬라이딩 윈도우용 Welford 방식으로 갱신 (합/제곱합 방식보다 안정적)
+"""
+
+import math
+from typing import Iterator, List
+
+
+class RollingWindow:
+    """최근 capacity개 값을 보관하는 링 버퍼와 이동 통계"""
+
+    __slots__ = ("capacity", "_values", "_start", "_count", "_sum", "_mean", "_m2")
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity는 1 이상이어야 합니다")
+        self.capacity = capacity
+        self._values: List[float] = [0.0] * capacity
+        self._start = 0
+        self._count = 0
+
+        self._sum = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0  # 평균과의 편차 제곱합
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[float]:
+        """오래된 값부터 순서대로 순회합니다."""
+        for offset in range(self._count):
+            yield self._values[(self._start + offset) % self.capacity]
+
+    def __getitem__(self, index: int) -> float:
+        """시간순 인덱스 (음수는 최신 값부터)"""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("RollingWindow 인덱스 범위 초과")
+        return self._values[(self._start + index) % self.capacity]
+
+    def append(self, value: float) -> None:
+        """값을 추가합니다 (가득 찬 경우 가장 오래된 값을 대체)."""
+        if self._count < self.capacity:
+            self._values[(self._start + self._count) % self.capacity] = value
+            self._count += 1
+            delta = value - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (value - self._mean)
+        else:
+            old = self._values[self._start]
+            self._values[self._start] = value
+            self._start = (self._start + 1) % self.capacity
+            old_mean = self._mean
+            self._mean += (value - old) / self._count
+            self._m2 += (value - old) * (value - self._mean + old - old_mean)
+            if self._m2 < 0.0:  # 부동소수 오차 보정
+                self._m2 = 0.0
+        self._sum = self._mean * self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    @property
+    def mean(self) -> float:
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        """모분산 (값이 2개 미만이면 0)"""
+        return self._m2 / self._count if self._count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def tail_mean(self, n: int) -> float:
+        """최근 n개 값의 평균 (n은 작은 상수라 추가 할당 없이 직접 합산)"""
+        n = min(n, self._count)
+        if n == 0:
+            return 0.0
+        if n == self._count:
+            return self._mean
+        total = 0.0
+        index = self._start + self._count - 1
+        for _ in range(n):
+            total += self._values[index % self.capacity]
+            index -= 1
+        return total / n
+
+    def to_list(self) -> List[float]:
+        """시간순 값 목록 (조회/디버깅용)"""
+        return list(self)
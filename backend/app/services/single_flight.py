@@ -0,0 +1,57 @@
+"""
+단일 비행(single-flight) 요청 병합
+
+같은 키(엔드포인트, 종목 등)로 동시에 들어온 호출은 이미 진행 중인 호출
+하나의 결과를 함께 기다립니다. 캐시가 비어 있을 때 같은 종목 요청이
+몰려도 외부 API는 한 번만 호출되어 rate limit을 낭비하지 않습니다.
+- 결과와 예외 모두 대기 중인 호출자 전원에게 전달
+- 호출이 끝나면 키를 제거하므로 이후 요청은 새로 호출
+- 먼저 들어온 호출자가 취소되어도 진행 중인 호출은 계속됨 (다른 대기자 보호)
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """키별로 진행 중인 비동기 호출을 하나로 병합"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0  # 실제로 실행된 호출 수
+        self.coalesced = 0  # 진행 중인 호출에 합류한 수
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    async def do(
+        self, key: Hashable, fn: Callable[..., Awaitable[Any]], *args, **kwargs
+    ) -> Any:
+        """key로 진행 중인 호출이 있으면 합류하고, 없으면 fn을 실행합니다."""
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            self._calls[key] = task
+            self.calls += 1
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.coalesced += 1
+        # shield: 한 호출자의 취소가 공유 호출을 취소하지 않도록 보호
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # 모든 대기자가 취소된 경우에도 예외 미확인 경고가 나지 않도록 조회
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._calls),
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+        }
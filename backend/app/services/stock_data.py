@@ -7,7 +7,6 @@ Alpha Vantage API와 통합하여 실시간 주식 데이터를 제공합니다.
 
 import asyncio
 import json
-import time
 from dataclasses import asdict
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
@@ -17,6 +16,7 @@ import aiohttp
 
 from app.core.config import settings
 from app.core.error_recovery import circuit_breaker, recovery_system
+from app.core.http_client import http_clients
 from app.core.logging_system import (
     ErrorCategory,
     ErrorSeverity,
@@ -28,7 +28,19 @@ from app.core.logging_system import (
     logging_system,
 )
 from app.core.monitoring import add_breadcrumb, capture_exception, capture_message
-from app.services.data_validator import DataValidationError, validator
+from app.core.rate_limiter import (
+    Priority,
+    RateLimitTimeout,
+    current_priority,
+    rate_limiters,
+    request_priority,
+)
+from app.services.data_validator import DataSource, DataValidationError, validator
+from app.services.single_flight import SingleFlight
+from app.services.ttl_cache import LRUTTLCache, thaw
+
+# Alpha Vantage TIME_SERIES_INTRADAY 지원 간격
+INTRADAY_INTERVALS = ("1min", "5min", "15min", "30min", "60min")
 
 
 class RateLimitExceededError(Exception):
@@ -51,13 +63,30 @@ class StockDataService:
         self.base_url = "https://www.alphavantage.co/query"
 
         # 캐시 설정
-        self.cache: Dict[str, Dict] = {}
-        self.cache_duration = timedelta(seconds=30)
+        self.cache_duration = timedelta(seconds=settings.QUOTE_CACHE_TTL)
+        # 만료 후 이 시간까지는 캐시를 즉시 반환하고 백그라운드에서 갱신
+        self.stale_duration = timedelta(seconds=settings.QUOTE_STALE_TTL)
+        # stale 구간 이후에도 rate limit 초과 시 폴백용으로 보관하는 시간
+        self.stale_if_error_duration = timedelta(
+            seconds=settings.QUOTE_STALE_IF_ERROR_TTL
+        )
+        self.cache = LRUTTLCache(
+            max_entries=settings.QUOTE_CACHE_MAX_ENTRIES,
+            max_bytes=settings.QUOTE_CACHE_MAX_BYTES,
+            ttl=self._fallback_limit_seconds,
+        )
+        self.refresh_ahead = settings.QUOTE_REFRESH_AHEAD
+        self.hot_hits = settings.QUOTE_HOT_HITS
+        self._access_counts: Dict[str, int] = {}
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
+
+        # Rate limiting (다른 서비스와 공유하는 프로바이더 토큰 버킷)
+        self.rate_limiter = rate_limiters
+        self.rate_limit_provider = "alpha_vantage"
+        self.rate_limit_max_wait = settings.RATE_LIMIT_MAX_WAIT
 
-        # Rate limiting
-        self.request_times: List[float] = []
-        self.max_requests_per_minute = 5
-        self.request_delay = 12  # 12초 대기 (Alpha Vantage 제한)
+        # 같은 (엔드포인트, 종목) 동시 요청 병합
+        self._inflight = SingleFlight()
 
         # 통계
         self.stats = {
@@ -67,6 +96,9 @@ class StockDataService:
             "api_errors": 0,
             "successful_requests": 0,
             "rate_limit_hits": 0,
+            "rate_limit_wait_seconds": 0.0,
+            "stale_hits": 0,
+            "background_refreshes": 0,
         }
 
         log_info(
@@ -74,7 +106,7 @@ class StockDataService:
             context={
                 "api_configured": bool(self.api_key),
                 "cache_duration_seconds": self.cache_duration.total_seconds(),
-                "rate_limit": self.max_requests_per_minute,
+                "rate_limit_provider": self.rate_limit_provider,
             },
             logger_name="api",
         )
@@ -85,15 +117,15 @@ class StockDataService:
         log_api_call(endpoint="get_quote", method="GET", context={"symbol": symbol})
 
         try:
-            # 캐시 확인
-            cached_data = self._get_from_cache(symbol)
+            # 캐시 확인 (stale 허용 구간까지는 즉시 반환)
+            cached_data = self._serve_cached_quote(symbol)
             if cached_data:
-                self.stats["cache_hits"] += 1
                 log_info(
                     f"캐시에서 데이터 반환: {symbol}",
                     context={
                         "symbol": symbol,
                         "cache_age_seconds": cached_data.get("cache_age"),
+                        "is_stale": cached_data["is_stale"],
                     },
                     logger_name="api",
                 )
@@ -101,21 +133,7 @@ class StockDataService:
 
             self.stats["cache_misses"] += 1
 
-            # Rate limiting 확인
-            await self._check_rate_limit()
-
-            # 서킷 브레이커를 통한 API 호출
-            async with circuit_breaker("stock_api") as protected_call:
-                quote_data = await protected_call(self._fetch_quote_from_api, symbol)
-
-            # 데이터 검증 및 정규화
-            async with logging_system.performance_monitor("data_validation"):
-                validated_data = self._validate_and_normalize_quote(symbol, quote_data)
-
-            # 캐시에 저장
-            self._save_to_cache(symbol, validated_data)
-
-            self.stats["successful_requests"] += 1
+            validated_data = await self._load_quote(symbol)
 
             log_info(
                 f"API에서 새 데이터 조회 성공: {symbol}",
@@ -136,10 +154,7 @@ class StockDataService:
                 f"Rate limit 초과: {symbol}",
                 category=ErrorCategory.RATE_LIMIT_ERROR,
                 severity=ErrorSeverity.MEDIUM,
-                context={
-                    "symbol": symbol,
-                    "requests_per_minute": len(self.request_times),
-                },
+                context={"symbol": symbol, "error": str(e)},
                 logger_name="api",
             )
 
@@ -202,58 +217,271 @@ class StockDataService:
 
             return self._generate_fallback_data(symbol)
 
+    async def _load_quote(self, symbol: str) -> Dict[str, Any]:
+        """API에서 시세를 조회해 검증 후 캐시에 저장합니다."""
+
+        quote_data = await self._fetch_raw_quote(symbol)
+
+        # 데이터 검증 및 정규화
+        async with logging_system.performance_monitor("data_validation"):
+            validated_data = self._validate_and_normalize_quote(symbol, quote_data)
+
+        # 캐시에 저장
+        self._save_to_cache(symbol, validated_data)
+
+        self.stats["successful_requests"] += 1
+        return validated_data
+
+    def _serve_cached_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """stale-while-revalidate 캐시 조회
+
+        신선한 항목은 그대로, 만료 후 stale 구간 안의 항목은 즉시 반환하면서
+        백그라운드 갱신을 한 번 예약합니다. 자주 조회되는 종목은 만료 전에
+        미리 갱신합니다. stale 구간을 넘었거나 없으면 None을 반환합니다.
+        """
+        cached_data = self._get_from_cache(symbol, allow_stale=True)
+        if not cached_data or cached_data["cache_age"] > self._stale_limit_seconds:
+            return None
+
+        self.stats["cache_hits"] += 1
+        hits = self._access_counts.get(symbol, 0) + 1
+        self._access_counts[symbol] = hits
+
+        if cached_data["is_stale"]:
+            self.stats["stale_hits"] += 1
+            self._schedule_refresh(symbol)
+        elif self._should_refresh_ahead(cached_data["cache_age"], hits):
+            self._schedule_refresh(symbol)
+
+        return cached_data
+
+    @property
+    def _stale_limit_seconds(self) -> float:
+        return (self.cache_duration + self.stale_duration).total_seconds()
+
+    @property
+    def _fallback_limit_seconds(self) -> float:
+        """rate limit 초과 시 폴백으로 반환할 수 있는 최대 캐시 나이"""
+        return self._stale_limit_seconds + self.stale_if_error_duration.total_seconds()
+
+    def _should_refresh_ahead(self, cache_age: float, hits: int) -> bool:
+        """자주 조회되는 종목이 만료에 가까우면 rate limit 여유 안에서 선갱신"""
+        return (
+            hits >= self.hot_hits
+            and cache_age >= self.cache_duration.total_seconds() * self.refresh_ahead
+            and self._rate_limit_remaining() >= 2  # 사용자 요청용 한 자리는 남겨둠
+        )
+
+    def _schedule_refresh(self, symbol: str) -> None:
+        """종목당 하나의 백그라운드 갱신 작업만 실행합니다."""
+        if symbol in self._refresh_tasks:
+            return
+        task = asyncio.create_task(self._refresh_quote(symbol))
+        self._refresh_tasks[symbol] = task
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(symbol, None))
+
+    async def _refresh_quote(self, symbol: str) -> None:
+        """백그라운드 갱신 (실패하면 기존 캐시를 그대로 유지)"""
+        try:
+            # 백그라운드 갱신은 사용자 요청보다 뒤에 한도를 받음
+            with request_priority(Priority.BULK):
+                await self._load_quote(symbol)
+            self.stats["background_refreshes"] += 1
+        except RateLimitExceededError:
+            self.stats["rate_limit_hits"] += 1
+        except Exception as e:
+            self.stats["api_errors"] += 1
+            log_warning(
+                f"백그라운드 갱신 실패: {symbol}",
+                category=ErrorCategory.API_ERROR,
+                severity=ErrorSeverity.LOW,
+                context={"symbol": symbol, "error": str(e)},
+                logger_name="api",
+            )
+
+    async def get_intraday_data(
+        self, symbol: str, interval: str = "1min"
+    ) -> Optional[Dict[str, Any]]:
+        """일중 시계열 데이터 조회 (캐시 포함, 데이터가 없으면 None)"""
+
+        log_api_call(
+            endpoint="get_intraday_data",
+            method="GET",
+            context={"symbol": symbol, "interval": interval},
+        )
+
+        if interval not in INTRADAY_INTERVALS:
+            raise DataValidationError(f"지원하지 않는 간격입니다: {interval}")
+
+        cache_key = f"intraday:{symbol}:{interval}"
+        cached_data = self._get_from_cache(cache_key)
+        if cached_data:
+            self.stats["cache_hits"] += 1
+            return cached_data
+
+        self.stats["cache_misses"] += 1
+
+        try:
+            raw = await self._inflight.do(
+                ("TIME_SERIES_INTRADAY", symbol, interval),
+                self._call_with_limits,
+                self._fetch_intraday_from_api,
+                symbol,
+                interval,
+            )
+        except RateLimitExceededError:
+            self.stats["rate_limit_hits"] += 1
+            stale_data = self._get_from_cache(cache_key, allow_stale=True)
+            if stale_data:
+                stale_data["is_stale"] = True
+                return stale_data
+            raise
+
+        try:
+            time_series = [
+                {
+                    "timestamp": timestamp,
+                    "open": float(bar.get("1. open", 0)),
+                    "high": float(bar.get("2. high", 0)),
+                    "low": float(bar.get("3. low", 0)),
+                    "close": float(bar.get("4. close", 0)),
+                    "volume": int(bar.get("5. volume", 0)),
+                }
+                for timestamp, bar in sorted(raw["series"].items())
+            ]
+        except (ValueError, TypeError, AttributeError) as e:
+            raise DataValidationError(f"일중 데이터 처리 실패: {str(e)}")
+        if not time_series:
+            return None
+
+        intraday_data = {
+            "symbol": symbol.upper(),
+            "interval": interval,
+            "last_refreshed": raw["meta"].get("3. Last Refreshed"),
+            "time_series": time_series,
+            "data_source": "alpha_vantage",
+        }
+        self._save_to_cache(cache_key, intraday_data)
+        self.stats["successful_requests"] += 1
+        return intraday_data
+
+    async def _fetch_raw_quote(self, symbol: str) -> Dict[str, Any]:
+        """원시 시세 조회 (같은 종목의 동시 요청은 하나의 API 호출로 병합)"""
+        key = ("GLOBAL_QUOTE", symbol)
+        joined = key in self._inflight
+        flight = self._inflight.do(
+            key, self._call_with_limits, self._fetch_quote_from_api, symbol
+        )
+        if not joined or current_priority() is not Priority.INTERACTIVE:
+            return await flight
+
+        # 일괄 작업의 갱신에 합류한 사용자 요청도 최대 대기 시간까지만 기다림
+        try:
+            return await asyncio.wait_for(flight, self.rate_limit_max_wait)
+        except asyncio.TimeoutError:
+            raise RateLimitExceededError(
+                f"{self.rate_limit_max_wait:.1f}초 안에 진행 중인 조회가 끝나지 않았습니다"
+            )
+
+    async def _call_with_limits(self, fetch, *args) -> Dict[str, Any]:
+        """Rate limit 한도를 기다린 후 서킷 브레이커를 통해 API를 호출합니다."""
+
+        # 사용자 요청은 최대 대기 시간까지만 기다림 (초과 시 stale 데이터로 폴백)
+        max_wait = None
+        if current_priority() is Priority.INTERACTIVE:
+            max_wait = self.rate_limit_max_wait
+        try:
+            waited = await self.rate_limiter.acquire(
+                self.rate_limit_provider, max_wait=max_wait
+            )
+        except RateLimitTimeout as e:
+            raise RateLimitExceededError(str(e))
+
+        if waited:
+            self.stats["rate_limit_wait_seconds"] += waited
+            log_info(
+                f"Rate limit 대기 후 호출: {waited:.2f}초",
+                context={"wait_seconds": waited, "priority": current_priority().name},
+                logger_name="api",
+            )
+
+        # 서킷 브레이커를 통한 API 호출
+        async with circuit_breaker("stock_api") as protected_call:
+            return await protected_call(fetch, *args)
+
     async def _fetch_quote_from_api(self, symbol: str) -> Dict[str, Any]:
         """API에서 시세 데이터 조회"""
 
-        params = {
-            "function": "GLOBAL_QUOTE",
-            "symbol": symbol,
-            "apikey": self.api_key or "demo",
+        data = await self._request_api({"function": "GLOBAL_QUOTE", "symbol": symbol})
+
+        # 글로벌 시세 데이터 추출
+        global_quote = data.get("Global Quote", {})
+        if not global_quote:
+            raise APIConnectionError("빈 응답 데이터")
+
+        log_info(
+            f"API 호출 성공: {symbol}",
+            context={"symbol": symbol, "data_keys": list(global_quote.keys())},
+            logger_name="api",
+        )
+
+        return global_quote
+
+    async def _fetch_intraday_from_api(
+        self, symbol: str, interval: str
+    ) -> Dict[str, Any]:
+        """API에서 일중 시계열 데이터 조회"""
+
+        data = await self._request_api(
+            {
+                "function": "TIME_SERIES_INTRADAY",
+                "symbol": symbol,
+                "interval": interval,
+            }
+        )
+
+        series = data.get(f"Time Series ({interval})")
+        if not series:
+            raise APIConnectionError("빈 응답 데이터")
+
+        return {
+            "meta": data.get("Meta Data", {}),
+            "series": series,
         }
 
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=10)
-        ) as session:
-            try:
-                async with session.get(self.base_url, params=params) as response:
-                    self.stats["total_requests"] += 1
-                    self.request_times.append(time.time())
-
-                    if response.status != 200:
-                        raise APIConnectionError(
-                            f"HTTP {response.status}: {response.reason}"
-                        )
-
-                    data = await response.json()
-
-                    # API 오류 확인
-                    if "Error Message" in data:
-                        raise APIConnectionError(f"API Error: {data['Error Message']}")
-
-                    if "Note" in data:
-                        raise RateLimitExceededError(f"Rate limit: {data['Note']}")
-
-                    # 글로벌 시세 데이터 추출
-                    global_quote = data.get("Global Quote", {})
-                    if not global_quote:
-                        raise APIConnectionError("빈 응답 데이터")
-
-                    log_info(
-                        f"API 호출 성공: {symbol}",
-                        context={
-                            "symbol": symbol,
-                            "response_status": response.status,
-                            "data_keys": list(global_quote.keys()),
-                        },
-                        logger_name="api",
+    async def _request_api(self, params: Dict[str, str]) -> Dict[str, Any]:
+        """Alpha Vantage API 호출 및 공통 오류 처리"""
+
+        params = {**params, "apikey": self.api_key or "demo"}
+
+        # 공유 커넥션 풀 사용 (keep-alive로 핸드셰이크 재사용)
+        session = http_clients.session()
+        try:
+            async with session.get(
+                http_clients.url(self.base_url), params=params
+            ) as response:
+                self.stats["total_requests"] += 1
+
+                if response.status != 200:
+                    raise APIConnectionError(
+                        f"HTTP {response.status}: {response.reason}"
                     )
 
-                    return global_quote
+                data = await response.json()
+
+                # API 오류 확인
+                if "Error Message" in data:
+                    raise APIConnectionError(f"API Error: {data['Error Message']}")
+
+                if "Note" in data:
+                    raise RateLimitExceededError(f"Rate limit: {data['Note']}")
+
+                return data
 
-            except aiohttp.ClientError as e:
-                raise APIConnectionError(f"네트워크 오류: {str(e)}")
-            except asyncio.TimeoutError:
-                raise APIConnectionError("API 응답 시간 초과")
+        except aiohttp.ClientError as e:
+            raise APIConnectionError(f"네트워크 오류: {str(e)}")
+        except asyncio.TimeoutError:
+            raise APIConnectionError("API 응답 시간 초과")
 
     def _validate_and_normalize_quote(
         self, symbol: str, raw_data: Dict[str, Any]
@@ -265,7 +493,9 @@ class StockDataService:
             normalized = self._normalize_alpha_vantage_quote(raw_data)
 
             # 데이터 검증
-            validation_result = validator.validate_quote_data(normalized)
+            validation_result = validator.validate_stock_quote(
+                normalized, DataSource.ALPHA_VANTAGE
+            )
 
             if not validation_result.is_valid:
                 raise DataValidationError(
@@ -308,6 +538,62 @@ class StockDataService:
             )
             raise DataValidationError(f"데이터 처리 실패: {str(e)}")
 
+    def _validate_and_normalize_batch(
+        self, symbols: List[str], raw_quotes: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """여러 종목의 시세를 열 단위로 한 번에 검증 및 정규화 (실패한 행은 None)"""
+
+        from app.services.quote_batch import QuoteBatch, validate_quote_batch
+
+        records = []
+        for symbol, raw_data in zip(symbols, raw_quotes):
+            try:
+                records.append(self._normalize_alpha_vantage_quote(raw_data))
+            except (ValueError, TypeError, AttributeError):
+                # 변환 실패 행은 가격이 없으므로 배치 검증에서 무효 처리됨
+                records.append({"symbol": symbol})
+
+        checked = validate_quote_batch(
+            QuoteBatch.from_records(records, timestamp_field="latest_trading_day")
+        )
+        validated_at = datetime.now().isoformat()
+
+        results: List[Optional[Dict[str, Any]]] = []
+        for row, symbol in enumerate(symbols):
+            if checked.errors[row]:
+                log_error(
+                    f"데이터 정규화/검증 실패: {symbol}",
+                    category=ErrorCategory.DATA_VALIDATION_ERROR,
+                    severity=ErrorSeverity.MEDIUM,
+                    context={"symbol": symbol, "errors": list(checked.row_errors(row))},
+                    logger_name="api",
+                )
+                results.append(None)
+                continue
+
+            warnings = list(checked.row_warnings(row))
+            validated_data = checked.record(
+                row, DataSource.ALPHA_VANTAGE.value, validated_at
+            )
+            validated_data.update(
+                {
+                    "data_source": "alpha_vantage",
+                    "symbol": symbol.upper(),
+                    "validation_warnings": warnings,
+                }
+            )
+            if warnings:
+                log_warning(
+                    f"데이터 검증 경고: {symbol}",
+                    category=ErrorCategory.DATA_VALIDATION_ERROR,
+                    severity=ErrorSeverity.LOW,
+                    context={"symbol": symbol, "warnings": warnings},
+                    logger_name="api",
+                )
+            results.append(validated_data)
+
+        return results
+
     def _normalize_alpha_vantage_quote(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Alpha Vantage 시세 데이터 정규화"""
 
@@ -324,78 +610,57 @@ class StockDataService:
             "latest_trading_day": data.get("07. latest trading day", ""),
         }
 
-    async def _check_rate_limit(self) -> None:
-        """Rate limit 확인 및 대기"""
-
-        current_time = time.time()
-
-        # 1분 이전 요청들 제거
-        self.request_times = [t for t in self.request_times if current_time - t < 60]
-
-        if len(self.request_times) >= self.max_requests_per_minute:
-            wait_time = 60 - (current_time - self.request_times[0]) + 1
-
-            log_warning(
-                f"Rate limit 대기: {wait_time:.1f}초",
-                category=ErrorCategory.RATE_LIMIT_ERROR,
-                severity=ErrorSeverity.LOW,
-                context={
-                    "wait_time": wait_time,
-                    "requests_count": len(self.request_times),
-                },
-                logger_name="api",
-            )
-
-            raise RateLimitExceededError(
-                f"Rate limit 초과, {wait_time:.1f}초 대기 필요"
-            )
+    def _rate_limit_remaining(self) -> float:
+        """프로바이더 버킷에 남은 토큰 수 (한도가 없으면 무한대)"""
+        bucket = self.rate_limiter.get(self.rate_limit_provider)
+        return bucket.available() if bucket else float("inf")
 
     def _get_from_cache(
         self, symbol: str, allow_stale: bool = False
     ) -> Optional[Dict[str, Any]]:
-        """캐시에서 데이터 조회"""
+        """캐시에서 데이터 조회 (캐시 값은 변경하지 않고 복사본에 메타데이터 추가)"""
 
-        if symbol not in self.cache:
+        cached = self.cache.get(symbol)
+        if cached is None:
+            # TTL 만료로 제거된 항목의 조회 횟수도 함께 정리
+            self._access_counts.pop(symbol, None)
             return None
 
-        cached_item = self.cache[symbol]
-        cache_time = datetime.fromisoformat(cached_item["cached_at"])
-        age = datetime.now() - cache_time
-
-        if not allow_stale and age > self.cache_duration:
+        value, age = cached
+        is_stale = age > self.cache_duration.total_seconds()
+        if not allow_stale and is_stale:
             log_info(
                 f"캐시 데이터 만료: {symbol}",
-                context={"symbol": symbol, "age_seconds": age.total_seconds()},
+                context={"symbol": symbol, "age_seconds": age},
                 logger_name="api",
             )
             return None
 
         # 캐시 나이 정보 추가
-        cached_item["cache_age"] = age.total_seconds()
-        cached_item["is_cached"] = True
-
-        return cached_item
+        return {
+            **thaw(value),
+            "cache_age": age,
+            "is_cached": True,
+            "is_stale": is_stale,
+        }
 
     def _save_to_cache(self, symbol: str, data: Dict[str, Any]) -> None:
-        """캐시에 데이터 저장"""
-
-        cache_entry = data.copy()
-        cache_entry["cached_at"] = datetime.now().isoformat()
-
-        self.cache[symbol] = cache_entry
+        """캐시에 데이터 저장 (항목 수/메모리 상한 초과 시 LRU 제거)"""
 
-        # 캐시 크기 제한 (최대 100개)
-        if len(self.cache) > 100:
-            oldest_symbol = min(
-                self.cache.keys(), key=lambda k: self.cache[k]["cached_at"]
-            )
-            del self.cache[oldest_symbol]
+        evicted = self.cache.set(
+            symbol, {**data, "cached_at": datetime.now().isoformat()}
+        )
+        self._access_counts.pop(symbol, None)
 
+        for removed in evicted:
+            self._access_counts.pop(removed, None)
+        if evicted:
             log_info(
-                f"캐시 정리: {oldest_symbol} 제거",
+                f"캐시 정리: {', '.join(map(str, evicted))} 제거",
                 context={
-                    "removed_symbol": oldest_symbol,
+                    "removed_symbols": evicted,
                     "cache_size": len(self.cache),
+                    "cache_bytes": self.cache.total_bytes,
                 },
                 logger_name="api",
             )
@@ -439,16 +704,39 @@ class StockDataService:
             context={"symbols": symbols, "count": len(symbols)},
         )
 
-        async with logging_system.performance_monitor("batch_quote_fetch"):
-            tasks = [self.get_quote(symbol) for symbol in symbols]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        response = {}
+        response: Dict[str, Dict[str, Any]] = {}
         successful_count = 0
         error_count = 0
 
-        for symbol, result in zip(symbols, results):
+        # 캐시에 없는 종목만 API에서 조회
+        pending = []
+        for symbol in symbols:
+            cached_data = self._serve_cached_quote(symbol)
+            if cached_data:
+                response[symbol] = cached_data
+                successful_count += 1
+            else:
+                self.stats["cache_misses"] += 1
+                pending.append(symbol)
+
+        async with logging_system.performance_monitor("batch_quote_fetch"):
+            tasks = [self._fetch_raw_quote(symbol) for symbol in pending]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        fetched_symbols = []
+        raw_quotes = []
+        for symbol, result in zip(pending, results):
             if isinstance(result, Exception):
+                if isinstance(result, RateLimitExceededError):
+                    self.stats["rate_limit_hits"] += 1
+                    stale_data = self._get_from_cache(symbol, allow_stale=True)
+                    if stale_data:
+                        stale_data["is_stale"] = True
+                        response[symbol] = stale_data
+                        successful_count += 1
+                        continue
+                else:
+                    self.stats["api_errors"] += 1
                 log_error(
                     f"배치 조회 실패: {symbol}",
                     category=ErrorCategory.API_ERROR,
@@ -459,8 +747,27 @@ class StockDataService:
                 response[symbol] = self._generate_fallback_data(symbol)
                 error_count += 1
             else:
-                response[symbol] = result
-                successful_count += 1
+                fetched_symbols.append(symbol)
+                raw_quotes.append(result)
+
+        # 조회된 시세는 한 번의 배치로 검증 및 정규화
+        if fetched_symbols:
+            async with logging_system.performance_monitor("batch_data_validation"):
+                validated = self._validate_and_normalize_batch(
+                    fetched_symbols, raw_quotes
+                )
+            for symbol, validated_data in zip(fetched_symbols, validated):
+                if validated_data is None:
+                    self.stats["api_errors"] += 1
+                    response[symbol] = self._generate_fallback_data(symbol)
+                    error_count += 1
+                else:
+                    self._save_to_cache(symbol, validated_data)
+                    self.stats["successful_requests"] += 1
+                    response[symbol] = validated_data
+                    successful_count += 1
+
+        response = {symbol: response[symbol] for symbol in symbols}
 
         log_info(
             "배치 시세 조회 완료",
@@ -475,23 +782,28 @@ class StockDataService:
 
         return response
 
+    async def batch_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 종목 시세 일괄 조회 (get_multiple_quotes와 동일)"""
+        return await self.get_multiple_quotes(symbols)
+
     def get_cache_stats(self) -> Dict[str, Any]:
         """캐시 및 API 통계 조회"""
 
         cache_info = {
             "cache_size": len(self.cache),
             "cache_duration_seconds": self.cache_duration.total_seconds(),
-            "cached_symbols": list(self.cache.keys()),
+            "stale_duration_seconds": self.stale_duration.total_seconds(),
+            "refreshing_symbols": list(self._refresh_tasks),
+            "cached_symbols": self.cache.keys(),
+            **self.cache.get_stats(),
         }
 
-        # 최근 요청 수 계산
-        current_time = time.time()
-        recent_requests = len([t for t in self.request_times if current_time - t < 60])
-
+        bucket = self.rate_limiter.get(self.rate_limit_provider)
         api_info = {
-            "requests_last_minute": recent_requests,
-            "rate_limit": self.max_requests_per_minute,
-            "rate_limit_available": self.max_requests_per_minute - recent_requests,
+            "rate_limit_provider": self.rate_limit_provider,
+            "rate_limiter": bucket.get_stats() if bucket else None,
+            "in_flight_requests": len(self._inflight),
+            "coalesced_requests": self._inflight.coalesced,
         }
 
         stats_info = self.stats.copy()
@@ -526,6 +838,7 @@ class StockDataService:
 
         cache_size = len(self.cache)
         self.cache.clear()
+        self._access_counts.clear()
 
         log_info(
             f"캐시 초기화 완료",
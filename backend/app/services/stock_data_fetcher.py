@@ -4,15 +4,38 @@ Alpha Vantage, Twelve Data, Yahoo Finance 등에서 실시간 데이터 수집
 """
 
 import asyncio
-import aiohttp
+import time
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import os
 from decimal import Decimal
 
+from app.core.config import settings
+from app.core.error_recovery import CircuitBreaker, get_circuit_breaker
+from app.core.http_client import http_clients
+from app.core.rate_limiter import (
+    Priority,
+    current_priority,
+    rate_limiters,
+)
+from app.services.latency_histogram import LatencyHistogram
+from app.services.provider_scoreboard import ProviderScoreboard
+from app.services.single_flight import SingleFlight
+
 logger = logging.getLogger(__name__)
 
+
+class ProviderRateLimitedError(Exception):
+    """프로바이더가 요청 한도 초과(HTTP 429 또는 한도 안내 응답)를 반환함"""
+    pass
+
+
+class ProviderError(Exception):
+    """프로바이더가 서버 오류(5xx) 또는 데이터가 없는 응답을 반환함"""
+    pass
+
+
 class StockDataFetcher:
     """실제 주식 데이터를 외부 API에서 가져오는 클래스"""
     
@@ -22,28 +45,52 @@ class StockDataFetcher:
         self.twelve_data_key = os.getenv('TWELVE_DATA_API_KEY')
         self.fmp_key = os.getenv('FMP_API_KEY')  # Financial Modeling Prep
         
-        # 무료 API 제한
-        self.request_delay = 1.0  # 초 단위
+        # 무료 API 제한은 프로바이더별 공용 토큰 버킷으로 관리
+        self.rate_limit_wait = 0.0  # 누적 대기 시간 (초)
+        
+        # 같은 종목 동시 요청 병합
+        self._inflight = SingleFlight()
+        
+        # 헤지 요청 (느린 프로바이더를 기다리는 동안 다음 프로바이더 동시 호출)
+        self.hedge_enabled = settings.FETCH_HEDGE_ENABLED
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self.hedge_stats = {'hedged': 0, 'hedge_wins': 0, 'circuit_skips': 0}
+        
+        # 성공률/응답 시간/429 기반 프로바이더 순위
+        self.scoreboard = ProviderScoreboard()
         
     async def fetch_stock_data(self, symbol: str) -> Optional[Dict[str, Any]]:
-        """단일 주식의 실시간 데이터 가져오기"""
+        """단일 주식의 실시간 데이터 가져오기 (같은 종목 동시 요청은 한 번만 조회)"""
+        return await self._inflight.do(("stock_data", symbol), self._fetch_stock_data, symbol)
+    
+    def _providers(self) -> List[Tuple[str, Callable[[str], Awaitable[Optional[Dict[str, Any]]]]]]:
+        """조회 순서대로의 (프로바이더 이름, 조회 함수) 목록
+        
+        API 키가 없는 프로바이더는 요청 한도를 소모하지 않도록 제외합니다.
+        """
+        providers = [
+            ('alpha_vantage', self.alpha_vantage_key, self._fetch_from_alpha_vantage),
+            ('twelve_data', self.twelve_data_key, self._fetch_from_twelve_data),
+            ('fmp', self.fmp_key, self._fetch_from_fmp),
+            ('yahoo_finance', True, self._fetch_from_yahoo_finance),  # 무료 백업 (키 불필요)
+        ]
+        return [(name, provider) for name, key, provider in providers if key]
+    
+    async def _fetch_stock_data(self, symbol: str) -> Optional[Dict[str, Any]]:
         try:
             # 여러 API를 시도해서 데이터 가져오기
-            providers = [
-                self._fetch_from_alpha_vantage,
-                self._fetch_from_twelve_data,
-                self._fetch_from_fmp,
-                self._fetch_from_yahoo_finance  # 무료 백업
-            ]
+            providers = self._ordered_providers()
+            if self.hedge_enabled:
+                return await self._fetch_hedged(symbol, providers)
             
-            for provider in providers:
+            for name, provider in providers:
                 try:
-                    data = await provider(symbol)
+                    data = await self._timed_fetch(name, provider, symbol)
                     if data:
-                        logger.info(f"Successfully fetched {symbol} from {provider.__name__}")
+                        logger.info(f"Successfully fetched {symbol} from {name}")
                         return data
                 except Exception as e:
-                    logger.warning(f"Failed to fetch {symbol} from {provider.__name__}: {str(e)}")
+                    logger.warning(f"Failed to fetch {symbol} from {name}: {str(e)}")
                     continue
                     
             logger.error(f"All providers failed for symbol: {symbol}")
@@ -53,6 +100,169 @@ class StockDataFetcher:
             logger.error(f"Error fetching stock data for {symbol}: {str(e)}")
             return None
     
+    async def _fetch_hedged(self, symbol: str, providers) -> Optional[Dict[str, Any]]:
+        """헤지 요청: 앞 프로바이더가 지연 예산 안에 응답하지 않으면 다음 프로바이더도 호출
+        
+        먼저 유효한 응답을 준 쪽을 사용하고 나머지 요청은 취소합니다.
+        실패한 프로바이더가 있으면 기다리지 않고 바로 다음 프로바이더를 호출합니다.
+        """
+        if not providers:
+            # 모든 프로바이더의 서킷이 열려 있음
+            logger.error(f"All providers failed or circuits open for symbol: {symbol}")
+            return None
+        
+        pending: Dict[asyncio.Task, str] = {}
+        launched = 0
+        
+        def launch() -> Tuple[str, asyncio.Event]:
+            nonlocal launched
+            name, provider = providers[launched]
+            launched += 1
+            granted = asyncio.Event()
+            task = asyncio.ensure_future(self._timed_fetch(name, provider, symbol, granted))
+            pending[task] = name
+            return name, granted
+        
+        last_name, last_granted = launch()
+        try:
+            while pending:
+                if launched < len(providers) and not last_granted.is_set():
+                    # 마지막 요청이 아직 우리 rate limiter에서 대기 중이면 헤지 타이머를 시작하지 않음
+                    granted_wait = asyncio.ensure_future(last_granted.wait())
+                    try:
+                        done, _ = await asyncio.wait(
+                            [*pending, granted_wait], return_when=asyncio.FIRST_COMPLETED
+                        )
+                    finally:
+                        granted_wait.cancel()
+                    done.discard(granted_wait)
+                    if not done:
+                        continue
+                else:
+                    delay = self.hedge_delay(last_name) if launched < len(providers) else None
+                    done, _ = await asyncio.wait(
+                        pending, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+                    )
+                
+                failed = False
+                for task in done:
+                    name = pending.pop(task)
+                    try:
+                        data = task.result()
+                    except Exception as e:
+                        logger.warning(f"Failed to fetch {symbol} from {name}: {str(e)}")
+                        data = None
+                    if data:
+                        if pending:
+                            # 아직 응답하지 않은 요청을 앞질러 이김
+                            self.hedge_stats['hedge_wins'] += 1
+                        logger.info(f"Successfully fetched {symbol} from {name}")
+                        return data
+                    failed = True
+                
+                if launched < len(providers) and (failed or not done):
+                    if not done:
+                        # 지연 예산 초과: 앞 요청은 유지한 채 다음 프로바이더 동시 호출
+                        self.hedge_stats['hedged'] += 1
+                    last_name, last_granted = launch()
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        logger.error(f"All providers failed for symbol: {symbol}")
+        return None
+    
+    def _ordered_providers(self):
+        """점수가 높은 순서로 정렬하고 서킷이 열린 프로바이더는 호출 없이 제외"""
+        providers = dict(self._providers())
+        ordered = []
+        for name in self.scoreboard.rank(providers):
+            if self._breaker(name).is_open():
+                self.hedge_stats['circuit_skips'] += 1
+                continue
+            ordered.append((name, providers[name]))
+        return ordered
+    
+    def _breaker(self, name: str) -> CircuitBreaker:
+        return get_circuit_breaker(
+            f"provider:{name}",
+            failure_threshold=settings.PROVIDER_CIRCUIT_FAILURE_THRESHOLD,
+            recovery_timeout=settings.PROVIDER_CIRCUIT_RECOVERY_TIMEOUT,
+        )
+    
+    async def _timed_fetch(self, name: str, provider, symbol: str,
+                           granted: Optional[asyncio.Event] = None) -> Optional[Dict[str, Any]]:
+        """요청 한도를 얻은 뒤 서킷 브레이커를 통해 호출하고 결과를 점수판/응답 시간 히스토그램에 기록
+        
+        한도 대기 시간은 응답 시간에 포함하지 않으며, 한도를 얻으면 granted를 설정해
+        헤지 타이머가 그때부터 시작되도록 합니다. 헤지에서 져서 취소된 요청은 기록하지 않습니다.
+        """
+        # 우리 한도 대기 시간 초과(RateLimitTimeout)는 프로바이더 문제가 아니므로
+        # 서킷 브레이커/점수판 밖에서 처리 (실제 429와 한도 안내 응답만 요청 한도 초과로 기록)
+        await self._acquire_rate_limit(name)
+        if granted is not None:
+            granted.set()
+        
+        start = time.perf_counter()
+        try:
+            data = await self._breaker(name).call(self._call_provider, name, provider, symbol)
+        except ProviderRateLimitedError:
+            self.scoreboard.record_failure(name, rate_limited=True)
+            raise
+        except Exception:
+            self.scoreboard.record_failure(name)
+            raise
+        
+        elapsed = time.perf_counter() - start
+        self.latency.setdefault(name, LatencyHistogram()).record(elapsed)
+        self.scoreboard.record_success(name, elapsed)
+        return data
+    
+    @staticmethod
+    async def _call_provider(name: str, provider, symbol: str) -> Dict[str, Any]:
+        """빈 응답도 실패로 처리해 서킷 브레이커와 점수판이 같은 결과를 기록하도록 함"""
+        data = await provider(symbol)
+        if not data:
+            raise ProviderError(f"{name}: no data for {symbol}")
+        return data
+    
+    def hedge_delay(self, name: str) -> float:
+        """프로바이더의 헤지 대기 시간 (응답 시간 백분위, 샘플이 부족하면 기본값)"""
+        histogram = self.latency.get(name)
+        if histogram is None or histogram.count < settings.FETCH_HEDGE_MIN_SAMPLES:
+            return settings.FETCH_HEDGE_DEFAULT_DELAY
+        return max(
+            settings.FETCH_HEDGE_MIN_DELAY,
+            histogram.percentile(settings.FETCH_HEDGE_PERCENTILE),
+        )
+    
+    def get_provider_stats(self) -> Dict[str, Any]:
+        """프로바이더별 응답 시간 분포와 헤지 통계"""
+        return {
+            'latency': {name: hist.summary() for name, hist in self.latency.items()},
+            'hedge_delay': {name: self.hedge_delay(name) for name in self.latency},
+            **self.hedge_stats,
+            'scores': self.scoreboard.get_stats(),
+            'rate_limit_wait_seconds': round(self.rate_limit_wait, 3),
+        }
+    
+    async def _acquire_rate_limit(self, provider: str) -> None:
+        """프로바이더 한도를 기다림 (사용자 요청은 최대 대기 시간 초과 시 다음 프로바이더로)"""
+        max_wait = None
+        if current_priority() is Priority.INTERACTIVE:
+            max_wait = settings.RATE_LIMIT_MAX_WAIT
+        waited = await rate_limiters.acquire(provider, max_wait=max_wait)
+        if waited:
+            self.rate_limit_wait += waited
+            logger.info(f"Rate limit wait for {provider}: {waited:.2f}s")
+    
+    @staticmethod
+    def _raise_for_status(response, provider: str) -> None:
+        if response.status == 429:
+            raise ProviderRateLimitedError(f"{provider}: HTTP 429")
+        if response.status >= 500:
+            raise ProviderError(f"{provider}: HTTP {response.status}")
+    
     async def _fetch_from_alpha_vantage(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Alpha Vantage API에서 데이터 가져오기"""
         if not self.alpha_vantage_key:
@@ -65,11 +275,15 @@ class StockDataFetcher:
             'apikey': self.alpha_vantage_key
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._parse_alpha_vantage_data(data, symbol)
+        session = http_clients.session()
+        async with session.get(http_clients.url(url), params=params) as response:
+            self._raise_for_status(response, 'alpha_vantage')
+            if response.status == 200:
+                data = await response.json()
+                if 'Note' in data or 'Information' in data:
+                    # Alpha Vantage는 한도 초과를 200 응답의 안내 메시지로 알림
+                    raise ProviderRateLimitedError(f"alpha_vantage: {data.get('Note') or data.get('Information')}")
+                return self._parse_alpha_vantage_data(data, symbol)
         return None
     
     async def _fetch_from_twelve_data(self, symbol: str) -> Optional[Dict[str, Any]]:
@@ -83,11 +297,14 @@ class StockDataFetcher:
             'apikey': self.twelve_data_key
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._parse_twelve_data(data, symbol)
+        session = http_clients.session()
+        async with session.get(http_clients.url(url), params=params) as response:
+            self._raise_for_status(response, 'twelve_data')
+            if response.status == 200:
+                data = await response.json()
+                if data.get('code') == 429:
+                    raise ProviderRateLimitedError(f"twelve_data: {data.get('message')}")
+                return self._parse_twelve_data(data, symbol)
         return None
     
     async def _fetch_from_fmp(self, symbol: str) -> Optional[Dict[str, Any]]:
@@ -98,12 +315,13 @@ class StockDataFetcher:
         url = f"https://financialmodelingprep.com/api/v3/quote/{symbol}"
         params = {'apikey': self.fmp_key}
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if data and len(data) > 0:
-                        return self._parse_fmp_data(data[0], symbol)
+        session = http_clients.session()
+        async with session.get(http_clients.url(url), params=params) as response:
+            self._raise_for_status(response, 'fmp')
+            if response.status == 200:
+                data = await response.json()
+                if data and len(data) > 0:
+                    return self._parse_fmp_data(data[0], symbol)
         return None
     
     async def _fetch_from_yahoo_finance(self, symbol: str) -> Optional[Dict[str, Any]]:
@@ -211,12 +429,11 @@ class StockDataFetcher:
     
     async def fetch_multiple_stocks(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
         """여러 주식 데이터를 동시에 가져오기"""
+        # 호출 간격은 프로바이더별 rate limiter가 조절 (고정 지연 없음)
         tasks = []
         for symbol in symbols:
             task = asyncio.create_task(self.fetch_stock_data(symbol))
             tasks.append((symbol, task))
-            # API 제한 방지를 위한 지연
-            await asyncio.sleep(self.request_delay)
         
         results = {}
         for symbol, task in tasks:
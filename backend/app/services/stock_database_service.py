@@ -3,11 +3,18 @@
 Supabase 테이블에서 주식 데이터 CRUD 작업
 """
 
+import asyncio
+import inspect
 import logging
-from typing import Dict, List, Optional, Any
+import time
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from datetime import datetime
 from decimal import Decimal
 
+from postgrest.types import ReturnMethod
+
+from app.core.config import settings
+from app.core.rate_limiter import Priority, request_priority
 from app.services.supabase_service import supabase_service
 from app.services.stock_data_fetcher import stock_fetcher, MAJOR_STOCKS
 
@@ -160,34 +167,37 @@ class StockDatabaseService:
             logger.error(f"Error fetching stock {symbol}: {str(e)}")
             return None
     
+    def _normalize_stock_row(self, stock_data: Dict[str, Any]) -> Dict[str, Any]:
+        """stocks 테이블 행으로 정규화 (빈 값 제거)"""
+        normalized_data = {
+            'symbol': stock_data['symbol'].upper(),
+            'name': stock_data['name'],
+            'name_kr': stock_data.get('name_kr'),
+            'market': stock_data.get('market', 'NASDAQ'),
+            'price': float(stock_data['price']),
+            'open_price': stock_data.get('open_price'),
+            'high_price': stock_data.get('high_price'),
+            'low_price': stock_data.get('low_price'),
+            'previous_close': stock_data.get('previous_close'),
+            'change_amount': stock_data.get('change_amount'),
+            'change_percent': stock_data.get('change_percent'),
+            'volume': stock_data.get('volume'),
+            'market_cap': stock_data.get('market_cap'),
+            'currency': stock_data.get('currency', 'USD'),
+            'sector': stock_data.get('sector'),
+            'industry': stock_data.get('industry'),
+            'description': stock_data.get('description'),
+            'is_active': True,
+            'last_updated': datetime.utcnow().isoformat()
+        }
+        
+        # 빈 값 제거
+        return {k: v for k, v in normalized_data.items() if v is not None}
+    
     async def upsert_stock(self, stock_data: Dict[str, Any]) -> bool:
         """주식 데이터 추가/업데이트"""
         try:
-            # 데이터 정규화
-            normalized_data = {
-                'symbol': stock_data['symbol'].upper(),
-                'name': stock_data['name'],
-                'name_kr': stock_data.get('name_kr'),
-                'market': stock_data.get('market', 'NASDAQ'),
-                'price': float(stock_data['price']),
-                'open_price': stock_data.get('open_price'),
-                'high_price': stock_data.get('high_price'),
-                'low_price': stock_data.get('low_price'),
-                'previous_close': stock_data.get('previous_close'),
-                'change_amount': stock_data.get('change_amount'),
-                'change_percent': stock_data.get('change_percent'),
-                'volume': stock_data.get('volume'),
-                'market_cap': stock_data.get('market_cap'),
-                'currency': stock_data.get('currency', 'USD'),
-                'sector': stock_data.get('sector'),
-                'industry': stock_data.get('industry'),
-                'description': stock_data.get('description'),
-                'is_active': True,
-                'last_updated': datetime.utcnow().isoformat()
-            }
-            
-            # 빈 값 제거
-            normalized_data = {k: v for k, v in normalized_data.items() if v is not None}
+            normalized_data = self._normalize_stock_row(stock_data)
             
             response = self.supabase.table('stocks').upsert(normalized_data).execute()
             
@@ -197,49 +207,199 @@ class StockDatabaseService:
             logger.error(f"Error upserting stock data: {str(e)}")
             return False
     
-    async def bulk_upsert_stocks(self, stocks_data: List[Dict[str, Any]]) -> int:
-        """여러 주식 데이터 일괄 업데이트"""
-        success_count = 0
+    async def bulk_upsert_stocks(self, stocks_data: List[Dict[str, Any]],
+                                 chunk_size: Optional[int] = None) -> int:
+        """여러 주식 데이터 일괄 업데이트 (저장된 종목 수 반환)
+        
+        청크별 결과가 필요하면 bulk_upsert_stock_rows를 사용합니다.
+        """
+        result = await self.bulk_upsert_stock_rows(stocks_data, chunk_size=chunk_size)
+        return result['upserted']
+    
+    async def bulk_upsert_stock_rows(self, stocks_data: List[Dict[str, Any]],
+                                     chunk_size: Optional[int] = None) -> Dict[str, Any]:
+        """여러 주식 데이터를 청크 단위로 upsert하고 결과 요약을 반환
         
+        정규화한 행을 chunk_size개(기본 SYNC_UPSERT_CHUNK_SIZE)씩 묶어 요청 한 번으로
+        upsert합니다 (symbol이 같으면 갱신). 실패한 청크는 결과에 기록하고 나머지는 계속 저장합니다.
+        
+        반환값: requested, upserted, chunks, failed_chunks(index/symbols/error), invalid_symbols
+        """
+        chunk_size = max(1, chunk_size or settings.SYNC_UPSERT_CHUNK_SIZE)
+        
+        rows: Dict[str, Dict[str, Any]] = {}
+        invalid_symbols = []
         for stock_data in stocks_data:
-            if await self.upsert_stock(stock_data):
-                success_count += 1
+            try:
+                row = self._normalize_stock_row(stock_data)
+            except (KeyError, TypeError, ValueError, AttributeError) as e:
+                logger.error(f"Invalid stock data {stock_data.get('symbol')}: {str(e)}")
+                invalid_symbols.append(stock_data.get('symbol'))
+                continue
+            # 한 요청 안에 같은 종목이 두 번 있으면 충돌 오류가 나므로 마지막 값만 사용
+            rows[row['symbol']] = row
+        
+        # PostgREST 다중 행 요청은 모든 행의 컬럼이 같아야 하므로 컬럼 구성별로 묶음
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for row in rows.values():
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+        chunks = [
+            group[start:start + chunk_size]
+            for group in groups.values()
+            for start in range(0, len(group), chunk_size)
+        ]
         
-        logger.info(f"Successfully updated {success_count}/{len(stocks_data)} stocks")
-        return success_count
+        loop = asyncio.get_running_loop()
+        upserted = 0
+        failed_chunks = []
+        for index, chunk in enumerate(chunks):
+            try:
+                # supabase 클라이언트는 동기 함수이므로 스레드에서 실행
+                await loop.run_in_executor(None, self._upsert_rows_sync, chunk)
+                upserted += len(chunk)
+            except Exception as e:
+                logger.error(f"Error upserting stock chunk {index} ({len(chunk)} rows): {str(e)}")
+                failed_chunks.append({
+                    'index': index,
+                    'symbols': [row['symbol'] for row in chunk],
+                    'error': str(e)
+                })
+        
+        logger.info(f"Successfully updated {upserted}/{len(stocks_data)} stocks in {len(chunks)} requests")
+        return {
+            'requested': len(stocks_data),
+            'upserted': upserted,
+            'chunks': len(chunks),
+            'failed_chunks': failed_chunks,
+            'invalid_symbols': invalid_symbols
+        }
+    
+    def _upsert_rows_sync(self, rows: List[Dict[str, Any]]) -> None:
+        """행 목록을 요청 한 번으로 upsert (응답 본문은 받지 않음)"""
+        self.supabase.table('stocks')\
+            .upsert(rows, on_conflict='symbol', returning=ReturnMethod.minimal)\
+            .execute()
     
-    async def sync_from_external_api(self, symbols: List[str] = None) -> Dict[str, Any]:
-        """외부 API에서 데이터를 가져와서 데이터베이스 동기화"""
+    def _apply_major_stock_name(self, data: Dict[str, Any]) -> None:
+        """주요 종목이면 한글명/전체 이름 추가"""
+        full_name = MAJOR_STOCKS.get(data['symbol'])
+        if full_name is None:
+            return
+        # 한글명 추출 (괄호 안의 내용)
+        if '(' in full_name and ')' in full_name:
+            data['name_kr'] = full_name.split('(')[1].split(')')[0]
+        data['name'] = full_name
+    
+    def _prepare_sync_batch(self, fetched: List[Tuple[str, Dict[str, Any]]]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """조회 결과 한 청크를 저장할 행으로 정리하고 (유효한 행, 잘못된 종목) 반환"""
+        rows = []
+        invalid = []
+        for symbol, data in fetched:
+            data.setdefault('symbol', symbol)
+            self._apply_major_stock_name(data)
+            try:
+                price = float(data['price'])
+            except (KeyError, TypeError, ValueError):
+                price = 0.0
+            if price <= 0 or not data.get('name'):
+                invalid.append(symbol)
+                continue
+            rows.append(data)
+        return rows, invalid
+    
+    async def sync_from_external_api(self, symbols: List[str] = None,
+                                     progress: Optional[Callable[[Dict[str, Any]], Any]] = None) -> Dict[str, Any]:
+        """외부 API에서 데이터를 가져와서 데이터베이스 동기화
+        
+        종목 조회(최대 SYNC_FETCH_CONCURRENCY개 동시, 호출량은 프로바이더 rate limiter가
+        제한)와 SYNC_UPSERT_CHUNK_SIZE개 단위의 정규화/저장을 겹쳐 실행합니다.
+        progress가 주어지면 청크를 저장할 때마다 진행 상황 dict로 호출합니다.
+        """
         try:
             if symbols is None:
                 symbols = list(MAJOR_STOCKS.keys())
+            symbols = list(dict.fromkeys(symbols))
             
             logger.info(f"Syncing {len(symbols)} stocks from external APIs")
             
-            # 외부 API에서 데이터 가져오기
-            external_data = await stock_fetcher.fetch_multiple_stocks(symbols)
-            
-            # 한글명 추가
-            for symbol, data in external_data.items():
-                if symbol in MAJOR_STOCKS:
-                    # 한글명 추출 (괄호 안의 내용)
-                    full_name = MAJOR_STOCKS[symbol]
-                    if '(' in full_name and ')' in full_name:
-                        kr_name = full_name.split('(')[1].split(')')[0]
-                        data['name_kr'] = kr_name
-                        data['name'] = full_name
+            started = time.monotonic()
+            chunk_size = max(1, settings.SYNC_UPSERT_CHUNK_SIZE)
+            state = {'total': len(symbols), 'processed': 0, 'fetched': 0, 'failed': 0, 'upserted': 0, 'chunks': 0}
+            failed_symbols = []
+            
+            pending: asyncio.Queue = asyncio.Queue()
+            for symbol in symbols:
+                pending.put_nowait(symbol)
+            # 저장이 밀리면 조회도 멈추도록 결과 대기열 크기를 제한
+            results: asyncio.Queue = asyncio.Queue(maxsize=chunk_size * 2)
+            
+            async def fetch_worker():
+                while not pending.empty():
+                    symbol = pending.get_nowait()
+                    try:
+                        data = await stock_fetcher.fetch_stock_data(symbol)
+                    except Exception as e:
+                        logger.error(f"Error fetching {symbol}: {str(e)}")
+                        data = None
+                    await results.put((symbol, data))
+            
+            async def flush(chunk: List[Tuple[str, Dict[str, Any]]]):
+                rows, invalid = self._prepare_sync_batch(chunk)
+                failed_symbols.extend(invalid)
+                state['failed'] += len(invalid)
+                if rows:
+                    result = await self.bulk_upsert_stock_rows(rows, chunk_size=chunk_size)
+                    state['upserted'] += result['upserted']
+                    # 저장에 실패한 행은 요청한 종목 코드로 되돌려 보고
+                    requested = {str(data['symbol']).upper(): symbol for symbol, data in chunk}
+                    rejected = list(result['invalid_symbols'])
+                    for failure in result['failed_chunks']:
+                        rejected.extend(failure['symbols'])
+                    rejected = [requested.get(str(symbol).upper(), symbol) for symbol in rejected]
+                    failed_symbols.extend(rejected)
+                    state['failed'] += len(rejected)
+                state['chunks'] += 1
+                await self._report_sync_progress(state, started, progress)
+            
+            # 외부 API 조회는 사용자 요청보다 낮은 우선순위로 한도 사용 (워커 태스크에 전달됨)
+            concurrency = max(1, min(settings.SYNC_FETCH_CONCURRENCY, len(symbols)))
+            with request_priority(Priority.BULK):
+                workers = [asyncio.create_task(fetch_worker()) for _ in range(concurrency)]
+            
+            try:
+                chunk = []
+                for _ in range(len(symbols)):
+                    symbol, data = await results.get()
+                    state['processed'] += 1
+                    if data:
+                        state['fetched'] += 1
+                        chunk.append((symbol, data))
                     else:
-                        data['name'] = full_name
+                        state['failed'] += 1
+                        failed_symbols.append(symbol)
+                    if len(chunk) >= chunk_size:
+                        await flush(chunk)
+                        chunk = []
+                if chunk:
+                    await flush(chunk)
+            finally:
+                for worker in workers:
+                    worker.cancel()
             
-            # 데이터베이스에 저장
-            stocks_list = list(external_data.values())
-            updated_count = await self.bulk_upsert_stocks(stocks_list)
+            elapsed = time.monotonic() - started
+            failed = set(failed_symbols)
+            logger.info(
+                f"Synced {state['upserted']}/{len(symbols)} stocks in {elapsed:.1f}s "
+                f"({state['chunks']} chunks, {state['failed']} failed)"
+            )
             
             return {
                 'total_requested': len(symbols),
-                'fetched_from_api': len(external_data),
-                'updated_in_db': updated_count,
-                'failed_symbols': [s for s in symbols if s not in external_data],
+                'fetched_from_api': state['fetched'],
+                'updated_in_db': state['upserted'],
+                'failed_symbols': [s for s in symbols if s in failed],
+                'chunks': state['chunks'],
+                'elapsed_seconds': round(elapsed, 3),
                 'updated_at': datetime.utcnow().isoformat()
             }
             
@@ -251,6 +411,26 @@ class StockDatabaseService:
                 'updated_in_db': 0
             }
     
+    async def _report_sync_progress(self, state: Dict[str, int], started: float,
+                                    progress: Optional[Callable[[Dict[str, Any]], Any]]) -> None:
+        """청크 저장 후 진행 상황 기록 (콜백은 동기/비동기 함수 모두 가능)"""
+        elapsed = time.monotonic() - started
+        report = dict(state)
+        report['elapsed_seconds'] = round(elapsed, 3)
+        report['symbols_per_second'] = round(state['processed'] / elapsed, 2) if elapsed > 0 else 0.0
+        logger.info(
+            f"Sync progress: {state['processed']}/{state['total']} processed, "
+            f"{state['upserted']} upserted"
+        )
+        if progress is None:
+            return
+        try:
+            result = progress(report)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(f"Error reporting sync progress: {str(e)}")
+    
     async def get_all_active_stocks(self) -> List[Dict[str, Any]]:
         """모든 활성 주식 목록 조회"""
         try:
@@ -14,6 +14,8 @@ from typing import Dict, List, Optional, Union
 
 import aiohttp
 
+from app.core.http_client import http_clients
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,12 +39,12 @@ class StockSearchService:
         self.session: Optional[aiohttp.ClientSession] = None
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        # 공유 커넥션 풀의 세션을 사용 (닫지 않고 재사용)
+        self.session = http_clients.session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        self.session = None
 
     async def search_stocks(
         self, query: str, market: str = "all", limit: int = 50
@@ -96,7 +98,8 @@ class StockSearchService:
                 "apikey": self.alpha_vantage_key,
             }
 
-            async with self.session.get(url, params=params) as response:
+            session = self.session or http_clients.session()
+            async with session.get(http_clients.url(url), params=params) as response:
                 if response.status != 200:
                     return []
 
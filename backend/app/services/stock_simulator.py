@@ -5,9 +5,11 @@ import logging
 import random
 import time
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
+from app.core.config import settings
 from app.services.data_normalizer import DataSource, data_normalizer
+from app.services.tick_clock import TickTime
 
 logger = logging.getLogger(__name__)
 
@@ -15,11 +17,18 @@ logger = logging.getLogger(__name__)
 class StockDataSimulator:
     """실시간 주식 데이터를 시뮬레이션하는 클래스."""
 
-    def __init__(self):
+    def __init__(self, engine: Optional[str] = None):
         self.is_running = False
         self.stock_data: Dict[str, Dict] = {}
         self.simulation_task = None
 
+        # 틱 엔진 모드: "python" (종목별 딕셔너리) 또는 "vectorized" (NumPy 배열)
+        self.engine_mode = engine or settings.SIMULATION_ENGINE
+        self.tick_engine = None
+
+        # 확률적 가격 모델 스트림 (None이면 기존 ±2% 균등 분포 사용)
+        self.price_streams = None
+
         # 시뮬레이션할 주식 목록과 기본 데이터
         self.stock_symbols = {
             "AAPL": {"name": "Apple Inc. (애플)", "base_price": 180.00},
@@ -37,61 +46,189 @@ class StockDataSimulator:
         # 초기 주식 데이터 설정
         self.initialize_stock_data()
 
+        if settings.SIMULATION_PRICE_MODEL:
+            from app.services.price_models import create_price_model
+
+            self.set_price_model(
+                create_price_model(settings.SIMULATION_PRICE_MODEL),
+                seed=settings.SIMULATION_SEED,
+            )
+
+    @property
+    def is_vectorized(self) -> bool:
+        """벡터화 틱 엔진 사용 여부."""
+        return self.engine_mode == "vectorized"
+
     def initialize_stock_data(self):
         """주식 데이터 초기화."""
-        for symbol, info in self.stock_symbols.items():
-            base_price = info["base_price"]
-            initial_data = {
-                "symbol": symbol,
-                "name": info["name"],
-                "price": base_price,
-                "previous_close": base_price,
-                "open": base_price + random.uniform(-5, 5),
-                "high": base_price + random.uniform(0, 10),
-                "low": base_price + random.uniform(-10, 0),
-                "volume": random.randint(1000000, 50000000),
-                "change": 0.0,
-                "change_percent": 0.0,
-                "timestamp": datetime.now().isoformat(),
-            }
-
-            # 데이터 정규화 및 검증 (향상된 버전 사용)
-            validation_result = data_normalizer.normalize_and_validate(
-                symbol, initial_data, DataSource.MOCK
+        if self.is_vectorized:
+            self._initialize_tick_engine()
+            return
+
+        for symbol in self.stock_symbols:
+            self._initialize_symbol(symbol)
+
+    def _initialize_symbol(self, symbol: str) -> None:
+        """종목 하나의 초기 데이터를 설정합니다 (다른 종목 상태는 유지)."""
+        info = self.stock_symbols[symbol]
+        if self.is_vectorized:
+            self.tick_engine.add_symbol(symbol, info["name"], info["base_price"])
+            return
+
+        base_price = info["base_price"]
+        initial_data = {
+            "symbol": symbol,
+            "name": info["name"],
+            "price": base_price,
+            "previous_close": base_price,
+            "open": base_price + random.uniform(-5, 5),
+            "high": base_price + random.uniform(0, 10),
+            "low": base_price + random.uniform(-10, 0),
+            "volume": random.randint(1000000, 50000000),
+            "change": 0.0,
+            "change_percent": 0.0,
+            "timestamp": datetime.now().isoformat(),
+        }
+
+        # 데이터 정규화 및 검증 (향상된 버전 사용)
+        validation_result = data_normalizer.normalize_and_validate(
+            symbol, initial_data, DataSource.MOCK
+        )
+
+        if validation_result.is_valid:
+            self.stock_data[symbol] = self._add_change(
+                validation_result.normalized_data
+            )
+            logger.debug(
+                f"{symbol} 초기 데이터 정규화 성공 (품질 점수: {validation_result.normalized_data.get('data_quality', 'N/A')})"
             )
 
-            if validation_result.is_valid:
-                self.stock_data[symbol] = validation_result.normalized_data
-                logger.debug(
-                    f"{symbol} 초기 데이터 정규화 성공 (품질 점수: {validation_result.normalized_data.get('data_quality', 'N/A')})"
+            # 경고가 있는 경우 로깅
+            if validation_result.warnings:
+                logger.warning(
+                    f"{symbol} 초기 데이터 경고: {', '.join(validation_result.warnings)}"
                 )
-
-                # 경고가 있는 경우 로깅
-                if validation_result.warnings:
-                    logger.warning(
-                        f"{symbol} 초기 데이터 경고: {', '.join(validation_result.warnings)}"
-                    )
-            else:
+        else:
+            logger.error(
+                f"{symbol} 초기 데이터 정규화 실패: {validation_result.errors}"
+            )
+            # 검증 실패 시 기본 데이터 사용
+            self.stock_data[symbol] = initial_data
+
+    def _initialize_tick_engine(self):
+        """벡터화 틱 엔진 초기화 (numpy 필요)."""
+        from app.services.tick_engine import StockDataView, VectorizedTickEngine
+
+        self.tick_engine = VectorizedTickEngine(self.stock_symbols)
+        self.stock_data = StockDataView(self.tick_engine)
+        self._record_vectorized_tick(TickTime())
+        logger.info(f"벡터화 틱 엔진 초기화: {len(self.tick_engine)}개 종목")
+
+    def _record_vectorized_tick(
+        self, tick: TickTime, symbols: Optional[List[str]] = None
+    ) -> None:
+        """엔진 상태를 python 모드와 같은 배치 정규화 경로로 기록합니다.
+
+        이상치 탐지, 이력, 품질 메트릭이 엔진 모드와 관계없이 같게 유지됩니다.
+        행 딕셔너리는 계속 조회 시점에 엔진 배열에서 만듭니다.
+        """
+        batch = self.tick_engine.quote_batch(symbols)
+        results = data_normalizer.normalize_batch(batch, DataSource.MOCK, tick)
+        for symbol, validation_result in zip(batch.symbols, results):
+            if not validation_result.is_valid:
                 logger.error(
-                    f"{symbol} 초기 데이터 정규화 실패: {validation_result.errors}"
+                    f"{symbol} 데이터 업데이트 정규화 실패: {validation_result.errors}"
                 )
-                # 검증 실패 시 기본 데이터 사용
-                self.stock_data[symbol] = initial_data
+            elif validation_result.warnings:
+                logger.warning(
+                    f"{symbol} 이상치 탐지: {', '.join(validation_result.warnings)}"
+                )
+
+    @staticmethod
+    def _add_change(data: Dict) -> Dict:
+        """정규화 결과에 전일 종가 대비 변화량(change)을 채웁니다."""
+        data["change"] = round(data["price"] - data["previous_close"], 2)
+        return data
+
+    def set_price_model(
+        self, model, seed: Optional[int] = None, block_size: int = 256
+    ) -> None:
+        """가격 모델을 설정합니다 (numpy 필요).
+
+        종목별로 시드가 고정된 난수 생성기에서 block_size개의 틱을 일괄 생성하므로,
+        같은 시드로 실행하면 같은 가격 스트림이 재현됩니다.
+        model이 None이면 기존 균등 분포 방식으로 되돌립니다.
+        """
+        if model is None:
+            self.price_streams = None
+            return
+
+        from app.services.price_models import PriceStreams
+
+        self.price_streams = PriceStreams(model, seed=seed, block_size=block_size)
+        for symbol in self.stock_data:
+            info = self.stock_symbols.get(symbol, {})
+            self.price_streams.register(
+                symbol,
+                self.stock_data[symbol]["price"],
+                reference_price=info.get("base_price"),
+            )
+
+        logger.info(f"가격 모델 설정: {model.name} (seed={seed})")
+
+    def _next_price(self, symbol: str, current_price: float) -> float:
+        """다음 틱 가격을 계산합니다."""
+        if self.price_streams is not None:
+            return round(self.price_streams.next_price(symbol, current_price), 2)
+
+        # 가격 변동 (-2% ~ +2%)
+        change_percent = random.uniform(-0.02, 0.02)
+        return round(current_price * (1 + change_percent), 2)
+
+    def _advance_vectorized(self, tick: Optional[TickTime] = None) -> None:
+        """벡터화 엔진의 전체 종목을 한 틱 전진시킵니다."""
+        now = tick.epoch if tick is not None else None
+        if self.price_streams is None:
+            self.tick_engine.step(now=now)
+            return
+
+        # 엔진에 새로 추가된 종목의 스트림 등록 (등록 순서 = 엔진 행 순서)
+        engine = self.tick_engine
+        for symbol in engine.symbols[len(self.price_streams) :]:
+            self.price_streams.register(
+                symbol, float(engine.price[engine.index[symbol]])
+            )
+
+        engine.step(self.price_streams.next_all(), now=now)
 
     def generate_price_update(self, symbol: str) -> Dict:
         """특정 주식의 가격 업데이트를 생성."""
         if symbol not in self.stock_data:
             return None
 
+        if self.is_vectorized:
+            new_price = None
+            if self.price_streams is not None:
+                new_price = self._next_price(symbol, self.stock_data[symbol]["price"])
+            self.tick_engine.step_symbol(symbol, new_price)
+            self._record_vectorized_tick(TickTime(), [symbol])
+            return self.tick_engine.row(symbol)
+
+        updated_data = self._build_price_update(symbol)
+
+        # 데이터 정규화 및 검증 (향상된 버전 사용)
+        validation_result = data_normalizer.normalize_and_validate(
+            symbol, updated_data, DataSource.MOCK
+        )
+        return self._apply_validation_result(symbol, validation_result)
+
+    def _build_price_update(self, symbol: str, tick: Optional[TickTime] = None) -> Dict:
+        """다음 틱의 원시 시세 데이터를 만듭니다 (검증 전)."""
         current_data = self.stock_data[symbol]
         current_price = current_data["price"]
 
-        # 가격 변동 (-2% ~ +2%)
-        change_percent = random.uniform(-0.02, 0.02)
-        new_price = current_price * (1 + change_percent)
-
-        # 소수점 둘째 자리까지
-        new_price = round(new_price, 2)
+        # 다음 가격 (소수점 둘째 자리까지)
+        new_price = self._next_price(symbol, current_price)
 
         # 일일 고가/저가 업데이트
         if new_price > current_data["high"]:
@@ -108,7 +245,7 @@ class StockDataSimulator:
         new_volume = current_data["volume"] + volume_increase
 
         # 업데이트할 데이터 생성
-        updated_data = {
+        return {
             "symbol": symbol,
             "price": new_price,
             "previous_close": current_data["previous_close"],
@@ -118,24 +255,24 @@ class StockDataSimulator:
             "volume": new_volume,
             "change": round(change, 2),
             "change_percent": round(price_change_percent, 2),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": tick.iso if tick is not None else datetime.now().isoformat(),
             "name": current_data.get("name", ""),
         }
 
-        # 데이터 정규화 및 검증 (향상된 버전 사용)
-        validation_result = data_normalizer.normalize_and_validate(
-            symbol, updated_data, DataSource.MOCK
-        )
+    def _apply_validation_result(self, symbol: str, validation_result) -> Dict:
+        """검증 결과를 현재 데이터에 반영하고 반환할 데이터를 만듭니다."""
+        current_data = self.stock_data[symbol]
 
         if validation_result.is_valid:
-            # 정규화된 데이터로 업데이트
-            self.stock_data[symbol].update(validation_result.normalized_data)
+            # 정규화된 데이터로 업데이트 (정규화 결과에는 change가 없으므로 다시 계산)
+            self._add_change(validation_result.normalized_data)
+            current_data.update(validation_result.normalized_data)
 
             # 로그 레벨 동적 조정 (이상치 발견 시 INFO, 아니면 DEBUG)
             log_level = logging.INFO if validation_result.warnings else logging.DEBUG
             logger.log(
                 log_level,
-                f"{symbol} 데이터 업데이트: ${new_price} (품질: {validation_result.normalized_data.get('data_quality', 'N/A')})",
+                f"{symbol} 데이터 업데이트: ${current_data['price']} (품질: {validation_result.normalized_data.get('data_quality', 'N/A')})",
             )
 
             # 이상치 경고 로깅
@@ -164,10 +301,19 @@ class StockDataSimulator:
             # 최신 가격 업데이트를 생성하여 반환
             return self.generate_price_update(symbol)
         else:
-            # 새로운 종목인 경우 기본 데이터로 초기화
+            # 아직 초기화되지 않은 기본 종목은 해당 종목만 초기화 (전체 재생성 없음)
             if symbol in self.stock_symbols:
-                self.initialize_stock_data()
+                self._initialize_symbol(symbol)
                 return self.stock_data.get(symbol)
+            elif self.is_vectorized:
+                # 알려지지 않은 종목은 엔진에 행을 추가
+                self.tick_engine.add_symbol(
+                    symbol,
+                    f"{symbol} Corp.",
+                    round(random.uniform(50, 500), 2),
+                    previous_close=round(random.uniform(50, 500), 2),
+                )
+                return self.tick_engine.row(symbol)
             else:
                 # 알려지지 않은 종목의 경우 모의 데이터 생성
                 mock_data = {
@@ -215,13 +361,29 @@ class StockDataSimulator:
 
         logger.info("주식 데이터 시뮬레이션 중지")
 
+    def advance(self):
+        """모든 종목을 한 틱 전진시킴."""
+        if self.is_vectorized:
+            # 전체 종목을 한 번의 벡터 연산으로 업데이트한 뒤 배치로 품질/이상치 기록
+            tick = TickTime()
+            self._advance_vectorized(tick)
+            self._record_vectorized_tick(tick)
+        else:
+            # 모든 주식의 업데이트를 만든 뒤 한 번의 배치로 정규화/검증
+            symbols = [
+                symbol for symbol in self.stock_symbols if symbol in self.stock_data
+            ]
+            tick = TickTime()
+            updates = [self._build_price_update(symbol, tick) for symbol in symbols]
+            results = data_normalizer.normalize_batch(updates, DataSource.MOCK, tick)
+            for symbol, validation_result in zip(symbols, results):
+                self._apply_validation_result(symbol, validation_result)
+
     async def _run_simulation(self):
         """시뮬레이션 백그라운드 실행."""
         try:
             while self.is_running:
-                # 모든 주식의 가격 업데이트
-                for symbol in self.stock_symbols.keys():
-                    self.generate_price_update(symbol)
+                self.advance()
 
                 # 2초마다 업데이트
                 await asyncio.sleep(2)
@@ -241,8 +403,13 @@ class StockDataSimulator:
     def create_market_status(self) -> Dict:
         """시장 상태 정보를 생성."""
         total_stocks = len(self.stock_data)
-        gainers = len([s for s in self.stock_data.values() if s["change"] > 0])
-        losers = len([s for s in self.stock_data.values() if s["change"] < 0])
+        if self.is_vectorized:
+            changes = self.tick_engine.changes()
+            gainers = int((changes > 0).sum())
+            losers = int((changes < 0).sum())
+        else:
+            gainers = len([s for s in self.stock_data.values() if s["change"] > 0])
+            losers = len([s for s in self.stock_data.values() if s["change"] < 0])
         unchanged = total_stocks - gainers - losers
 
         return {
@@ -255,58 +422,8 @@ class StockDataSimulator:
         }
 
     def get_data_quality_report(self) -> Dict:
-        """데이터 품질 보고서를 생성합니다."""
-        quality_metrics = data_normalizer.get_quality_metrics()
-        recent_anomalies = data_normalizer.get_recent_anomalies(hours=1)
-
-        # 전체 통계 계산
-        total_symbols = len(quality_metrics)
-        avg_validation_rate = (
-            sum(m.validation_rate for m in quality_metrics.values()) / total_symbols
-            if total_symbols > 0
-            else 0
-        )
-        avg_anomaly_rate = (
-            sum(m.anomaly_rate for m in quality_metrics.values()) / total_symbols
-            if total_symbols > 0
-            else 0
-        )
-        avg_processing_time = (
-            sum(m.processing_time for m in quality_metrics.values()) / total_symbols
-            if total_symbols > 0
-            else 0
-        )
-
-        return {
-            "summary": {
-                "total_symbols": total_symbols,
-                "avg_validation_rate": round(avg_validation_rate, 4),
-                "avg_anomaly_rate": round(avg_anomaly_rate, 4),
-                "avg_processing_time_ms": round(avg_processing_time, 2),
-                "recent_anomalies_count": len(recent_anomalies),
-            },
-            "per_symbol_metrics": {
-                symbol: {
-                    "validation_rate": round(metrics.validation_rate, 4),
-                    "anomaly_rate": round(metrics.anomaly_rate, 4),
-                    "processing_time_ms": round(metrics.processing_time, 2),
-                    "last_updated": metrics.last_updated.isoformat(),
-                }
-                for symbol, metrics in quality_metrics.items()
-            },
-            "recent_anomalies": [
-                {
-                    "symbol": alert.symbol,
-                    "type": alert.type,
-                    "severity": alert.severity,
-                    "message": alert.message,
-                    "detected_at": alert.detected_at.isoformat(),
-                    "current_value": alert.current_value,
-                }
-                for alert in recent_anomalies[:10]  # 최근 10개만
-            ],
-            "timestamp": datetime.now().isoformat(),
-        }
+        """데이터 품질 보고서를 반환합니다 (정규화기의 틱 단위 캐시 사용)."""
+        return data_normalizer.get_quality_report()
 
 
 # 전역 시뮬레이터 인스턴스
@@ -0,0 +1,48 @@
+"""
+틱 기준 시각
+
+한 틱을 처리하는 동안 모든 종목이 같은 기준 시각을 공유하도록
+epoch 초 하나를 전달합니다. datetime 객체와 ISO 문자열은 처음 필요할 때
+틱당 한 번만 만들어 모든 종목이 재사용합니다.
+"""
+
+import time
+from datetime import datetime
+from typing import Optional
+
+
+class TickTime:
+    """한 틱의 기준 시각 (epoch 초)"""
+
+    __slots__ = ("epoch", "_datetime", "_iso")
+
+    def __init__(self, epoch: Optional[float] = None):
+        self.epoch = time.time() if epoch is None else epoch
+        self._datetime: Optional[datetime] = None
+        self._iso: Optional[str] = None
+
+    @classmethod
+    def from_datetime(cls, value: datetime) -> "TickTime":
+        """이미 만들어진 datetime으로 기준 시각을 만듭니다 (객체 재사용)."""
+        tick = cls(value.timestamp())
+        tick._datetime = value
+        return tick
+
+    @property
+    def datetime(self) -> datetime:
+        if self._datetime is None:
+            self._datetime = datetime.fromtimestamp(self.epoch)
+        return self._datetime
+
+    @property
+    def iso(self) -> str:
+        """기준 시각의 ISO 문자열 (틱당 한 번만 포맷)"""
+        if self._iso is None:
+            self._iso = self.datetime.isoformat()
+        return self._iso
+
+    def format(self, epoch: float) -> str:
+        """epoch 초를 ISO 문자열로 바꿉니다 (기준 시각과 같으면 캐시 재사용)."""
+        if epoch == self.epoch:
+            return self.iso
+        return datetime.fromtimestamp(epoch).isoformat()
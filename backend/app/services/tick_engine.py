@@ -0,0 +1,249 @@
+"""
+벡터화 틱 엔진
+
+종목별 가격/고가/저가/거래량/전일 종가를 연속된 NumPy 배열로 보관하고,
+한 번의 벡터 연산으로 전체 종목을 다음 틱으로 전진시킵니다.
+딕셔너리는 구독자가 실제로 요청할 때만 생성합니다.
+"""
+
+import time
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from app.services.data_normalizer import data_normalizer
+from app.services.data_validator import DataSource
+from app.services.quote_batch import QuoteBatch
+
+# 가격 하한 (검증기의 MIN_PRICE와 동일)
+MIN_PRICE = 0.01
+
+
+class VectorizedTickEngine:
+    """전체 종목 상태를 배열로 관리하는 틱 엔진."""
+
+    def __init__(
+        self,
+        stock_symbols: Dict[str, Dict],
+        max_change: float = 0.02,
+        seed: Optional[int] = None,
+    ):
+        self.max_change = max_change
+        self._rng = np.random.default_rng(seed)
+
+        self.symbols: List[str] = []
+        self.names: List[str] = []
+        self.index: Dict[str, int] = {}
+
+        size = len(stock_symbols)
+        self.price = np.zeros(size, dtype=np.float64)
+        self.previous_close = np.zeros(size, dtype=np.float64)
+        self.open = np.zeros(size, dtype=np.float64)
+        self.high = np.zeros(size, dtype=np.float64)
+        self.low = np.zeros(size, dtype=np.float64)
+        self.volume = np.zeros(size, dtype=np.int64)
+        self.updated_at = np.zeros(size, dtype=np.float64)  # epoch 초
+
+        self.tick_count = 0
+
+        for symbol, info in stock_symbols.items():
+            self.add_symbol(symbol, info["name"], info["base_price"])
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def add_symbol(
+        self,
+        symbol: str,
+        name: str,
+        base_price: float,
+        previous_close: Optional[float] = None,
+    ) -> int:
+        """종목을 추가하고 행 인덱스를 반환합니다."""
+        if symbol in self.index:
+            return self.index[symbol]
+
+        row = len(self.symbols)
+        if row >= len(self.price):
+            self._grow(max(8, row * 2))
+
+        self.symbols.append(symbol)
+        self.names.append(name)
+        self.index[symbol] = row
+
+        self.price[row] = base_price
+        self.previous_close[row] = (
+            previous_close if previous_close is not None else base_price
+        )
+        open_price = max(MIN_PRICE, base_price + self._rng.uniform(-5, 5))
+        self.open[row] = open_price
+        self.high[row] = max(base_price, open_price) + self._rng.uniform(0, 10)
+        self.low[row] = max(
+            MIN_PRICE, min(base_price, open_price) + self._rng.uniform(-10, 0)
+        )
+        self.volume[row] = self._rng.integers(1_000_000, 50_000_000)
+        self.updated_at[row] = time.time()
+
+        return row
+
+    def _grow(self, capacity: int) -> None:
+        """배열 용량을 늘립니다 (종목 추가 시에만 발생)."""
+        for field in ("price", "previous_close", "open", "high", "low", "volume"):
+            old = getattr(self, field)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, field, new)
+
+        old = self.updated_at
+        self.updated_at = np.zeros(capacity, dtype=np.float64)
+        self.updated_at[: len(old)] = old
+
+    def _view(self, array: np.ndarray) -> np.ndarray:
+        """사용 중인 행만 가리키는 뷰를 반환합니다."""
+        return array[: len(self.symbols)]
+
+    def step(
+        self, new_prices: Optional[np.ndarray] = None, now: Optional[float] = None
+    ) -> None:
+        """전체 종목을 한 번의 벡터 연산으로 다음 틱으로 전진시킵니다.
+
+        new_prices가 주어지면 해당 가격을 사용하고, 없으면 ±max_change 범위의
+        균등 분포로 가격 변동을 생성합니다. now는 틱 시각(epoch 초)입니다.
+        """
+        size = len(self.symbols)
+        if size == 0:
+            return
+
+        price = self._view(self.price)
+        if new_prices is None:
+            changes = self._rng.uniform(-self.max_change, self.max_change, size)
+            new_prices = price * (1.0 + changes)
+
+        np.round(new_prices, 2, out=price)
+        np.maximum(price, MIN_PRICE, out=price)
+
+        high = self._view(self.high)
+        low = self._view(self.low)
+        np.maximum(high, price, out=high)
+        np.minimum(low, price, out=low)
+
+        volume = self._view(self.volume)
+        volume += self._rng.integers(1000, 100_000, size)
+
+        self._view(self.updated_at).fill(time.time() if now is None else now)
+        self.tick_count += 1
+
+    def step_symbol(self, symbol: str, new_price: Optional[float] = None) -> None:
+        """단일 종목만 전진시킵니다 (기존 get_real_time_data 호환용)."""
+        row = self.index[symbol]
+        if new_price is None:
+            change = self._rng.uniform(-self.max_change, self.max_change)
+            new_price = self.price[row] * (1.0 + change)
+
+        price = max(MIN_PRICE, round(float(new_price), 2))
+        self.price[row] = price
+        if price > self.high[row]:
+            self.high[row] = price
+        if price < self.low[row]:
+            self.low[row] = price
+        self.volume[row] += self._rng.integers(1000, 100_000)
+        self.updated_at[row] = time.time()
+
+    def changes(self) -> np.ndarray:
+        """전일 종가 대비 변화량 배열을 반환합니다."""
+        return self._view(self.price) - self._view(self.previous_close)
+
+    def quote_batch(self, symbols: Optional[List[str]] = None) -> QuoteBatch:
+        """현재 상태를 정규화기의 배치 경로에 넣을 열 단위 배치로 만듭니다.
+
+        symbols가 없으면 전체 종목을 엔진 행 순서대로 담습니다.
+        """
+        if symbols is None:
+            rows = slice(0, len(self.symbols))
+            symbols = list(self.symbols)
+        else:
+            rows = [self.index[symbol] for symbol in symbols]
+
+        price = self.price[rows]
+        previous_close = self.previous_close[rows]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change_percent = np.where(
+                previous_close != 0,
+                (price - previous_close) / previous_close * 100,
+                0.0,
+            )
+        return QuoteBatch(
+            symbols=symbols,
+            price=price,
+            open=self.open[rows],
+            high=self.high[rows],
+            low=self.low[rows],
+            previous_close=previous_close,
+            volume=self.volume[rows].astype(np.float64),
+            change_percent=np.round(change_percent, 2),
+            timestamp=self.updated_at[rows],
+            names=[self.names[self.index[symbol]] for symbol in symbols],
+        )
+
+    def row(self, symbol: str) -> Dict:
+        """한 종목의 현재 상태를 기존 시뮬레이터와 같은 형식의 딕셔너리로 만듭니다.
+
+        python 모드의 정규화 결과와 같은 필드와 반올림(변화율 소수점 둘째 자리)을
+        사용하며, 검증/정규화 시각은 마지막 틱 시각입니다.
+        """
+        i = self.index[symbol]
+        price = float(self.price[i])
+        previous_close = float(self.previous_close[i])
+        change = price - previous_close
+        change_percent = (change / previous_close) * 100 if previous_close else 0.0
+        timestamp = datetime.fromtimestamp(float(self.updated_at[i])).isoformat()
+
+        data = {
+            "symbol": symbol,
+            "name": self.names[i],
+            "price": price,
+            "previous_close": round(previous_close, 2),
+            "open": round(float(self.open[i]), 2),
+            "high": round(float(self.high[i]), 2),
+            "low": round(float(self.low[i]), 2),
+            "volume": int(self.volume[i]),
+            "change": round(change, 2),
+            "change_percent": round(change_percent, 2),
+            "timestamp": timestamp,
+            "source": DataSource.MOCK.value,
+            "validated_at": timestamp,
+            "normalized_at": timestamp,
+        }
+        data["data_quality"] = data_normalizer.calculate_data_quality_score(data)
+        return data
+
+
+class StockDataView(Mapping):
+    """틱 엔진을 기존 stock_data 딕셔너리처럼 보이게 하는 지연 뷰.
+
+    행은 조회 시점에만 딕셔너리로 변환되므로, 틱마다 전체 종목을
+    복사하는 비용이 들지 않습니다.
+    """
+
+    def __init__(self, engine: VectorizedTickEngine):
+        self._engine = engine
+
+    def __getitem__(self, symbol: str) -> Dict:
+        if symbol not in self._engine.index:
+            raise KeyError(symbol)
+        return self._engine.row(symbol)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._engine.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._engine.symbols))
+
+    def __len__(self) -> int:
+        return len(self._engine)
+
+    def copy(self) -> Dict[str, Dict]:
+        """모든 종목을 일반 딕셔너리로 변환합니다."""
+        return {symbol: self._engine.row(symbol) for symbol in self._engine.symbols}
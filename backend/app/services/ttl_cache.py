@@ -0,0 +1,165 @@
+"""
+LRU + TTL 캐시
+
+OrderedDict 하나로 최근 사용 순서를 유지하는 캐시입니다.
+- 조회/저장/제거: O(1) (move_to_end, popitem)
+- 나이는 time.monotonic 기준 (시스템 시계 변경 영향 없음, 문자열 파싱 없음)
+- 저장 시 값을 중첩 구조까지 복사해 읽기 전용으로 고정 (호출자가 캐시를 변경할 수 없음)
+- 항목 수와 추정 메모리 크기 두 가지 상한, 넘으면 가장 오래 사용되지 않은 항목부터 제거
+- 적중/미스/제거/만료 카운터
+"""
+
+import sys
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+
+class CacheEntry(NamedTuple):
+    value: Mapping[str, Any]
+    stored_at: float
+    size: int
+
+
+def estimate_size(value: Any) -> int:
+    """값의 대략적인 메모리 크기 (바이트, 중첩 dict/list 포함)"""
+    size = sys.getsizeof(value)
+    if isinstance(value, Mapping):
+        for key, item in value.items():
+            size += sys.getsizeof(key) + estimate_size(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            size += estimate_size(item)
+    return size
+
+
+def freeze(value: Any) -> Any:
+    """중첩 dict/list까지 읽기 전용 구조(MappingProxyType/tuple)로 복사"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """freeze로 고정한 값을 변경 가능한 dict/list 복사본으로 되돌림"""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+
+class LRUTTLCache:
+    """항목 수/메모리 크기 상한이 있는 LRU + TTL 캐시"""
+
+    def __init__(
+        self,
+        max_entries: int = 100,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries는 1 이상이어야 합니다")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl  # 이 시간(초)이 지난 항목은 조회 시 제거
+        self.clock = clock
+
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self.total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0  # 용량 초과로 제거된 항목 수
+        self.expirations = 0  # TTL 만료로 제거된 항목 수
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def keys(self) -> List[Hashable]:
+        """오래 사용되지 않은 순서의 키 목록"""
+        return list(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Tuple[Mapping[str, Any], float]]:
+        """(읽기 전용 값, 저장 후 경과 초)를 반환합니다 (없거나 만료되면 None)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        age = self.clock() - entry.stored_at
+        if self.ttl is not None and age > self.ttl:
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value, age
+
+    def set(self, key: Hashable, value: Mapping[str, Any]) -> List[Hashable]:
+        """값을 중첩 구조까지 고정해 저장하고, 상한을 넘어 제거된 키 목록을 반환합니다."""
+        frozen = freeze(value)
+        size = estimate_size(value)
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = CacheEntry(frozen, self.clock(), size)
+        self.total_bytes += size
+
+        evicted = []
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        ):
+            oldest, entry = self._entries.popitem(last=False)
+            self.total_bytes -= entry.size
+            self.evictions += 1
+            evicted.append(oldest)
+        return evicted
+
+    def pop(self, key: Hashable) -> Optional[Mapping[str, Any]]:
+        if key not in self._entries:
+            return None
+        return self._remove(key).value
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def _remove(self, key: Hashable) -> CacheEntry:
+        entry = self._entries.pop(key)
+        self.total_bytes -= entry.size
+        return entry
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups * 100, 2) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
@@ -0,0 +1,22 @@
+"""
+공용 테스트 설정
+"""
+
+import asyncio
+
+import pytest_asyncio
+
+from app.core.rate_limiter import rate_limiters
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def reset_rate_limiters():
+    """테스트마다 프로바이더 요청 한도를 가득 찬 상태로 시작
+
+    정리는 테스트의 이벤트 루프 안에서 실행해 남은 대기자와 펌프 태스크를
+    루프가 닫히기 전에 취소합니다.
+    """
+    rate_limiters.reset()
+    yield
+    rate_limiters.reset()
+    await asyncio.sleep(0)
@@ -0,0 +1,145 @@
+"""
+데이터 정규화 서비스 테스트
+"""
+
+import random
+import statistics
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services.alert_store import AlertStore
+from app.services.data_normalizer import AnomalyAlert, DataNormalizer
+from app.services.data_validator import DataSource
+from app.services.rolling_window import RollingWindow
+from app.services.tick_clock import TickTime
+
+
+def test_rolling_window_matches_recomputed_stats():
+    """링 버퍼의 증분 통계는 최근 값 목록으로 다시 계산한 값과 같아야 함"""
+    rng = random.Random(7)
+    window = RollingWindow(20)
+    values = []
+    for _ in range(500):
+        value = rng.uniform(50, 150)
+        window.append(value)
+        values = (values + [value])[-20:]
+
+        assert window.to_list() == values
+        assert window.mean == pytest.approx(statistics.fmean(values))
+        assert window.sum == pytest.approx(sum(values))
+        assert window.variance == pytest.approx(statistics.pvariance(values))
+        assert window.tail_mean(3) == pytest.approx(statistics.fmean(values[-3:]))
+
+
+def test_history_is_bounded_and_detects_price_spike():
+    """이력은 윈도우 크기로 유지되고 평균 대비 급변은 이상치로 탐지되어야 함"""
+    normalizer = DataNormalizer()
+    quote = {"symbol": "AAPL", "price": 100.0, "volume": 1000}
+    for _ in range(30):
+        normalizer.normalize_and_validate("AAPL", dict(quote), DataSource.MOCK)
+
+    assert len(normalizer.price_history["AAPL"]) == normalizer.history_window
+    assert normalizer.get_history_stats("AAPL")["price"]["std"] == 0.0
+
+    result = normalizer.normalize_and_validate(
+        "AAPL", dict(quote, price=130.0), DataSource.MOCK
+    )
+    assert any("가격 급등/급락" in warning for warning in result.warnings)
+
+
+def make_alert(symbol, detected_at):
+    return AnomalyAlert(
+        symbol=symbol,
+        type="price_spike",
+        severity="high",
+        message=f"{symbol} 급등",
+        detected_at=detected_at,
+        current_value=1.0,
+    )
+
+
+def test_alert_store_bounded_with_symbol_index():
+    """알림 저장소는 최대 개수를 유지하고 종목별/기간별로 최신순 조회되어야 함"""
+    store = AlertStore(max_alerts=5)
+    start = datetime(2024, 1, 1, 9, 0)
+    for minute in range(8):
+        symbol = "AAPL" if minute % 2 == 0 else "MSFT"
+        store.add(make_alert(symbol, start + timedelta(minutes=minute)))
+
+    assert len(store) == 5
+    assert [a.detected_at.minute for a in store.recent()] == [7, 6, 5, 4, 3]
+    assert [a.detected_at.minute for a in store.recent("AAPL")] == [6, 4]
+    assert [
+        a.detected_at.minute
+        for a in store.recent("MSFT", since=start + timedelta(minutes=4))
+    ] == [7, 5]
+
+    assert store.evict_before(start + timedelta(minutes=6)) == 3
+    assert store.recent("MSFT")[0].detected_at.minute == 7
+    assert store.recent("UNKNOWN") == []
+
+
+def test_normalizer_alert_retention_is_configurable():
+    """정규화기의 알림 보관 개수는 설정값을 따라야 함"""
+    normalizer = DataNormalizer(max_alerts=3)
+    now = datetime.now()
+    normalizer.anomaly_alerts.extend(make_alert("AAPL", now) for _ in range(10))
+
+    assert len(normalizer.get_recent_anomalies("AAPL", hours=1)) == 3
+
+
+def test_quality_aggregates_are_incremental_and_report_cached():
+    """품질 합계는 종목별 메트릭과 일치하고 보고서는 틱 주기 동안 재사용되어야 함"""
+    normalizer = DataNormalizer()
+    rng = random.Random(5)
+    for _ in range(200):
+        symbol = rng.choice(["AAPL", "MSFT", "NVDA"])
+        normalizer._record_quality_metrics(
+            symbol, rng.random() > 0.1, rng.uniform(0, 2), rng.random() > 0.8
+        )
+
+    metrics = normalizer.get_quality_metrics().values()
+    summary = normalizer.get_quality_summary()
+    assert summary["total_symbols"] == 3
+    assert summary["avg_validation_rate"] == round(
+        statistics.fmean(m.validation_rate for m in metrics), 4
+    )
+    assert summary["avg_processing_time_ms"] == round(
+        statistics.fmean(m.processing_time for m in metrics), 2
+    )
+
+    normalizer.report_ttl = 60
+    report = normalizer.get_quality_report()
+    normalizer._record_quality_metrics("TSLA", True, 1.0)
+    assert normalizer.get_quality_report() is report
+
+    normalizer.report_ttl = 0
+    normalizer._quality_report_expires = 0
+    assert normalizer.get_quality_report()["summary"]["total_symbols"] == 4
+
+
+def test_tick_mode_shares_one_timestamp():
+    """틱 모드는 틱 기준 시각 하나로 메타데이터와 무결성 검사를 처리해야 함"""
+    normalizer = DataNormalizer()
+    tick = TickTime()
+    quote = {
+        "symbol": "AAPL",
+        "price": 100.0,
+        "high": 101.0,
+        "low": 99.0,
+        "volume": 1000,
+        "timestamp": tick.iso,
+    }
+
+    result = normalizer.normalize_and_validate("AAPL", quote, DataSource.MOCK, tick)
+    data = result.normalized_data
+    assert result.is_valid and not result.warnings
+    assert data["timestamp"] is tick.iso
+    assert data["validated_at"] is tick.iso
+    assert data["normalized_at"] is tick.iso
+    assert normalizer.quality_metrics["AAPL"].last_updated is tick.datetime
+
+    stale = dict(quote, timestamp=tick.epoch - 600)
+    result = normalizer.normalize_and_validate("AAPL", stale, DataSource.MOCK, tick)
+    assert any("타임스탬프 이상" in warning for warning in result.warnings)
@@ -0,0 +1,86 @@
+"""
+주식 데이터 검증기 테스트
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services.data_validator import DataSource, StockDataValidator
+
+
+def random_quote(rng):
+    price = round(rng.uniform(-1, 500), 2)
+    quote = {
+        "symbol": rng.choice(["AAPL", " msft ", "TOOLONG", "A1"]),
+        "price": price,
+        "open": round(price * rng.uniform(0.9, 1.1), 2),
+        "high": round(price * rng.uniform(0.95, 1.2), 2),
+        "low": round(price * rng.uniform(0.8, 1.05), 2),
+        "previous_close": rng.choice([None, 0.0, round(rng.uniform(1, 500), 2)]),
+        "volume": rng.choice([None, rng.randint(-5, 10**7), 2 * 10**10]),
+        "change_percent": round(rng.uniform(-150, 1500), 2),
+        "timestamp": (datetime.now() + timedelta(days=rng.choice([0, 3, -4000])))
+        .replace(microsecond=rng.choice([0, 123456]))
+        .isoformat(),
+        "name": rng.choice(["", "Apple Inc."]),
+    }
+    return quote
+
+
+def test_trusted_fast_path_matches_strict_path():
+    """MOCK 소스의 빠른 경로는 엄격한 경로와 같은 결과를 내야 함"""
+    rng = random.Random(11)
+    validator = StockDataValidator()
+
+    for _ in range(300):
+        quote = random_quote(rng)
+        fast = validator.validate_stock_quote(quote, DataSource.MOCK)
+        strict = validator.validate_stock_quote(quote, DataSource.UNKNOWN)
+
+        assert fast.is_valid == strict.is_valid, quote
+        assert fast.errors == strict.errors, quote
+        assert fast.warnings == strict.warnings, quote
+        for data in (fast.normalized_data, strict.normalized_data):
+            data.pop("validated_at")
+            data.pop("source")
+        assert fast.normalized_data == strict.normalized_data, quote
+
+
+def test_trusted_source_falls_back_for_untyped_values():
+    """문자열 값이 섞이면 MOCK 소스도 엄격한 경로로 처리해야 함"""
+    validator = StockDataValidator()
+    result = validator.validate_stock_quote(
+        {"symbol": "AAPL", "price": "$123.456", "timestamp": "2024-01-05 10:00:00"},
+        DataSource.MOCK,
+    )
+
+    assert result.is_valid
+    assert result.normalized_data["price"] == 123.46
+    assert result.normalized_data["timestamp"] == "2024-01-05T10:00:00"
+
+
+def test_trusted_fast_path_rounds_like_batch_path():
+    """빠른 경로와 배치 경로는 반올림 경계값도 같은 float 반올림 결과를 내야 함"""
+    pytest.importorskip("numpy")
+    from app.services.quote_batch import QuoteBatch, validate_quote_batch
+
+    validator = StockDataValidator()
+    quote = {
+        "symbol": "AAPL",
+        "price": 2.675,
+        "open": 2.505,
+        "high": 3.125,
+        "low": 1.005,
+        "previous_close": 2.135,
+        "timestamp": datetime.now().isoformat(),
+    }
+
+    fast = validator.validate_stock_quote(quote, DataSource.MOCK).normalized_data
+    batch = validate_quote_batch(QuoteBatch.from_records([quote])).record(
+        0, DataSource.MOCK.value, "now"
+    )
+
+    for field in ("price", "open", "high", "low", "previous_close"):
+        assert fast[field] == batch[field], field
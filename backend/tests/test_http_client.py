@@ -0,0 +1,109 @@
+"""
+공유 HTTP 클라이언트 레지스트리 테스트 (로컬 스텁 서버 사용)
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from app.core.http_client import HttpClientRegistry, http_clients
+from app.services.stock_data import StockDataService
+
+ALPHA_VANTAGE = "https://www.alphavantage.co"
+
+
+@pytest_asyncio.fixture
+async def stub_server():
+    """Alpha Vantage 형식으로 응답하고 요청별 클라이언트 포트를 기록하는 스텁 서버"""
+    peers = []
+
+    async def query(request):
+        peers.append(request.transport.get_extra_info("peername")[1])
+        symbol = request.query["symbol"]
+        return web.json_response(
+            {"Global Quote": {"01. symbol": symbol, "05. price": "101.5"}}
+        )
+
+    app = web.Application()
+    app.router.add_get("/query", query)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    http_clients.override(ALPHA_VANTAGE, f"http://127.0.0.1:{port}")
+    yield peers
+    http_clients.clear_overrides()
+    await http_clients.close()
+    await runner.cleanup()
+
+
+def test_url_override_keeps_path_and_query():
+    """override는 origin만 바꾸고 경로/쿼리는 유지해야 함"""
+    registry = HttpClientRegistry()
+    registry.override(ALPHA_VANTAGE, "http://127.0.0.1:9000/stub")
+
+    assert (
+        registry.url(f"{ALPHA_VANTAGE}/query?function=GLOBAL_QUOTE")
+        == "http://127.0.0.1:9000/stub/query?function=GLOBAL_QUOTE"
+    )
+    assert registry.url("https://api.twelvedata.com/quote") == (
+        "https://api.twelvedata.com/quote"
+    )
+
+
+@pytest.mark.asyncio
+async def test_quotes_reuse_one_pooled_connection(stub_server):
+    """연속된 시세 조회는 공유 세션의 keep-alive 연결 하나를 재사용해야 함"""
+    service = StockDataService()
+
+    for symbol in ["AAPL", "MSFT", "NVDA"]:
+        quote = await service._fetch_quote_from_api(symbol)
+        assert quote["01. symbol"] == symbol
+
+    assert len(stub_server) == 3
+    assert len(set(stub_server)) == 1
+    assert http_clients.get_stats()["active"] is True
+
+    session = http_clients.session()
+    await http_clients.close()
+    assert session.closed
+
+
+def test_session_from_previous_loop_is_closed():
+    """이벤트 루프가 바뀌면 이전 루프의 세션과 커넥터를 닫고 새 세션을 만들어야 함"""
+    registry = HttpClientRegistry()
+
+    async def ok(request):
+        return web.Response(text="ok")
+
+    async def open_connection():
+        app = web.Application()
+        app.router.add_get("/", ok)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        session = registry.session()
+        async with session.get(f"http://127.0.0.1:{port}/") as response:
+            await response.text()
+        await runner.cleanup()
+        return session
+
+    async def switch_loop():
+        session = registry.session()
+        await registry.close()
+        return session
+
+    old = asyncio.run(open_connection())
+    assert not old.closed
+
+    new = asyncio.run(switch_loop())
+
+    assert new is not old and new.closed
+    assert old.closed and old.connector is None
+    assert registry.sessions_created == 2
@@ -0,0 +1,140 @@
+"""
+시장 데이터 허브 테스트
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from app.services.market_data_hub import MarketDataHub
+from app.services.stock_simulator import StockDataSimulator
+
+
+class CountingSimulator(StockDataSimulator):
+    """advance 호출 횟수를 세는 시뮬레이터"""
+
+    def __init__(self):
+        super().__init__(engine="python")
+        self.advance_count = 0
+
+    def advance(self):
+        self.advance_count += 1
+        super().advance()
+
+
+@pytest.mark.asyncio
+async def test_tick_computed_once_for_all_listeners():
+    """소비자 수와 관계없이 틱은 주기마다 한 번만 계산되어야 함"""
+    simulator = CountingSimulator()
+    hub = MarketDataHub(simulator, tick_interval=0.01)
+
+    received = {"a": [], "b": [], "c": []}
+    for name, ticks in received.items():
+
+        async def listener(tick, ticks=ticks):
+            ticks.append((tick.sequence, hub.get_quote("AAPL")["price"]))
+
+        hub.attach(name, listener)
+
+    await hub.start()
+    await asyncio.sleep(0.1)
+    await hub.stop()
+
+    assert simulator.advance_count == hub.sequence
+    # 모든 소비자가 같은 틱에서 같은 가격을 관찰
+    assert received["a"] == received["b"] == received["c"]
+    assert len(received["a"]) == hub.sequence
+
+
+@pytest.mark.asyncio
+async def test_failing_listener_does_not_stop_hub():
+    """한 소비자의 오류가 다른 소비자나 틱 루프를 멈추지 않아야 함"""
+    hub = MarketDataHub(StockDataSimulator(engine="python"), tick_interval=0.01)
+    sequences = []
+
+    async def broken(tick):
+        raise RuntimeError("boom")
+
+    async def healthy(tick):
+        sequences.append(tick.sequence)
+
+    hub.attach("broken", broken)
+    hub.attach("healthy", healthy)
+
+    await hub.start()
+    await asyncio.sleep(0.05)
+    await hub.stop()
+
+    assert len(sequences) >= 2
+    assert not hub.is_running
+
+
+def test_ensure_symbol_does_not_advance_existing_symbol():
+    """기존 종목 조회는 가격을 전진시키지 않아야 함"""
+    hub = MarketDataHub(StockDataSimulator(engine="python"))
+    before = dict(hub.get_quote("AAPL"))
+
+    assert hub.ensure_symbol("AAPL")["price"] == before["price"]
+    assert hub.ensure_symbol("NEWSYM")["symbol"] == "NEWSYM"
+
+
+@pytest.mark.asyncio
+async def test_waiters_share_one_frame_per_tick():
+    """푸시 소비자는 다음 틱을 기다리고 틱마다 같은 프레임을 공유해야 함"""
+    hub = MarketDataHub(StockDataSimulator(engine="python"))
+    builds = []
+
+    def build():
+        builds.append(hub.sequence)
+        return f"frame-{hub.sequence}"
+
+    waiters = [asyncio.create_task(hub.wait_for_tick(0)) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert not any(waiter.done() for waiter in waiters)
+
+    hub.tick()
+    ticks = await asyncio.gather(*waiters)
+    frames = [hub.cached_frame("all", build) for _ in ticks]
+
+    assert {tick.sequence for tick in ticks} == {1}
+    assert frames == ["frame-1"] * 3
+    assert builds == [1]
+
+    # 밀린 소비자는 중간 틱을 건너뛰고 최신 틱을 바로 받음
+    hub.tick()
+    hub.tick()
+    assert (await hub.wait_for_tick(1)).sequence == 3
+    assert hub.cached_frame("all", build) == "frame-3"
+
+
+@pytest.mark.asyncio
+async def test_follower_hub_serves_leader_quotes_without_ticking():
+    """팔로워 허브는 start()를 호출해도 틱을 계산하지 않고 리더의 시세를 제공해야 함"""
+    simulator = CountingSimulator()
+    hub = MarketDataHub(simulator, tick_interval=0.01)
+    hub.set_leader(False)
+
+    await hub.start()
+    await asyncio.sleep(0.05)
+    assert not hub.is_running and simulator.advance_count == 0
+    assert hub.get_quote("AAPL") is None
+
+    waiter = asyncio.ensure_future(hub.wait_for_tick(hub.sequence))
+    await asyncio.sleep(0)
+    hub.apply_remote_tick(
+        41, datetime(2024, 1, 5, 10, 0), {"AAPL": {"symbol": "AAPL", "price": 123.45}}
+    )
+    tick = await asyncio.wait_for(waiter, 1)
+
+    assert tick.sequence == 41 and hub.sequence == 41
+    assert hub.get_quote("AAPL")["price"] == 123.45
+    assert hub.ensure_symbol("AAPL")["price"] == 123.45
+    assert hub.get_all() == {"AAPL": {"symbol": "AAPL", "price": 123.45}}
+    assert hub.ensure_symbol("NEWSYM") is None and "NEWSYM" not in simulator.stock_data
+
+    hub.set_leader(True)
+    await hub.start()
+    await asyncio.sleep(0.03)
+    await hub.stop()
+    assert simulator.advance_count > 0 and hub.sequence > 41
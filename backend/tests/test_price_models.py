@@ -0,0 +1,77 @@
+"""
+확률적 가격 모델 테스트
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.services.price_models import (
+    PRICE_MODELS,
+    GeometricBrownianMotion,
+    OrnsteinUhlenbeck,
+    PriceStreams,
+    create_price_model,
+)
+from app.services.stock_simulator import StockDataSimulator
+
+
+@pytest.mark.parametrize("model_name", sorted(PRICE_MODELS))
+def test_same_seed_reproduces_stream(model_name):
+    """같은 시드로 만든 스트림은 블록 경계를 넘어서도 동일해야 함"""
+    first = PriceStreams(create_price_model(model_name), seed=42, block_size=16)
+    second = PriceStreams(create_price_model(model_name), seed=42, block_size=16)
+    for streams in (first, second):
+        streams.register("AAPL", 180.0)
+        streams.register("MSFT", 350.0)
+
+    first_prices = [first.next_all() for _ in range(40)]
+    second_prices = [second.next_all() for _ in range(40)]
+
+    np.testing.assert_array_equal(np.array(first_prices), np.array(second_prices))
+    assert (np.array(first_prices) > 0).all()
+
+
+def test_symbol_stream_independent_of_other_symbols():
+    """종목 스트림은 다른 종목의 등록 여부와 무관해야 함"""
+    alone = PriceStreams(GeometricBrownianMotion(), seed=7, block_size=8)
+    alone.register("TSLA", 250.0)
+
+    mixed = PriceStreams(GeometricBrownianMotion(), seed=7, block_size=8)
+    mixed.register("AAPL", 180.0)
+    mixed.register("TSLA", 250.0)
+
+    for _ in range(20):
+        mixed.next_price("AAPL")
+        assert alone.next_price("TSLA") == mixed.next_price("TSLA")
+
+
+def test_different_seed_changes_stream():
+    """시드가 다르면 다른 스트림이 생성되어야 함"""
+    first = PriceStreams(GeometricBrownianMotion(), seed=1)
+    second = PriceStreams(GeometricBrownianMotion(), seed=2)
+    first.register("AAPL", 180.0)
+    second.register("AAPL", 180.0)
+
+    assert first.next_price("AAPL") != second.next_price("AAPL")
+
+
+def test_ornstein_uhlenbeck_reverts_to_reference():
+    """OU 모델은 기준 가격 방향으로 회귀해야 함"""
+    model = OrnsteinUhlenbeck(theta=5000.0, sigma=0.1)
+    path = model.simulate(200.0, 2000, np.random.default_rng(0), reference_price=100.0)
+
+    assert abs(path[-500:].mean() - 100.0) < 5.0
+
+
+def test_simulator_price_model_is_reproducible():
+    """시뮬레이터에 같은 시드의 모델을 설정하면 같은 가격이 나와야 함"""
+    runs = []
+    for _ in range(2):
+        simulator = StockDataSimulator(engine="vectorized")
+        simulator.set_price_model(create_price_model("jump_diffusion"), seed=123)
+        for _ in range(10):
+            simulator._advance_vectorized()
+        runs.append(simulator.tick_engine.price[: len(simulator.tick_engine)].copy())
+
+    np.testing.assert_array_equal(runs[0], runs[1])
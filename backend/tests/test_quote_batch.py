@@ -0,0 +1,122 @@
+"""
+열 단위 시세 배치 검증 테스트
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from app.services.data_normalizer import data_normalizer
+from app.services.data_validator import DataSource, validator
+from app.services.quote_batch import QuoteBatch, validate_quote_batch
+from app.services.stock_data import StockDataService
+from app.services.stock_simulator import StockDataSimulator
+
+
+def random_quote(rng, symbol):
+    price = round(rng.uniform(1, 500), 2)
+    return {
+        "symbol": symbol,
+        "price": price,
+        "open": round(price * rng.uniform(0.9, 1.1), 2),
+        "high": round(price * rng.uniform(0.95, 1.2), 2),
+        "low": round(price * rng.uniform(0.8, 1.05), 2),
+        "previous_close": round(price * rng.uniform(0.9, 1.1), 2),
+        "volume": rng.choice([rng.randint(0, 10**7), None]),
+        "change_percent": round(rng.uniform(-120, 5), 2),
+        "timestamp": datetime.now().isoformat(),
+        "name": f"{symbol} Corp.",
+    }
+
+
+def test_batch_matches_scalar_validation():
+    """배치 검증의 유효 여부/경고/정규화 결과는 단건 검증과 같아야 함"""
+    rng = random.Random(3)
+    symbols = ["AAPL", "msft", "TOOLONG", "NVDA", "A1"] * 20
+    records = [random_quote(rng, symbol) for symbol in symbols]
+    records[3]["price"] = -5.0
+    records[4]["high"] = records[4]["low"] - 1
+
+    checked = validate_quote_batch(QuoteBatch.from_records(records))
+
+    for row, record in enumerate(records):
+        expected = validator.validate_stock_quote(record, DataSource.MOCK)
+        assert bool(checked.valid[row]) == expected.is_valid, record
+        assert len(checked.row_warnings(row)) == len(expected.warnings), record
+        if expected.is_valid:
+            data = checked.record(row, DataSource.MOCK.value, "now")
+            expected.normalized_data["validated_at"] = "now"
+            assert data == expected.normalized_data
+
+
+def test_aware_timestamps_keep_instant_and_offset():
+    """시간대가 있는 타임스탬프는 호스트 시간대와 관계없이 같은 시각/오프셋으로 복원되어야 함"""
+    seoul = datetime.now(timezone(timedelta(hours=9))).replace(microsecond=0)
+    new_york = datetime.now(timezone(timedelta(hours=-5))).replace(microsecond=0)
+    records = [
+        {"symbol": "AAPL", "price": 10.0, "timestamp": seoul.isoformat()},
+        {"symbol": "MSFT", "price": 10.0, "timestamp": new_york},
+        {"symbol": "NVDA", "price": 10.0, "timestamp": "2026-01-02T03:04:05Z"},
+    ]
+
+    checked = validate_quote_batch(QuoteBatch.from_records(records))
+    timestamps = [checked.record(row, "Mock", "now")["timestamp"] for row in range(3)]
+
+    assert timestamps[:2] == [seoul.isoformat(), new_york.isoformat()]
+    assert timestamps[2] == "2026-01-02T03:04:05+00:00"
+    assert datetime.fromisoformat(timestamps[0]) == seoul
+
+
+def test_simulator_tick_uses_one_batch(monkeypatch):
+    """파이썬 엔진의 틱은 전체 종목을 한 번의 배치로 검증해야 함"""
+    simulator = StockDataSimulator(engine="python")
+    calls = []
+    original = data_normalizer.normalize_batch
+
+    def counting(batch, source, tick=None):
+        calls.append(len(batch))
+        return original(batch, source, tick)
+
+    monkeypatch.setattr(data_normalizer, "normalize_batch", counting)
+    simulator.advance()
+
+    assert calls == [len(simulator.stock_symbols)]
+    for symbol, data in simulator.get_all_stocks().items():
+        assert data["source"] == DataSource.MOCK.value
+        assert data["low"] <= data["price"] <= data["high"]
+
+
+@pytest.mark.asyncio
+async def test_multiple_quotes_validated_as_one_batch():
+    """get_multiple_quotes는 조회한 시세를 한 번에 검증하고 실패 행만 폴백해야 함"""
+    service = StockDataService()
+    raw = {
+        "AAPL": {
+            "01. symbol": "AAPL",
+            "02. open": "189",
+            "05. price": "190.5",
+            "08. previous close": "188.2",
+            "03. high": "191",
+            "04. low": "188",
+            "06. volume": "1000",
+            "10. change percent": "1.25%",
+            "07. latest trading day": "2024-01-05",
+        },
+        "BAD": {"01. symbol": "BAD", "05. price": "not-a-price"},
+    }
+
+    async def fetch(symbol):
+        return raw[symbol]
+
+    service._fetch_raw_quote = fetch
+    result = await service.get_multiple_quotes(["AAPL", "BAD"])
+
+    assert list(result) == ["AAPL", "BAD"]
+    assert result["AAPL"]["price"] == 190.5
+    assert result["AAPL"]["change_percent"] == 1.25
+    assert result["AAPL"]["latest_trading_day"] == "2024-01-05T00:00:00"
+    assert result["BAD"]["is_fallback"] is True
+    assert "AAPL" in service.cache and "BAD" not in service.cache
@@ -0,0 +1,172 @@
+"""
+토큰 버킷 Rate Limiter 테스트
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from app.core.http_client import http_clients
+from app.core.rate_limiter import (
+    Priority,
+    RateLimiterRegistry,
+    RateLimitTimeout,
+    TokenBucket,
+    rate_limiters,
+    request_priority,
+)
+from app.services.stock_data import StockDataService
+from app.services.stock_data_fetcher import StockDataFetcher
+
+
+@pytest.mark.asyncio
+async def test_waiters_served_fifo_with_priority_lane():
+    """같은 레인은 FIFO, 사용자 요청 레인은 일괄 작업 레인보다 먼저 통과해야 함"""
+    bucket = TokenBucket("test", rate=200, per=1.0, burst=1)
+    order = []
+
+    async def call(name, priority):
+        await bucket.acquire(priority)
+        order.append(name)
+
+    await bucket.acquire()  # 버킷 비우기
+    tasks = [asyncio.ensure_future(call(f"bulk{i}", Priority.BULK)) for i in range(3)]
+    await asyncio.sleep(0)
+    tasks += [
+        asyncio.ensure_future(call(f"user{i}", Priority.INTERACTIVE)) for i in range(2)
+    ]
+    await asyncio.gather(*tasks)
+
+    assert order == ["user0", "user1", "bulk0", "bulk1", "bulk2"]
+    stats = bucket.get_stats()
+    assert stats["waited"] == 5 and stats["total_wait_seconds"] > 0
+
+
+@pytest.mark.asyncio
+async def test_callers_wait_instead_of_failing_and_report_wait():
+    """토큰이 없으면 예외 없이 기다리고 대기 시간을 반환해야 함"""
+    registry = RateLimiterRegistry()
+    registry.configure("stub", rate=100, per=1.0, burst=2)
+
+    waits = await asyncio.gather(*(registry.acquire("stub") for _ in range(6)))
+
+    assert waits[:2] == [0.0, 0.0]
+    assert all(wait > 0 for wait in waits[2:])
+    assert registry.get_stats()["stub"]["acquired"] == 6
+    assert await registry.acquire("unconfigured") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_endpoint_budget_and_max_wait():
+    """엔드포인트 예산은 프로바이더 예산과 별도로 적용되고 최대 대기를 넘으면 실패해야 함"""
+    registry = RateLimiterRegistry()
+    registry.configure("kis", rate=100, per=1.0)
+    registry.configure("kis", rate=1, per=60.0, endpoint="/oauth2/tokenP")
+
+    await registry.acquire("kis", "/oauth2/tokenP")
+    await registry.acquire("kis", "/quotations")
+    with pytest.raises(RateLimitTimeout):
+        await registry.acquire("kis", "/oauth2/tokenP", max_wait=0.05)
+
+    assert registry.get("kis", "/oauth2/tokenP").queued() == 0
+    assert registry.get_stats()["kis:/oauth2/tokenP"]["timeouts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_endpoint_token_refunded_when_provider_budget_times_out():
+    """프로바이더 예산을 기다리다 실패하면 먼저 얻은 엔드포인트 토큰을 돌려줘야 함"""
+    registry = RateLimiterRegistry()
+    provider = registry.configure("kis", rate=1, per=60.0)
+    endpoint = registry.configure("kis", rate=1, per=60.0, endpoint="/quotations")
+    await registry.acquire("kis")  # 프로바이더 버킷 비우기
+
+    with pytest.raises(RateLimitTimeout):
+        await registry.acquire("kis", "/quotations", max_wait=0.05)
+
+    assert endpoint.available() >= 1
+    assert endpoint.get_stats()["acquired"] == 0
+    assert provider.get_stats()["timeouts"] == 1
+    registry.reset()
+
+
+@pytest.mark.asyncio
+async def test_token_granted_at_timeout_is_returned(monkeypatch):
+    """타임아웃과 토큰 전달이 겹치면 넘겨받은 토큰을 버리지 않고 반납해야 함"""
+    bucket = TokenBucket("race", rate=1, per=60.0, burst=1)
+    await bucket.acquire()  # 버킷 비우기
+
+    async def granted_then_timed_out(waiter, timeout):
+        bucket._lanes[Priority.INTERACTIVE].popleft().set_result(None)
+        raise asyncio.TimeoutError
+
+    monkeypatch.setattr(asyncio, "wait_for", granted_then_timed_out)
+    with pytest.raises(RateLimitTimeout):
+        await bucket.acquire(max_wait=0.01)
+    monkeypatch.undo()
+
+    assert bucket.available() >= 1
+    assert bucket.get_stats()["acquired"] == 1
+    assert bucket.get_stats()["timeouts"] == 1
+    bucket.reset()
+
+
+@pytest_asyncio.fixture
+async def alpha_vantage_stub():
+    """요청된 종목 순서를 기록하는 Alpha Vantage 스텁 서버"""
+    order = []
+
+    async def query(request):
+        symbol = request.query["symbol"]
+        order.append(symbol)
+        return web.json_response(
+            {
+                "Global Quote": {
+                    "01. symbol": symbol,
+                    "05. price": "10",
+                    "08. previous close": "10",
+                }
+            }
+        )
+
+    app = web.Application()
+    app.router.add_get("/query", query)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    http_clients.override("https://www.alphavantage.co", f"http://127.0.0.1:{port}")
+    yield order
+    http_clients.clear_overrides()
+    await http_clients.close()
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_bulk_sync_and_quotes_share_provider_budget(
+    alpha_vantage_stub, monkeypatch
+):
+    """일괄 조회와 사용자 시세 조회는 같은 버킷을 공유하고 사용자가 먼저 통과해야 함"""
+    bucket = rate_limiters.get("alpha_vantage")
+    monkeypatch.setattr(bucket, "rate", 50.0)
+    monkeypatch.setattr(bucket, "capacity", 1.0)
+    bucket.tokens = 0
+
+    fetcher = StockDataFetcher()
+    fetcher.alpha_vantage_key = "test"
+    service = StockDataService()
+
+    with request_priority(Priority.BULK):
+        bulk = asyncio.ensure_future(fetcher.fetch_multiple_stocks(["AAA", "BBB"]))
+    await asyncio.sleep(0)
+    quote = await service._fetch_raw_quote("USER")
+    results = await bulk
+
+    assert quote["01. symbol"] == "USER"
+    assert sorted(results) == ["AAA", "BBB"]
+    assert alpha_vantage_stub == ["USER", "AAA", "BBB"]
+    assert bucket.get_stats()["waited"] == 3
+    assert fetcher.rate_limit_wait > 0
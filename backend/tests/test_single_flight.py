@@ -0,0 +1,134 @@
+"""
+단일 비행 요청 병합 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.single_flight import SingleFlight
+from app.services.stock_data import APIConnectionError, StockDataService
+from app.services.stock_data_fetcher import StockDataFetcher
+
+RAW_QUOTE = {
+    "01. symbol": "AAPL",
+    "02. open": "189",
+    "03. high": "191",
+    "04. low": "188",
+    "05. price": "190.5",
+    "06. volume": "1000",
+    "07. latest trading day": "2024-01-05",
+    "08. previous close": "188.2",
+    "10. change percent": "1.25%",
+}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_quote_misses_share_one_api_call():
+    """캐시가 빈 상태의 동시 get_quote는 API를 한 번만 호출해야 함"""
+    service = StockDataService()
+    calls = []
+
+    async def fetch(symbol):
+        calls.append(symbol)
+        await asyncio.sleep(0.01)
+        return dict(RAW_QUOTE)
+
+    service._fetch_quote_from_api = fetch
+    results = await asyncio.gather(*(service.get_quote("AAPL") for _ in range(200)))
+
+    assert calls == ["AAPL"]
+    assert all(result["price"] == 190.5 for result in results)
+    assert service._inflight.coalesced == 199
+    assert len(service._inflight) == 0
+
+
+@pytest.mark.asyncio
+async def test_shared_error_reaches_every_waiter():
+    """진행 중인 호출의 예외는 합류한 호출자 전원에게 전달되어야 함"""
+    service = StockDataService()
+    calls = []
+
+    async def fetch(symbol):
+        calls.append(symbol)
+        await asyncio.sleep(0.01)
+        raise APIConnectionError("연결 실패")
+
+    service._fetch_quote_from_api = fetch
+    results = await asyncio.gather(*(service.get_quote("MSFT") for _ in range(20)))
+
+    assert len(calls) == 1
+    assert all(result["is_fallback"] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_intraday_coalesced_per_interval_and_cached():
+    """일중 데이터는 (종목, 간격)별로 병합되고 이후 요청은 캐시에서 반환되어야 함"""
+    service = StockDataService()
+    calls = []
+
+    async def fetch(symbol, interval):
+        calls.append((symbol, interval))
+        await asyncio.sleep(0.01)
+        bar = {"1. open": "1", "2. high": "2", "3. low": "0.5", "4. close": "1.5"}
+        return {
+            "meta": {"3. Last Refreshed": "2024-01-05 16:00:00"},
+            "series": {
+                "2024-01-05 16:00:00": dict(bar, **{"5. volume": "10"}),
+                "2024-01-05 15:59:00": dict(bar, **{"5. volume": "20"}),
+            },
+        }
+
+    service._fetch_intraday_from_api = fetch
+    requests = [service.get_intraday_data("AAPL", "1min") for _ in range(10)]
+    requests += [service.get_intraday_data("AAPL", "5min") for _ in range(10)]
+    results = await asyncio.gather(*requests)
+
+    assert sorted(calls) == [("AAPL", "1min"), ("AAPL", "5min")]
+    assert [bar["volume"] for bar in results[0]["time_series"]] == [20, 10]
+
+    cached = await service.get_intraday_data("AAPL", "1min")
+    assert cached["is_cached"] is True
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_call():
+    """먼저 호출한 쪽이 취소되어도 다른 대기자는 결과를 받아야 함"""
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def work():
+        await release.wait()
+        return 42
+
+    first = asyncio.ensure_future(flight.do("key", work))
+    second = asyncio.ensure_future(flight.do("key", work))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == 42
+    assert first.cancelled()
+    assert "key" not in flight
+
+
+@pytest.mark.asyncio
+async def test_fetcher_coalesces_same_symbol():
+    """StockDataFetcher도 같은 종목 동시 요청을 한 번만 조회해야 함"""
+    fetcher = StockDataFetcher()
+    fetcher.alpha_vantage_key = "test"
+    calls = []
+
+    async def provider(symbol):
+        calls.append(symbol)
+        await asyncio.sleep(0.01)
+        return {"symbol": symbol, "price": 1.0}
+
+    fetcher._fetch_from_alpha_vantage = provider
+    results = await asyncio.gather(
+        *(fetcher.fetch_stock_data(symbol) for symbol in ["AAPL"] * 5 + ["MSFT"] * 5)
+    )
+
+    assert sorted(calls) == ["AAPL", "MSFT"]
+    assert [result["symbol"] for result in results] == ["AAPL"] * 5 + ["MSFT"] * 5
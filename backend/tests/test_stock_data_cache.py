@@ -0,0 +1,211 @@
+"""
+주식 데이터 서비스 캐시 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.stock_data import StockDataService
+from app.services.ttl_cache import LRUTTLCache
+
+RAW_QUOTE = {
+    "01. symbol": "AAPL",
+    "02. open": "189",
+    "03. high": "191",
+    "04. low": "188",
+    "05. price": "190.5",
+    "06. volume": "1000",
+    "07. latest trading day": "2024-01-05",
+    "08. previous close": "188.2",
+    "10. change percent": "1.25%",
+}
+
+
+def make_service(calls, price="190.5"):
+    service = StockDataService()
+
+    async def fetch(symbol):
+        calls.append(symbol)
+        await asyncio.sleep(0.01)
+        return dict(RAW_QUOTE, **{"05. price": price})
+
+    service._fetch_quote_from_api = fetch
+    return service
+
+
+def age_entry(service, symbol, seconds):
+    entry = service.cache._entries[symbol]
+    service.cache._entries[symbol] = entry._replace(stored_at=entry.stored_at - seconds)
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_served_with_one_background_refresh():
+    """만료된 항목은 즉시 반환되고 백그라운드 갱신은 한 번만 실행되어야 함"""
+    calls = []
+    service = make_service(calls)
+    await service.get_quote("AAPL")
+    age_entry(service, "AAPL", 60)
+
+    service._fetch_quote_from_api = make_service(calls, "200")._fetch_quote_from_api
+    results = await asyncio.gather(*(service.get_quote("AAPL") for _ in range(10)))
+
+    assert all(result["is_stale"] and result["price"] == 190.5 for result in results)
+    assert list(service._refresh_tasks) == ["AAPL"]
+    await asyncio.gather(*service._refresh_tasks.values())
+
+    assert calls == ["AAPL", "AAPL"]
+    assert service.stats["stale_hits"] == 10
+    assert service.stats["background_refreshes"] == 1
+    fresh = await service.get_quote("AAPL")
+    assert fresh["price"] == 200.0 and not fresh["is_stale"]
+
+
+@pytest.mark.asyncio
+async def test_entry_past_stale_window_blocks_on_fetch():
+    """stale 구간을 지난 항목은 API 조회 결과를 기다려야 함"""
+    calls = []
+    service = make_service(calls)
+    await service.get_quote("AAPL")
+    age_entry(service, "AAPL", service._stale_limit_seconds + 1)
+
+    result = await service.get_quote("AAPL")
+
+    assert calls == ["AAPL", "AAPL"]
+    assert not result.get("is_cached") and not service._refresh_tasks
+
+
+@pytest.mark.asyncio
+async def test_hot_symbol_refreshed_ahead_within_rate_budget():
+    """자주 조회되는 종목은 rate limit 여유가 있을 때만 만료 전에 갱신되어야 함"""
+    calls = []
+    service = make_service(calls)
+    await service.get_quote("AAPL")
+    age_entry(service, "AAPL", service.cache_duration.total_seconds() * 0.9)
+
+    bucket = service.rate_limiter.get(service.rate_limit_provider)
+    bucket.tokens = 1
+    for _ in range(service.hot_hits):
+        await service.get_quote("AAPL")
+    assert not service._refresh_tasks
+
+    bucket.reset()
+    result = await service.get_quote("AAPL")
+    assert not result["is_stale"]
+    await asyncio.gather(*service._refresh_tasks.values())
+    assert calls == ["AAPL", "AAPL"]
+
+
+def test_lru_evicts_least_recently_used_in_constant_time():
+    """용량 초과 시 가장 오래 사용되지 않은 항목부터 제거되어야 함"""
+    cache = LRUTTLCache(max_entries=3)
+    for symbol in ["A", "B", "C"]:
+        cache.set(symbol, {"symbol": symbol})
+    cache.get("A")
+
+    assert cache.set("D", {"symbol": "D"}) == ["B"]
+    assert cache.keys() == ["C", "A", "D"]
+    assert cache.get("B") is None
+    assert cache.get_stats()["evictions"] == 1
+    assert cache.get_stats()["hits"] == 1 and cache.get_stats()["misses"] == 1
+
+
+def test_cache_caps_memory_and_expires_with_monotonic_clock():
+    """메모리 상한과 TTL을 지켜야 하며 나이는 주입한 단조 시계를 따라야 함"""
+    now = [100.0]
+    cache = LRUTTLCache(max_entries=100, max_bytes=2000, ttl=10, clock=lambda: now[0])
+    for i in range(20):
+        cache.set(i, {"symbol": f"S{i}", "warnings": ["x" * 50]})
+
+    assert cache.total_bytes <= 2000
+    assert 1 <= len(cache) < 20
+    newest = cache.keys()[-1]
+
+    now[0] += 4
+    value, age = cache.get(newest)
+    assert age == 4
+
+    now[0] += 7
+    assert cache.get(newest) is None
+    assert cache.get_stats()["expirations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_values_are_not_mutated_by_callers():
+    """캐시 조회 결과를 변경해도 캐시에 저장된 값은 바뀌지 않아야 함"""
+    service = make_service([])
+    await service.get_quote("AAPL")
+
+    first = await service.get_quote("AAPL")
+    first["price"] = -1
+    first["is_stale"] = True
+
+    value, _ = service.cache.get("AAPL")
+    assert value["price"] == 190.5 and "is_stale" not in value
+    with pytest.raises(TypeError):
+        value["price"] = 0
+    assert (await service.get_quote("AAPL"))["price"] == 190.5
+    assert service.get_cache_stats()["cache"]["hits"] >= 2
+
+
+def test_nested_cached_values_are_frozen():
+    """중첩 list/dict도 캐시 안에서는 변경할 수 없고 조회 시 변경 가능한 복사본이어야 함"""
+    service = StockDataService()
+    warnings = ["폴백 데이터 사용"]
+    service._save_to_cache(
+        "AAPL",
+        {"price": 1.0, "validation_warnings": warnings, "meta": {"points": [1, 2]}},
+    )
+    warnings.append("원본 변경")
+
+    value, _ = service.cache.get("AAPL")
+    with pytest.raises(AttributeError):
+        value["validation_warnings"].append("x")
+    with pytest.raises(TypeError):
+        value["meta"]["points"] = []
+
+    copy = service._get_from_cache("AAPL")
+    copy["validation_warnings"].append("호출자 변경")
+    copy["meta"]["points"].append(3)
+    again = service._get_from_cache("AAPL")
+    assert again["validation_warnings"] == ["폴백 데이터 사용"]
+    assert again["meta"] == {"points": [1, 2]}
+
+
+def test_access_counts_removed_on_ttl_expiry():
+    """TTL 만료로 제거된 종목의 조회 횟수는 남지 않아야 함"""
+    service = StockDataService()
+    service._save_to_cache("AAPL", {"price": 1.0})
+    assert service._serve_cached_quote("AAPL") is not None
+    assert service._access_counts == {"AAPL": 1}
+
+    age_entry(service, "AAPL", service._fallback_limit_seconds + 1)
+
+    assert service._serve_cached_quote("AAPL") is None
+    assert "AAPL" not in service.cache
+    assert service._access_counts == {}
+
+
+@pytest.mark.asyncio
+async def test_interactive_join_of_bulk_refresh_falls_back_to_stale():
+    """일괄 갱신에 합류한 사용자 요청은 최대 대기 후 stale 구간 이후의 캐시로 폴백해야 함"""
+    calls = []
+    service = make_service(calls)
+    service.rate_limit_max_wait = 0.05
+    await service.get_quote("AAPL")
+
+    # 한도를 비워 백그라운드(BULK) 갱신이 토큰을 기다리게 함
+    service.rate_limiter.get(service.rate_limit_provider).tokens = 0
+    age_entry(service, "AAPL", service.cache_duration.total_seconds() + 1)
+    assert (await service.get_quote("AAPL"))["is_stale"]
+    assert list(service._refresh_tasks) == ["AAPL"]
+
+    # stale 구간이 지나도 폴백용 항목은 캐시에 남아 있음
+    age_entry(service, "AAPL", service._stale_limit_seconds)
+    result = await asyncio.wait_for(service.get_quote("AAPL"), 1)
+
+    assert result["is_stale"] and result["price"] == 190.5
+    assert service.stats["rate_limit_hits"] == 1
+    assert calls == ["AAPL"]
+    for task in service._refresh_tasks.values():
+        task.cancel()
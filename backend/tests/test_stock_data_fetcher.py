@@ -0,0 +1,302 @@
+"""
+다중 프로바이더 헤지 요청 테스트 (로컬 스텁 프로바이더 사용)
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.error_recovery import recovery_system
+from app.core.rate_limiter import RateLimiterRegistry
+from app.services import stock_data_fetcher as fetcher_module
+from app.services.latency_histogram import LatencyHistogram
+from app.services.provider_scoreboard import ProviderScoreboard
+from app.services.stock_data_fetcher import (
+    ProviderError,
+    ProviderRateLimitedError,
+    StockDataFetcher,
+)
+
+
+def stub_provider(name, delay, calls, cancelled=None, result=True):
+    async def provider(symbol):
+        calls.append(name)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            if cancelled is not None:
+                cancelled.append(name)
+            raise
+        if isinstance(result, Exception):
+            raise result
+        return {"symbol": symbol, "price": 1.0, "source": name} if result else None
+
+    return provider
+
+
+@pytest.fixture(autouse=True)
+def reset_provider_breakers():
+    """테스트에서 만든 프로바이더 서킷 브레이커가 다른 테스트에 남지 않도록 제거"""
+    yield
+    for name in list(recovery_system.circuit_breakers):
+        if name.startswith("provider:"):
+            del recovery_system.circuit_breakers[name]
+
+
+def make_fetcher(providers, hedge=True):
+    fetcher = StockDataFetcher()
+    fetcher._providers = lambda: providers
+    fetcher.hedge_enabled = hedge
+    return fetcher
+
+
+def test_hedging_is_disabled_by_default():
+    """헤지 요청은 다른 프로바이더의 요청 한도를 쓰므로 설정으로 켜야만 동작해야 함"""
+    assert StockDataFetcher().hedge_enabled is False
+
+
+def test_histogram_percentiles_follow_samples():
+    """히스토그램 백분위는 기록된 응답 시간 분포를 따라야 함"""
+    histogram = LatencyHistogram(max_count=10_000)
+    for i in range(1, 101):
+        histogram.record(i / 1000)
+
+    assert 0.045 <= histogram.percentile(0.5) <= 0.065
+    assert 0.09 <= histogram.percentile(0.95) <= 0.12
+    assert histogram.percentile(0.95) <= histogram.percentile(0.99)
+
+    histogram.max_count = 100
+    histogram.record(0.001)
+    assert histogram.count <= 60
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_cancelled():
+    """주 프로바이더가 평소 응답 시간을 넘기면 다음 프로바이더를 호출하고 진 요청은 취소해야 함"""
+    calls, cancelled = [], []
+    fetcher = make_fetcher(
+        [
+            ("primary", stub_provider("primary", 1.0, calls, cancelled)),
+            ("secondary", stub_provider("secondary", 0.01, calls, cancelled)),
+        ]
+    )
+    fetcher.latency["primary"] = LatencyHistogram()
+    for _ in range(50):
+        fetcher.latency["primary"].record(0.02)
+
+    start = time.perf_counter()
+    data = await fetcher.fetch_stock_data("AAPL")
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0)
+
+    assert data["source"] == "secondary"
+    assert elapsed < 0.3
+    assert calls == ["primary", "secondary"] and cancelled == ["primary"]
+    assert fetcher.hedge_stats["hedged"] == 1
+    assert fetcher.hedge_stats["hedge_wins"] == 1
+    assert fetcher.get_provider_stats()["latency"]["secondary"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged():
+    """주 프로바이더가 지연 예산 안에 응답하면 다음 프로바이더는 호출하지 않아야 함"""
+    calls = []
+    fetcher = make_fetcher(
+        [
+            ("primary", stub_provider("primary", 0.01, calls)),
+            ("secondary", stub_provider("secondary", 0.01, calls)),
+        ]
+    )
+
+    data = await fetcher.fetch_stock_data("AAPL")
+
+    assert data["source"] == "primary" and calls == ["primary"]
+    assert fetcher.hedge_stats["hedged"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_provider_falls_over_without_waiting():
+    """실패하거나 빈 응답을 준 프로바이더 다음은 헤지 대기 없이 바로 호출해야 함"""
+    calls = []
+    fetcher = make_fetcher(
+        [
+            ("error", stub_provider("error", 0, calls, result=RuntimeError("429"))),
+            ("empty", stub_provider("empty", 0, calls, result=False)),
+            ("last", stub_provider("last", 0, calls)),
+        ]
+    )
+
+    start = time.perf_counter()
+    data = await fetcher.fetch_stock_data("AAPL")
+
+    assert data["source"] == "last"
+    assert calls == ["error", "empty", "last"]
+    assert time.perf_counter() - start < 0.5
+
+    nothing = make_fetcher([("empty", stub_provider("empty", 0, [], result=False))])
+    assert await nothing.fetch_stock_data("MSFT") is None
+
+
+def test_scoreboard_penalizes_429_and_recovers_with_decay():
+    """429와 느린 응답은 순위를 낮추고, 반감기가 지나면 점수가 회복되어야 함"""
+    now = [0.0]
+    board = ProviderScoreboard(half_life=60, clock=lambda: now[0])
+    for _ in range(5):
+        board.record_success("fast", 0.05)
+        board.record_success("slow", 2.0)
+    board.record_failure("limited", rate_limited=True)
+    board.record_failure("limited", rate_limited=True)
+
+    assert board.rank(["limited", "slow", "unknown", "fast"]) == [
+        "fast",
+        "unknown",
+        "slow",
+        "limited",
+    ]
+
+    limited = board.score("limited")
+    now[0] += 600
+    assert board.score("limited") > limited
+    assert board.get_stats()["limited"]["rate_limited"] < 0.01
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_provider_moves_behind_healthy_one():
+    """429를 반환한 프로바이더는 다음 요청부터 건강한 프로바이더 뒤로 밀려야 함"""
+    calls = []
+    fetcher = make_fetcher(
+        [
+            (
+                "limited",
+                stub_provider(
+                    "limited", 0, calls, result=ProviderRateLimitedError("429")
+                ),
+            ),
+            ("healthy", stub_provider("healthy", 0, calls)),
+        ]
+    )
+
+    assert (await fetcher.fetch_stock_data("AAPL"))["source"] == "healthy"
+    assert (await fetcher.fetch_stock_data("MSFT"))["source"] == "healthy"
+
+    assert calls == ["limited", "healthy", "healthy"]
+    assert fetcher.get_provider_stats()["scores"]["limited"]["rate_limited"] > 0.9
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_provider_is_skipped_without_calling():
+    """서킷이 열린 프로바이더는 호출하지 않고 건너뛰어야 함"""
+    calls = []
+    fetcher = make_fetcher(
+        [
+            (
+                "tripped",
+                stub_provider("tripped", 0, calls, result=RuntimeError("down")),
+            ),
+            ("backup", stub_provider("backup", 0, calls)),
+        ]
+    )
+    breaker = fetcher._breaker("tripped")
+    for _ in range(breaker.failure_threshold):
+        breaker._on_failure()
+    assert breaker.is_open()
+
+    data = await fetcher.fetch_stock_data("MSFT")
+
+    assert data["source"] == "backup" and calls == ["backup"]
+    assert fetcher.hedge_stats["circuit_skips"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_empty_responses_count_as_breaker_failures():
+    """빈 응답(5xx 등)만 주는 프로바이더는 서킷이 열려 이후 호출에서 제외되어야 함"""
+    calls = []
+    fetcher = make_fetcher(
+        [("broken", stub_provider("broken", 0, calls, result=False))]
+    )
+    breaker = fetcher._breaker("broken")
+
+    for _ in range(breaker.failure_threshold):
+        assert await fetcher.fetch_stock_data("AAPL") is None
+
+    assert breaker.is_open()
+    assert fetcher.get_provider_stats()["scores"]["broken"]["successes"] == 0
+    await fetcher.fetch_stock_data("AAPL")
+    assert len(calls) == breaker.failure_threshold
+
+
+def test_server_errors_raise_provider_errors():
+    """5xx는 프로바이더 오류, 429는 요청 한도 초과로 구분해야 함"""
+    with pytest.raises(ProviderError):
+        StockDataFetcher._raise_for_status(SimpleNamespace(status=503), "fmp")
+    with pytest.raises(ProviderRateLimitedError):
+        StockDataFetcher._raise_for_status(SimpleNamespace(status=429), "fmp")
+    StockDataFetcher._raise_for_status(SimpleNamespace(status=200), "fmp")
+
+
+@pytest.mark.asyncio
+async def test_all_circuits_open_returns_none_without_calling(caplog):
+    """모든 프로바이더의 서킷이 열려 있으면 호출 없이 None을 반환해야 함"""
+    calls = []
+    fetcher = make_fetcher([("down", stub_provider("down", 0, calls))])
+    breaker = fetcher._breaker("down")
+    for _ in range(breaker.failure_threshold):
+        breaker._on_failure()
+
+    assert await fetcher.fetch_stock_data("MSFT") is None
+
+    assert calls == []
+    assert "circuits open" in caplog.text
+    assert "Error fetching stock data" not in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_local_rate_limit_wait_does_not_trigger_hedge(monkeypatch):
+    """우리 rate limiter 대기 시간은 응답 시간으로 기록하거나 헤지 타이머에 포함하지 않아야 함"""
+    limiters = RateLimiterRegistry()
+    limiters.configure("primary", 1, per=0.3, burst=1)
+    await limiters.acquire("primary")  # 토큰을 비워 다음 요청이 약 0.3초 대기
+    monkeypatch.setattr(fetcher_module, "rate_limiters", limiters)
+
+    calls = []
+    fetcher = make_fetcher(
+        [
+            ("primary", stub_provider("primary", 0.01, calls)),
+            ("secondary", stub_provider("secondary", 0.01, calls)),
+        ]
+    )
+    fetcher.latency["primary"] = LatencyHistogram()
+    for _ in range(50):
+        fetcher.latency["primary"].record(0.02)
+
+    data = await fetcher.fetch_stock_data("AAPL")
+
+    assert data["source"] == "primary" and calls == ["primary"]
+    assert fetcher.hedge_stats["hedged"] == 0
+    assert fetcher.rate_limit_wait > 0.2
+    assert fetcher.latency["primary"].percentile(1.0) < 0.1
+
+
+@pytest.mark.asyncio
+async def test_local_rate_limit_timeout_skips_scoreboard_and_breaker(monkeypatch):
+    """우리 rate limiter 대기 시간 초과는 프로바이더 429나 서킷 실패로 기록하지 않아야 함"""
+    limiters = RateLimiterRegistry()
+    limiters.configure("local", 1, per=60, burst=1)
+    await limiters.acquire("local")
+    monkeypatch.setattr(fetcher_module, "rate_limiters", limiters)
+    monkeypatch.setattr(fetcher_module.settings, "RATE_LIMIT_MAX_WAIT", 0.05)
+
+    calls = []
+    fetcher = make_fetcher(
+        [
+            ("local", stub_provider("local", 0, calls)),
+            ("backup", stub_provider("backup", 0, calls)),
+        ]
+    )
+    data = await fetcher.fetch_stock_data("AAPL")
+
+    assert data["source"] == "backup" and calls == ["backup"]
+    assert "local" not in fetcher.get_provider_stats()["scores"]
+    assert fetcher._breaker("local").failure_count == 0
@@ -0,0 +1,109 @@
+"""
+주식 데이터 시뮬레이터 테스트
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from app.services import stock_simulator
+from app.services.data_normalizer import DataNormalizer
+from app.services.stock_simulator import StockDataSimulator
+
+
+@pytest.fixture
+def vectorized_simulator():
+    return StockDataSimulator(engine="vectorized")
+
+
+def test_vectorized_engine_api_compatible(vectorized_simulator):
+    """벡터화 엔진도 기존 조회 API와 같은 형식을 반환하는지 확인"""
+    data = vectorized_simulator.get_stock_data("AAPL")
+    assert data["symbol"] == "AAPL"
+    for field in ("price", "previous_close", "open", "high", "low", "volume"):
+        assert field in data
+
+    all_stocks = vectorized_simulator.get_all_stocks()
+    assert isinstance(all_stocks, dict)
+    assert set(all_stocks) == set(vectorized_simulator.stock_symbols)
+
+    assert vectorized_simulator.get_stock_data("UNKNOWN") is None
+    assert vectorized_simulator.get_stock_by_symbol("UNKNOWN") == {}
+
+
+def test_vectorized_step_keeps_high_low_consistent(vectorized_simulator):
+    """한 번의 벡터 스텝 후에도 저가 <= 현재가 <= 고가가 유지되는지 확인"""
+    engine = vectorized_simulator.tick_engine
+    volume_before = engine.volume[: len(engine)].copy()
+
+    for _ in range(50):
+        engine.step()
+
+    for symbol in vectorized_simulator.stock_symbols:
+        row = vectorized_simulator.stock_data[symbol]
+        assert row["low"] <= row["price"] <= row["high"]
+    assert (engine.volume[: len(engine)] > volume_before).all()
+    assert engine.tick_count == 50
+
+
+def test_vectorized_real_time_data_adds_unknown_symbol(vectorized_simulator):
+    """알 수 없는 종목은 엔진에 새 행으로 추가되는지 확인"""
+    data = vectorized_simulator.get_real_time_data("ZZZZ")
+    assert data["symbol"] == "ZZZZ"
+    assert "ZZZZ" in vectorized_simulator.stock_data
+
+    vectorized_simulator.tick_engine.step()
+    assert vectorized_simulator.get_stock_data("ZZZZ")["price"] > 0
+
+
+def test_vectorized_rows_match_python_mode_fields():
+    """벡터화 행은 python 모드 정규화 결과와 같은 필드와 반올림을 사용해야 함"""
+    python_simulator = StockDataSimulator(engine="python")
+    vectorized_simulator = StockDataSimulator(engine="vectorized")
+    python_simulator.advance()
+    vectorized_simulator.advance()
+
+    python_row = python_simulator.get_stock_data("AAPL")
+    vectorized_row = vectorized_simulator.get_stock_data("AAPL")
+    assert set(vectorized_row) == set(python_row)
+    assert vectorized_row["change_percent"] == round(
+        vectorized_row["change_percent"], 2
+    )
+    assert vectorized_row["data_quality"] > 0
+    assert vectorized_row["change"] == round(
+        vectorized_row["price"] - vectorized_row["previous_close"], 2
+    )
+
+
+@pytest.mark.parametrize("engine", ["python", "vectorized"])
+def test_ticks_feed_quality_and_anomaly_path(engine, monkeypatch):
+    """두 엔진 모드 모두 틱마다 이력과 품질 메트릭을 같은 방식으로 기록해야 함"""
+    normalizer = DataNormalizer()
+    monkeypatch.setattr(stock_simulator, "data_normalizer", normalizer)
+    simulator = StockDataSimulator(engine=engine)
+    for _ in range(3):
+        simulator.advance()
+
+    report = simulator.get_data_quality_report()
+    assert report["summary"]["total_symbols"] == len(simulator.stock_symbols)
+    assert set(report["per_symbol_metrics"]) == set(simulator.stock_symbols)
+    # 초기 데이터 1회 + 틱 3회
+    assert len(normalizer.price_history["AAPL"]) == 4
+    assert normalizer.price_history["AAPL"][-1] == simulator.stock_data["AAPL"]["price"]
+
+    status = simulator.create_market_status()
+    assert status["gainers"] + status["losers"] <= status["total_stocks"]
+
+
+def test_real_time_data_initializes_only_missing_symbol():
+    """초기화되지 않은 기본 종목 조회가 다른 종목 상태를 다시 만들지 않아야 함"""
+    simulator = StockDataSimulator(engine="python")
+    simulator.advance()
+    msft = simulator.stock_data["MSFT"]
+    del simulator.stock_data["AAPL"]
+
+    data = simulator.get_real_time_data("AAPL")
+
+    assert data["symbol"] == "AAPL"
+    assert data["price"] == simulator.stock_symbols["AAPL"]["base_price"]
+    assert simulator.stock_data["MSFT"] is msft
@@ -0,0 +1,211 @@
+"""
+종목 DB 일괄 동기화 파이프라인 / 다중 행 upsert 테스트 (로컬 PostgREST 스텁 서버 사용)
+"""
+
+import asyncio
+import os
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from supabase import create_client
+
+# Supabase 클라이언트는 모듈 import 시점에 생성되므로 형식만 맞는 설정값을 지정
+os.environ.setdefault("SUPABASE_URL", "http://127.0.0.1:54321")
+os.environ.setdefault(
+    "SUPABASE_ANON_KEY", "eyJhbGciOiJIUzI1NiJ9.eyJyb2xlIjoiYW5vbiJ9.x"
+)
+os.environ.setdefault(
+    "SUPABASE_SERVICE_KEY", "eyJhbGciOiJIUzI1NiJ9.eyJyb2xlIjoic2VydmljZSJ9.x"
+)
+
+from app.core.config import settings  # noqa: E402
+from app.core.rate_limiter import Priority, current_priority  # noqa: E402
+from app.services import stock_database_service as db_module  # noqa: E402
+
+
+class StubFetcher:
+    """동시 실행 수와 우선순위를 기록하는 가짜 StockDataFetcher"""
+
+    def __init__(self, bad=()):
+        self.bad = set(bad)
+        self.active = 0
+        self.max_active = 0
+        self.priorities = set()
+
+    async def fetch_stock_data(self, symbol):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        self.priorities.add(current_priority())
+        try:
+            await asyncio.sleep(0.001)
+            if symbol in self.bad:
+                raise RuntimeError("provider down")
+            if symbol == "ZERO":
+                return {"symbol": symbol, "name": "Zero Corp", "price": 0}
+            if symbol == "NONE":
+                return None
+            return {"symbol": symbol, "name": f"{symbol} Corp", "price": 10.0}
+        finally:
+            self.active -= 1
+
+
+class StubPostgrest:
+    """stocks 테이블 upsert 요청을 기록하고 symbol이 FAIL인 행이 있으면 거부"""
+
+    def __init__(self):
+        self.requests = []
+
+    async def upsert(self, request):
+        rows = await request.json()
+        self.requests.append(
+            {
+                "rows": rows,
+                "on_conflict": request.query.get("on_conflict"),
+                "prefer": request.headers.get("Prefer", ""),
+            }
+        )
+        if any(row["symbol"] == "FAIL" for row in rows):
+            return web.json_response(
+                {"code": "23514", "message": "check violation", "details": None},
+                status=400,
+            )
+        return web.Response(status=201)
+
+    @property
+    def rows(self):
+        return [row for request in self.requests for row in request["rows"]]
+
+
+@pytest_asyncio.fixture
+async def postgrest():
+    stub = StubPostgrest()
+    app = web.Application()
+    app.router.add_post("/rest/v1/stocks", stub.upsert)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    stub.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+    yield stub
+    await runner.cleanup()
+
+
+@pytest.fixture
+def service(postgrest, monkeypatch):
+    monkeypatch.setattr(settings, "SYNC_FETCH_CONCURRENCY", 4)
+    monkeypatch.setattr(settings, "SYNC_UPSERT_CHUNK_SIZE", 100)
+    service = db_module.StockDatabaseService()
+    service.supabase = create_client(postgrest.url, os.environ["SUPABASE_ANON_KEY"])
+    return service
+
+
+@pytest.mark.asyncio
+async def test_sync_fetches_concurrently_and_upserts_in_chunks(
+    service, postgrest, monkeypatch
+):
+    """조회는 설정한 동시 실행 수를 넘지 않고 저장은 청크 단위로 이루어져야 함"""
+    fetcher = StubFetcher()
+    monkeypatch.setattr(db_module, "stock_fetcher", fetcher)
+    symbols = [f"S{i:03d}" for i in range(250)]
+    reports = []
+
+    result = await service.sync_from_external_api(symbols, progress=reports.append)
+
+    assert fetcher.max_active == 4
+    assert fetcher.priorities == {Priority.BULK}
+    assert [len(request["rows"]) for request in postgrest.requests] == [100, 100, 50]
+    assert result["updated_in_db"] == 250
+    assert result["fetched_from_api"] == 250
+    assert result["chunks"] == 3
+    assert result["failed_symbols"] == []
+    assert [report["processed"] for report in reports] == [100, 200, 250]
+    assert reports[-1]["upserted"] == 250
+
+
+@pytest.mark.asyncio
+async def test_sync_reports_failed_and_invalid_symbols(service, postgrest, monkeypatch):
+    """조회 실패/빈 응답/잘못된 가격은 저장하지 않고 실패 종목으로 보고해야 함"""
+    monkeypatch.setattr(db_module, "stock_fetcher", StubFetcher(bad={"ERR"}))
+    reports = []
+
+    async def on_progress(report):
+        reports.append(report)
+
+    result = await service.sync_from_external_api(
+        ["AAPL", "ERR", "ZERO", "NONE", "MSFT", "AAPL"], progress=on_progress
+    )
+
+    saved = postgrest.rows
+    assert sorted(row["symbol"] for row in saved) == ["AAPL", "MSFT"]
+    assert next(row for row in saved if row["symbol"] == "AAPL")["name_kr"] == "애플"
+    assert result["total_requested"] == 5
+    assert result["fetched_from_api"] == 3
+    assert result["failed_symbols"] == ["ERR", "ZERO", "NONE"]
+    assert reports[-1]["failed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_sends_chunks_on_symbol_conflict(service, postgrest):
+    """행들을 청크당 요청 한 번으로 보내고 symbol 충돌 시 병합해야 함"""
+    stocks = [{"symbol": f"s{i}", "name": f"S{i}", "price": i + 1} for i in range(5)]
+    stocks.append({"symbol": "S0", "name": "S0 (중복)", "price": 99})
+
+    result = await service.bulk_upsert_stock_rows(stocks, chunk_size=2)
+
+    assert [len(request["rows"]) for request in postgrest.requests] == [2, 2, 1]
+    assert all(request["on_conflict"] == "symbol" for request in postgrest.requests)
+    assert all(
+        "resolution=merge-duplicates" in request["prefer"]
+        and "return=minimal" in request["prefer"]
+        for request in postgrest.requests
+    )
+    assert next(row for row in postgrest.rows if row["symbol"] == "S0")["price"] == 99
+    assert result["upserted"] == 5
+    assert result["chunks"] == 3
+    assert result["failed_chunks"] == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_reports_failed_chunk_and_continues(service, postgrest):
+    """실패한 청크는 보고하고 나머지 청크와 잘못된 행 이외의 데이터는 저장해야 함"""
+    stocks = [
+        {"symbol": "AAA", "name": "A", "price": 1},
+        {"symbol": "FAIL", "name": "F", "price": 1},
+        {"symbol": "BBB", "name": "B", "price": 1},
+        {"symbol": "CCC", "name": "C", "price": 1, "sector": "Tech"},
+        {"symbol": "BAD", "name": "Bad"},
+    ]
+
+    result = await service.bulk_upsert_stock_rows(stocks, chunk_size=2)
+
+    # 컬럼 구성이 다른 행(sector)은 별도 요청으로 전송
+    assert [sorted(r["symbol"] for r in req["rows"]) for req in postgrest.requests] == [
+        ["AAA", "FAIL"],
+        ["BBB"],
+        ["CCC"],
+    ]
+    assert result["upserted"] == 2
+    assert result["invalid_symbols"] == ["BAD"]
+    assert [failure["symbols"] for failure in result["failed_chunks"]] == [
+        ["AAA", "FAIL"]
+    ]
+    assert "check violation" in result["failed_chunks"][0]["error"]
+
+
+@pytest.mark.asyncio
+async def test_initialize_sample_data_uses_one_request(service, postgrest):
+    """샘플 데이터 초기화는 주요 종목 전체를 요청 한 번으로 저장해야 함"""
+    assert await service.initialize_sample_data() is True
+
+    assert len(postgrest.requests) == 1
+    assert len(postgrest.rows) == len(db_module.MAJOR_STOCKS)
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_stocks_returns_saved_count(service, postgrest):
+    """기존 호출자를 위해 bulk_upsert_stocks는 저장된 종목 수를 반환해야 함"""
+    stocks = [{"symbol": f"s{i}", "name": f"S{i}", "price": i + 1} for i in range(3)]
+    stocks.append({"symbol": "FAIL", "name": "F", "price": 1})
+
+    assert await service.bulk_upsert_stocks(stocks, chunk_size=3) == 3
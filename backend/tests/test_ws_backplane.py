@@ -0,0 +1,102 @@
+"""
+WebSocket 백플레인 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.ws_backplane import (
+    InProcessBackplane,
+    UnixSocketBackplane,
+    create_backplane,
+)
+
+
+async def wait_until(condition, timeout=2.0):
+    """조건이 참이 될 때까지 이벤트 루프를 양보"""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("조건이 시간 내에 충족되지 않음")
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_inprocess_backplane_delivers_locally():
+    """단일 프로세스 백플레인은 항상 리더이며 로컬 핸들러에 바로 전달해야 함"""
+    backplane = InProcessBackplane()
+    received = []
+
+    async def handler(message):
+        received.append(message)
+
+    backplane.subscribe("tick", handler)
+    await backplane.start()
+    await backplane.publish("tick", {"sequence": 1})
+
+    assert backplane.is_leader
+    assert received == [{"sequence": 1}]
+
+
+@pytest.mark.asyncio
+async def test_unix_backplane_relays_between_workers(tmp_path):
+    """Unix 소켓 백플레인은 한 워커의 메시지를 다른 워커에 전달해야 함"""
+    path = str(tmp_path / "ws.sock")
+    leader = UnixSocketBackplane(path, worker_id="w1", reconnect_interval=0.05)
+    follower = UnixSocketBackplane(path, worker_id="w2", reconnect_interval=0.05)
+    received = {"w1": [], "w2": []}
+
+    for backplane in (leader, follower):
+
+        async def handler(message, name=backplane.worker_id):
+            received[name].append(message)
+
+        backplane.subscribe("tick", handler)
+
+    try:
+        await leader.start()
+        await follower.start()
+        assert leader.is_leader and not follower.is_leader
+
+        await leader.publish("tick", {"sequence": 1, "quotes": {"AAPL": {"p": 1}}})
+        await follower.publish("tick", {"sequence": 2})
+        await wait_until(lambda: len(received["w2"]) == 2 and len(received["w1"]) == 2)
+
+        # 발행자 자신도 정확히 한 번만 받음
+        for name in ("w1", "w2"):
+            assert sorted(m["sequence"] for m in received[name]) == [1, 2]
+    finally:
+        await follower.stop()
+        await leader.stop()
+
+
+@pytest.mark.asyncio
+async def test_follower_takes_over_when_leader_stops(tmp_path):
+    """리더가 종료되면 팔로워가 브로커와 리더 역할을 이어받아야 함"""
+    path = str(tmp_path / "ws.sock")
+    leader = UnixSocketBackplane(path, worker_id="w1", reconnect_interval=0.05)
+    follower = UnixSocketBackplane(path, worker_id="w2", reconnect_interval=0.05)
+    roles = []
+
+    async def on_role(is_leader):
+        roles.append(is_leader)
+
+    follower.on_role_change(on_role)
+
+    try:
+        await leader.start()
+        await follower.start()
+        await leader.stop()
+
+        await wait_until(lambda: follower.is_leader)
+        assert roles == [True]
+    finally:
+        await follower.stop()
+
+
+def test_unknown_backplane_is_rejected():
+    with pytest.raises(ValueError):
+        create_backplane("redis")
+    with pytest.raises(ValueError):
+        create_backplane("unix")
@@ -0,0 +1,45 @@
+"""
+WebSocket 전송 인코딩 테스트
+"""
+
+from datetime import datetime
+
+import pytest
+
+msgpack = pytest.importorskip("msgpack")
+
+from app.core import ws_codec
+
+
+def test_negotiate_encoding_defaults_to_json():
+    """알 수 없는 인코딩 요청은 JSON으로 처리되어야 함"""
+    assert ws_codec.negotiate_encoding(None) == ws_codec.JSON
+    assert ws_codec.negotiate_encoding("xml") == ws_codec.JSON
+    assert ws_codec.negotiate_encoding("MsgPack") == ws_codec.MSGPACK
+
+
+def test_pack_uses_numeric_timestamps():
+    """MessagePack에서는 ISO 타임스탬프가 epoch 밀리초 정수가 되어야 함"""
+    iso = "2024-01-02T03:04:05.678000"
+    message = {
+        "symbol": "AAPL",
+        "data": {"price": 1.5, "timestamp": iso, "name": "Apple"},
+        "timestamp": iso,
+    }
+
+    decoded = msgpack.unpackb(ws_codec.pack(message))
+
+    expected = int(datetime.fromisoformat(iso).timestamp() * 1000)
+    assert decoded["timestamp"] == expected
+    assert decoded["data"] == {"price": 1.5, "timestamp": expected, "name": "Apple"}
+    assert len(ws_codec.pack(message)) < len(str(message))
+
+
+def test_pack_batch_matches_packing_whole_message():
+    """조각을 이어 붙인 배치는 전체를 한 번에 인코딩한 것과 같아야 함"""
+    updates = [{"symbol": "AAPL", "price": 1.0}, {"symbol": "MSFT", "price": 2.0}]
+    header = {"sequence": 3, "timestamp": "2024-01-02T03:04:05"}
+
+    batch = ws_codec.pack_batch(header, [ws_codec.pack(u) for u in updates])
+
+    assert batch == ws_codec.pack({**header, "updates": updates})
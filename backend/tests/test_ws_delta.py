@@ -0,0 +1,64 @@
+"""
+델타 인코딩 스트림 테스트
+"""
+
+from app.core.ws_delta import DeltaStream, apply_message
+
+
+def quote(price, volume=1000, **extra):
+    return {
+        "symbol": "AAPL",
+        "name": "Apple",
+        "price": price,
+        "volume": volume,
+        **extra,
+    }
+
+
+def test_delta_contains_only_changed_fields():
+    """스냅샷 이후에는 변경된 필드만 시퀀스 번호와 함께 전송되어야 함"""
+    stream = DeltaStream("AAPL", snapshot_interval=100)
+
+    first = stream.advance(quote(100.0))
+    second = stream.advance(quote(101.0))
+    third = stream.advance(quote(101.0, volume=1500))
+
+    assert first["type"] == "snapshot" and first["seq"] == 1
+    assert second == {
+        "type": "delta",
+        "symbol": "AAPL",
+        "seq": 2,
+        "changes": {"price": 101.0},
+    }
+    assert third["changes"] == {"volume": 1500}
+
+
+def test_periodic_snapshot_and_client_reconstruction():
+    """주기적으로 스냅샷이 오고, 메시지를 적용한 결과는 원본과 같아야 함"""
+    stream = DeltaStream("AAPL", snapshot_interval=4)
+    state = None
+
+    for tick in range(1, 13):
+        data = quote(100.0 + tick % 3, anomalies=["spike"] if tick == 5 else None)
+        if tick == 6:
+            del data["anomalies"]
+        message = stream.advance(data)
+
+        assert message["seq"] == tick
+        assert message["type"] == ("snapshot" if tick in (1, 4, 8, 12) else "delta")
+        state = apply_message(state, message)
+        assert state == data
+
+
+def test_late_subscriber_snapshot_matches_shared_stream():
+    """중간 구독자의 스냅샷 이후 공유 델타만으로 상태가 맞아야 함"""
+    stream = DeltaStream("AAPL", snapshot_interval=100)
+    stream.advance(quote(100.0))
+    stream.advance(quote(102.0))
+
+    state = apply_message(None, stream.snapshot())
+    assert stream.snapshot()["seq"] == 2
+
+    message = stream.advance(quote(99.0))
+    assert message["seq"] == 3
+    assert apply_message(state, message) == quote(99.0)
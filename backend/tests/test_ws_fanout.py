@@ -0,0 +1,323 @@
+"""
+Socket.IO 팬아웃 테스트
+"""
+
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+import socketio
+
+from app.core.ws_delta import DeltaStream, apply_message
+from app.core.ws_fanout import (
+    BroadcastManager,
+    ConnectionQueue,
+    SessionBatch,
+    symbol_room,
+)
+
+_managers = []
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def close_managers():
+    """테스트가 끝나면 매니저의 writer 태스크를 정리"""
+    yield
+    while _managers:
+        await _managers.pop().close()
+
+
+def make_server(n_clients, **manager_options):
+    """전송 내용을 기록하는 가짜 Engine.IO가 연결된 서버"""
+    manager = BroadcastManager(**manager_options)
+    _managers.append(manager)
+    sio = socketio.AsyncServer(client_manager=manager, async_mode="asgi")
+    sent = []
+
+    async def fake_send(eio_sid, data):
+        sent.append((eio_sid, data))
+
+    sio.eio.send = fake_send
+    sids = [manager.connect(f"eio-{i}", "/") for i in range(n_clients)]
+    return sio, manager, sids, sent
+
+
+async def settle():
+    """writer 태스크가 대기열을 비울 수 있도록 이벤트 루프를 몇 번 양보"""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_room_emit_encodes_once_and_reaches_all_members():
+    """방 전송은 한 번만 인코딩되고 방의 모든 구독자에게 같은 프레임이 가야 함"""
+    sio, manager, sids, sent = make_server(5)
+    for sid in sids[:4]:
+        sio.enter_room(sid, symbol_room("AAPL"))
+
+    await sio.emit(
+        "stock_data", {"symbol": "AAPL", "price": 1.5}, room=symbol_room("AAPL")
+    )
+    await settle()
+
+    assert manager.stats["frames_encoded"] == 1
+    assert manager.stats["deliveries"] == 4
+    assert sorted(eio_sid for eio_sid, _ in sent) == [f"eio-{i}" for i in range(4)]
+    assert len({data for _, data in sent}) == 1
+    assert sent[0][1] == '2["stock_data",{"symbol":"AAPL","price":1.5}]'
+
+
+@pytest.mark.asyncio
+async def test_slow_or_failing_member_does_not_block_others():
+    """느리거나 실패하는 구독자가 나머지 전송을 막지 않아야 함"""
+    sio, manager, sids, sent = make_server(3)
+    for sid in sids:
+        sio.enter_room(sid, symbol_room("MSFT"))
+    stalled = asyncio.Event()
+
+    async def flaky_send(eio_sid, data):
+        if eio_sid == "eio-1":
+            await stalled.wait()
+        if eio_sid == "eio-2":
+            raise ConnectionError("closed")
+        sent.append((eio_sid, data))
+
+    sio.eio.send = flaky_send
+    for price in range(3):
+        await sio.emit("stock_data", {"p": price}, room=symbol_room("MSFT"))
+    await settle()
+
+    assert [eio_sid for eio_sid, _ in sent] == ["eio-0"] * 3
+    assert manager.stats["send_errors"] == 3
+    assert manager.get_queue_stats()["backlogged"] == {"eio-1": 2}
+
+    stalled.set()
+    await settle()
+    assert len(sent) == 6
+
+
+def test_queue_drop_oldest_policy():
+    """drop_oldest 정책은 가장 오래된 프레임을 버려야 함"""
+    queue = ConnectionQueue("eio-0", maxsize=2, policy="drop_oldest")
+    for frame in ("a", "b", "c"):
+        assert queue.put(frame, key=("stock_data", "stock:AAPL"))
+
+    assert len(queue) == 2
+    assert queue.dropped == 1
+    assert [queue._pop(), queue._pop()] == ["b", "c"]
+
+
+def test_queue_conflate_policy_keeps_latest_per_stream():
+    """conflate 정책은 같은 스트림의 대기 프레임을 최신 값으로 교체해야 함"""
+    queue = ConnectionQueue("eio-0", maxsize=3, policy="conflate")
+    queue.put("aapl-1", key="AAPL")
+    queue.put("msft-1", key="MSFT")
+    queue.put("aapl-2", key="AAPL")
+    queue.put("subscribed")
+    queue.put("aapl-3", key="AAPL")
+
+    assert queue.conflated == 2
+    assert queue.dropped == 0
+    assert [queue._pop() for _ in range(len(queue))] == [
+        "aapl-3",
+        "msft-1",
+        "subscribed",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_queue_disconnect_policy_drops_laggard():
+    """disconnect 정책은 대기열이 넘친 연결만 끊어야 함"""
+    sio, manager, sids, sent = make_server(
+        2, queue_size=2, overflow_policy="disconnect"
+    )
+    for sid in sids:
+        sio.enter_room(sid, symbol_room("AAPL"))
+    stalled = asyncio.Event()
+    disconnected = []
+
+    async def send(eio_sid, data):
+        if eio_sid == "eio-1":
+            await stalled.wait()
+        sent.append((eio_sid, data))
+
+    async def disconnect(eio_sid):
+        disconnected.append(eio_sid)
+
+    sio.eio.send = send
+    sio.eio.disconnect = disconnect
+    for price in range(4):
+        await sio.emit("stock_data", {"p": price}, room=symbol_room("AAPL"))
+        await settle()
+
+    assert disconnected == ["eio-1"]
+    assert manager.stats["overflow_disconnects"] == 1
+    assert [eio_sid for eio_sid, _ in sent] == ["eio-0"] * 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("policy", ["drop_oldest", "conflate"])
+async def test_overflowing_delta_subscriber_keeps_correct_state(policy):
+    """대기열이 넘쳐도 델타 구독자의 최종 상태는 스트림 상태와 같아야 함"""
+    sio, manager, sids, sent = make_server(1, queue_size=2, overflow_policy=policy)
+    sio.enter_room(sids[0], symbol_room("AAPL", "delta"))
+    sio.enter_room(sids[0], symbol_room("MSFT"))
+    stream = DeltaStream("AAPL", snapshot_interval=1000)
+    stalled = asyncio.Event()
+
+    async def send(eio_sid, data):
+        await stalled.wait()
+        sent.append((eio_sid, data))
+
+    sio.eio.send = send
+    state = None
+    for tick in range(20):
+        message = stream.advance({"price": 100 + tick % 3, f"field{tick % 4}": tick})
+        if tick == 0:
+            state = message["data"]
+            continue
+        manager.emit_delta(
+            "stock_delta",
+            message,
+            symbol_room("AAPL", "delta"),
+            stream.snapshot,
+        )
+        await sio.emit("stock_data", {"p": tick}, room=symbol_room("MSFT"))
+        await settle()
+
+    stalled.set()
+    await settle()
+
+    events = [json.loads(data[1:]) for _, data in sent]
+    for event, message in events:
+        if event == "stock_delta":
+            state = apply_message(state, message)
+    assert state == stream.state
+    assert manager.stats["conflated"] > 0
+
+
+def test_unknown_overflow_policy_is_rejected():
+    with pytest.raises(ValueError):
+        BroadcastManager(overflow_policy="block")
+
+
+@pytest.mark.asyncio
+async def test_batch_frame_is_valid_socketio_event():
+    """배치 프레임은 조각을 이어 붙인 올바른 stock_batch 이벤트여야 함"""
+    sio, manager, sids, sent = make_server(1)
+    batch = SessionBatch(sids[0], "eio-0")
+    for symbol, price in (("AAPL", 1.0), ("MSFT", 2.0)):
+        batch.offer(symbol, manager.encode_fragment({"symbol": symbol, "p": price}))
+
+    manager.schedule_batch(batch, "stock_batch", {"sequence": 7})
+    await asyncio.sleep(0)
+
+    assert len(sent) == 1
+    assert sent[0][1].startswith("2")
+    event, body = json.loads(sent[0][1][1:])
+    assert event == "stock_batch"
+    assert body == {
+        "sequence": 7,
+        "updates": [{"symbol": "AAPL", "p": 1.0}, {"symbol": "MSFT", "p": 2.0}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_slow_batch_consumer_only_gets_latest_values():
+    """느린 클라이언트는 대기열 없이 종목당 최신 값만 받아야 함"""
+    sio, manager, sids, sent = make_server(1)
+    release = asyncio.Event()
+
+    async def slow_send(eio_sid, data):
+        await release.wait()
+        sent.append((eio_sid, data))
+
+    sio.eio.send = slow_send
+    batch = SessionBatch(sids[0], "eio-0")
+
+    for tick in range(5):
+        batch.offer("AAPL", manager.encode_fragment({"tick": tick}))
+        manager.schedule_batch(batch, "stock_batch", {"sequence": tick})
+        await asyncio.sleep(0)
+
+    release.set()
+    await settle()
+
+    # 첫 프레임(틱 0) 전송 중 들어온 틱 1~3은 틱 4로 대체됨
+    assert [json.loads(data[1:])[1] for _, data in sent] == [
+        {"sequence": 0, "updates": [{"tick": 0}]},
+        {"sequence": 4, "updates": [{"tick": 4}]},
+    ]
+    assert batch.conflated == 3
+
+
+@pytest.mark.asyncio
+async def test_msgpack_batch_frame_is_binary_event():
+    """MessagePack 배치 프레임은 바이너리 첨부를 가진 이벤트로 전송되어야 함"""
+    msgpack = pytest.importorskip("msgpack")
+    sio, manager, sids, sent = make_server(1)
+    batch = SessionBatch(sids[0], "eio-0", encoding="msgpack")
+    batch.offer("AAPL", manager.encode_fragment({"symbol": "AAPL"}, "msgpack"))
+
+    manager.schedule_batch(batch, "stock_batch", {"sequence": 1})
+    await asyncio.sleep(0)
+
+    header, attachment = [data for _, data in sent]
+    assert header.startswith('51-["stock_batch",{"_placeholder":true')
+    assert msgpack.unpackb(attachment) == {
+        "sequence": 1,
+        "updates": [{"symbol": "AAPL"}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_batch_frames_share_bounded_connection_queue():
+    """배치 프레임은 연결의 송신 대기열을 거치고 세션당 항목 하나만 차지해야 함"""
+    sio, manager, sids, sent = make_server(
+        1, queue_size=2, overflow_policy="disconnect"
+    )
+    sio.enter_room(sids[0], symbol_room("AAPL"))
+    release = asyncio.Event()
+    disconnected = []
+
+    async def slow_send(eio_sid, data):
+        await release.wait()
+        sent.append((eio_sid, data))
+
+    async def disconnect(eio_sid):
+        disconnected.append(eio_sid)
+
+    sio.eio.send = slow_send
+    sio.eio.disconnect = disconnect
+    batch = SessionBatch(sids[0], "eio-0")
+
+    await sio.emit("stock_data", {"p": 0}, room=symbol_room("AAPL"))
+    await settle()
+    for tick in range(10):
+        batch.offer("AAPL", manager.encode_fragment({"tick": tick}))
+        manager.schedule_batch(batch, "stock_batch", {"sequence": tick})
+        await settle()
+
+    assert len(manager.queues["eio-0"]) == 1
+    assert disconnected == []
+
+    await sio.emit("stock_data", {"p": 1}, room=symbol_room("AAPL"))
+    await sio.emit("stock_data", {"p": 2}, room=symbol_room("AAPL"))
+    assert disconnected == [] and manager.stats["overflow_disconnects"] == 1
+    await settle()
+    assert disconnected == ["eio-0"]
+
+
+@pytest.mark.asyncio
+async def test_disconnect_waits_for_writer_task():
+    """연결 해제 시 writer 태스크는 취소되고 종료까지 기다려야 함"""
+    sio, manager, sids, sent = make_server(1)
+    sio.enter_room(sids[0], symbol_room("AAPL"))
+    await sio.emit("stock_data", {"p": 0}, room=symbol_room("AAPL"))
+    await settle()
+    writer = manager.queues["eio-0"].task
+
+    await manager.disconnect(sids[0], "/")
+
+    assert writer.done() and "eio-0" not in manager.queues